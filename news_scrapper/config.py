@@ -32,6 +32,19 @@ RESULTS_DIR = os.path.join(PROJECT_ROOT_DIR, "scraped_results") # Ensure 'scrape
 # Max number of full result items to keep in the pipeline's in-memory list
 MAX_RESULTS_TO_STORE_IN_MEMORY = 1000
 
+# Write result JSON files indented for reading (larger and slower to serialize) instead of compact
+PRETTY_PRINT_RESULTS = False
+
+# Track seen pipeline items in a bloom filter (needs pybloom_live): ~2 bytes per item instead of ~77, but about
+# 0.1% of genuinely new items are then skipped as already seen. Off by default, as losing articles costs more.
+USE_BLOOM_SEEN_STORE = False
+
+# "json" writes one file per article; "jsonl" appends one line per article to rolling results-*.jsonl batch files
+RESULTS_FORMAT = "json"
+# A jsonl batch file is rolled over once it holds this many bytes or items
+RESULTS_BATCH_MAX_BYTES = 64 << 20
+RESULTS_BATCH_MAX_ITEMS = 50_000
+
 # Database connection string (example, if using a database)
 # DATABASE_URI = "sqlite:///" + os.path.join(PROJECT_ROOT_DIR, "data", "news_data.db")
 
@@ -170,13 +170,15 @@ class Fetcher:
             time.sleep(wait_time) # Apply delay directly here
         return True
 
-    def fetch_url(self, url):
+    def fetch_url(self, url, as_bytes=False):
         """
         Fetches the content of a given URL, respecting robots.txt and crawl delays.
         Args:
             url (str): The URL to fetch.
+            as_bytes (bool): Return the undecoded body, for XML whose parser reads the
+                             encoding declaration itself (skips requests' charset detection).
         Returns:
-            str: The content of the URL as text, or None if fetching fails or is disallowed.
+            str | bytes: The content of the URL (bytes if as_bytes), or None if fetching fails or is disallowed.
         """
         try:
             parsed_url = urlparse(url)
@@ -206,7 +208,7 @@ class Fetcher:
             response.raise_for_status()
 
             self.last_request_time[domain] = time.time() # Update last request time
-            return response.text
+            return response.content if as_bytes else response.text
         except requests.exceptions.HTTPError as e:
             self._log_event("ERROR", f"HTTP error fetching {url}: {e.response.status_code} {e.response.reason}", {"url": url})
             if self.monitor: # Signal potential rate limiting to monitor
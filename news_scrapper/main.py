@@ -354,6 +354,8 @@ async def main(): # Changed to async def
     except KeyboardInterrupt:
         monitor.log_event("INFO", "Keyboard interrupt received. Shutting down.")
     finally:
+        if planner.parser: await planner.parser.aclose()
+        pipeline.close()
         monitor.log_event("INFO", "Main process finished.")
         print(f"\n{'='*30}SUMMARY{'='*30}")
         print(f"Total run cycles: {run_cycle_count}")
@@ -10,6 +10,17 @@ import json
 from datetime import timezone, timedelta
 from urllib.parse import urlparse
 
+try:
+    import orjson # type: ignore[reportMissingImports]
+except ImportError:
+    orjson = None # type: ignore
+
+
+def _json_dumps(obj):
+    """Serializes log details, through orjson when it is installed."""
+    return orjson.dumps(obj).decode('utf-8') if orjson is not None else json.dumps(obj)
+
+
 class Monitor:
     """
     Handles logging, failure reporting, detection of potential issues,
@@ -42,7 +53,7 @@ class Monitor:
             details_str = ""
             if log_entry['details']:
                 try:
-                    details_str = json.dumps(log_entry['details'])
+                    details_str = _json_dumps(log_entry['details'])
                 except TypeError:
                     details_str = str(log_entry['details'])
 
@@ -73,7 +84,7 @@ class Monitor:
             details_json_str = ""
             if log_entry['details']:
                 try:
-                    details_json_str = json.dumps(log_entry['details']) # Ensure details are serializable for consistency
+                    details_json_str = _json_dumps(log_entry['details']) # Ensure details are serializable for consistency
                 except TypeError: # Fallback if details contain non-serializable items
                     details_json_str = str(log_entry['details'])
 
@@ -4,120 +4,841 @@ The Parser is responsible for transforming raw HTML/JSON into clean, structured
 It uses multiple strategies: custom CSS selectors, Schema.org (via extruct),
 general AI (crawl4ai), and can trigger LLM-based selector generation.
 """
+import asyncio
+import contextvars
+import copy
+import functools
+import hashlib
+import heapq
+import io
 import json
+import os
 import re
+import sys
 from datetime import datetime, timezone, timedelta
+import threading
+import weakref
 import time
-from urllib.parse import urljoin, urlparse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from operator import itemgetter
+from pathlib import Path
+from urllib.parse import quote, unquote, urljoin, urlparse, urlsplit, urlunparse
 from urllib.robotparser import RobotFileParser
 import httpx
 
 try:
     from crawl4ai import AsyncWebCrawler, Url, CrawlerRunConfig
-    from crawl4ai.filters import URLPatternFilter, ContentTypeFilter
-    from crawl4ai.scorers import KeywordRelevanceScorer, PathDepthScorer, CompositeScorer
     from crawl4ai.extraction import JsonCssExtractionStrategy # Added
     from crawl4ai.llm import LLMConfig # Added
 except ImportError:
     AsyncWebCrawler = None # type: ignore
     Url = None # type: ignore
     CrawlerRunConfig = None # type: ignore
-    URLPatternFilter = None # type: ignore
-    ContentTypeFilter = None # type: ignore
-    KeywordRelevanceScorer = None # type: ignore
-    PathDepthScorer = None # type: ignore
-    CompositeScorer = None # type: ignore
     JsonCssExtractionStrategy = None # type: ignore # Added
     LLMConfig = None # type: ignore # Added
-    print("WARNING: Parser: crawl4ai components (AsyncWebCrawler, Url, CrawlerRunConfig, Filters, Scorers, ExtractionStrategies, LLMConfig) not found, using placeholders. Functionality will be affected.")
+    print("WARNING: Parser: crawl4ai components (AsyncWebCrawler, Url, CrawlerRunConfig, ExtractionStrategies, LLMConfig) not found, using placeholders. Functionality will be affected.")
 
 # JsonCssExtractionStrategy is not used directly (handled by commenting out its import block) # This comment might be outdated now
 
+try:
+    import xxhash # type: ignore[reportMissingImports]
+except ImportError:
+    xxhash = None # type: ignore
+
+try:
+    import orjson # type: ignore[reportMissingImports]
+except ImportError:
+    orjson = None # type: ignore
+
+try:
+    import ciso8601 # type: ignore[reportMissingImports]
+except ImportError:
+    ciso8601 = None # type: ignore
+
+try:
+    import re2 as _fast_re # type: ignore[reportMissingImports] # Linear-time engine for the bulk robots.txt scans
+except ImportError:
+    _fast_re = re # type: ignore
+
+try:
+    import h2 # type: ignore[reportMissingImports] # Enables HTTP/2 on the shared httpx client
+except ImportError:
+    h2 = None # type: ignore
+
+try:
+    from selectolax.lexbor import LexborHTMLParser # type: ignore[reportMissingImports]
+except ImportError:
+    LexborHTMLParser = None # type: ignore
+
 import feedparser # type: ignore[reportMissingImports]
 import extruct
 from bs4 import BeautifulSoup, Tag
+import soupsieve
 from dateutil import parser as dateutil_parser
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from cssselect import SelectorError # type: ignore[reportMissingImports]
 
 # try:
 #     from ..analyzer.structure_analyzer import StructureAnalyzer # Removed
 # except ImportError:
 #     StructureAnalyzer = None # Removed
 
-from typing import Any, Dict, List, Optional, Union, Set # RobotFileParser is already imported
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union, Set # RobotFileParser is already imported
+
+# Fast paths for the date formats that dominate feeds and sitemaps; anything else goes to dateutil.
+_ISO_DATE_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,6})\d*)?)?)?\s*(Z|[+-]\d{2}:?\d{2})?$')
+_RFC_1123_DATE_RE = re.compile(r'^(?:[A-Za-z]{3},\s*)?(\d{1,2})\s+([A-Za-z]{3})\s+(\d{4})\s+(\d{2}):(\d{2})(?::(\d{2}))?\s*'
+                               r'(GMT|UTC|UT|Z|[ECMP][SD]T|[+-]\d{4})$')
+_MONTHS = {name: index for index, name in enumerate(('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), 1)}
+# North American zone names RFC 822 allows in RSS pubDate values, as UTC offsets in hours.
+_RFC_822_ZONE_HOURS = {'EST': -5, 'EDT': -4, 'CST': -6, 'CDT': -5, 'MST': -7, 'MDT': -6, 'PST': -8, 'PDT': -7}
+_RFC_822_ZONES = {name: timezone(timedelta(hours=hours)) for name, hours in _RFC_822_ZONE_HOURS.items()}
+# The same zones for dateutil, which otherwise drops them (with an UnknownTimezoneWarning) and reads the time as UTC.
+_RFC_822_TZINFOS = {name: hours * 3600 for name, hours in _RFC_822_ZONE_HOURS.items()}
+
+
+def _parse_tz_offset(offset: Optional[str]) -> timezone:
+    """'Z', 'GMT', 'EST', '+02:00', '-0530' or None (naive, treated as UTC) -> timezone."""
+    if not offset: return timezone.utc
+    if offset[0] not in '+-': return _RFC_822_ZONES.get(offset, timezone.utc)
+    digits = offset[1:].replace(':', '')
+    delta = timedelta(hours=int(digits[:2]), minutes=int(digits[2:]))
+    return timezone(-delta if offset[0] == '-' else delta)
+
+
+# C ISO-8601 parser: ciso8601 when installed, else the stdlib one (which accepts 'Z' and compact offsets from 3.11).
+_parse_iso_datetime = ciso8601.parse_datetime if ciso8601 is not None else datetime.fromisoformat
+
+
+def _parse_date_fast(date_str: str) -> Optional[datetime]:
+    """Parses ISO-8601 and RFC-1123 dates without dateutil; returns None when dateutil is needed."""
+    if date_str[:4].isdigit():
+        try:
+            dt = _parse_iso_datetime(date_str)
+            return dt.astimezone(timezone.utc) if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+        except ValueError: pass # Near-ISO spellings the regex below still accepts
+    try:
+        match = _ISO_DATE_RE.match(date_str)
+        if match:
+            year, month, day, hour, minute, second, fraction, offset = match.groups()
+            return datetime(int(year), int(month), int(day), int(hour or 0), int(minute or 0), int(second or 0),
+                            int(fraction.ljust(6, '0')) if fraction else 0, tzinfo=_parse_tz_offset(offset)).astimezone(timezone.utc)
+        match = _RFC_1123_DATE_RE.match(date_str)
+        if match:
+            day, month_name, year, hour, minute, second, offset = match.groups()
+            month = _MONTHS.get(month_name.lower())
+            if month is None: return None
+            return datetime(int(year), month, int(day), int(hour), int(minute), int(second or 0),
+                            tzinfo=_parse_tz_offset(offset)).astimezone(timezone.utc)
+    except ValueError: # Out-of-range fields; let dateutil have a go
+        return None
+    return None
+
+
+# One dateutil parser for the process; dateutil.parser.parse(..., parserinfo=...) would rebuild its lookup tables per call.
+_DATEUTIL_PARSER = dateutil_parser.parser(dateutil_parser.parserinfo())
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_str(date_str: str) -> Optional[datetime]:
+    """
+    String branch of Parser._parse_generic_date_to_utc. Memoized because feeds and
+    sitemaps repeat the same lastmod/published values across many entries. Callers pass
+    stripped text, so padded and bare spellings of a date share one cache entry.
+    """
+    fast_dt = _parse_date_fast(date_str)
+    if fast_dt is not None: return fast_dt
+    try:
+        dt = _DATEUTIL_PARSER.parse(date_str, tzinfos=_RFC_822_TZINFOS)
+        return dt.astimezone(timezone.utc) if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+    except (ValueError, TypeError, OverflowError): # Logged where this is called if context needed
+        return None
+
+
+def _date_to_utc(date_input: Any) -> Optional[datetime]:
+    """Body of Parser._parse_generic_date_to_utc, kept free of `self` so per-entry loops can call it directly."""
+    if isinstance(date_input, str): return _parse_date_str(date_input.strip()) # strip() returns the same object when there is nothing to trim
+    if date_input is None: return None
+    if isinstance(date_input, datetime):
+        return date_input.astimezone(timezone.utc) if date_input.tzinfo else date_input.replace(tzinfo=timezone.utc)
+    if isinstance(date_input, time.struct_time): return _struct_time_to_utc(date_input[:6]) # Slicing already yields a plain, hashable tuple
+    return None
+
+
+def _stripped_str(value: Any) -> str:
+    """str(value).strip() without the str() copy when value already is a string."""
+    return (value if isinstance(value, str) else str(value)).strip()
+
+
+@functools.lru_cache(maxsize=4096)
+def _struct_time_to_utc(fields: Tuple[int, ...]) -> Optional[datetime]:
+    """struct_time branch of _date_to_utc, memoized on its first six fields like the string branch."""
+    # feedparser's *_parsed values are already UTC, so build the datetime directly rather than via mktime (local time).
+    try: return datetime(*fields[:5], min(fields[5], 59), tzinfo=timezone.utc)
+    except (ValueError, OverflowError): return None
+
+
+# <link> tags advertising an RSS feed (case-insensitive, as HTML attribute values are).
+_RSS_LINK_SELECTOR = 'link[rel~="alternate" i][type*="application/rss+xml" i]'
+_RSS_LINK_SOUPSIEVE = soupsieve.compile(_RSS_LINK_SELECTOR)
+# Raw-text prefilter: a page never mentioning the RSS MIME type cannot match the selector, so it is not parsed at all.
+_RSS_TYPE_HINT_RE = re.compile(r'application/rss\+xml', re.IGNORECASE)
+# The same test as XPath over an lxml tree, returning the href values directly.
+_RSS_LINK_HREF_XPATH = etree.XPath(
+    '//link[contains(concat(" ", normalize-space(translate(@rel, "ALTERN", "altern")), " "), " alternate ")]'
+    '[contains(translate(@type, "APLICTONRSXM", "aplictonrsxm"), "application/rss+xml")]/@href', smart_strings=False)
+
+# href values of every anchor, for link extraction over an lxml tree.
+_ANCHOR_HREF_XPATH = etree.XPath('//a/@href', smart_strings=False)
+# Pages at least this long have their anchors streamed (_stream_anchor_hrefs) unless a tree of them is already cached.
+_STREAM_ANCHORS_MIN_CHARS = 1 << 20
+_STREAM_ANCHORS_CHUNK_CHARS = 1 << 16
+# Bounds on link extraction work per page: longer hrefs (and joined URLs) are skipped, and anchors past the cap ignored.
+_MAX_HREF_CHARS = 2048
+_MAX_ANCHORS_PER_PAGE = 5000
+
+
+def _stream_anchor_hrefs(html_content: str) -> List[str]:
+    """
+    href values of every anchor in `html_content`, read with a pull parser that empties each element once it
+    ends. Only the still-open path keeps content, so memory stays a fraction of a full tree on very large pages.
+    """
+    pull_parser = etree.HTMLPullParser(events=('end',))
+    hrefs: List[str] = []
+
+    def drain() -> None:
+        for _, element in pull_parser.read_events():
+            if element.tag == 'a' and (href := element.get('href')) is not None: hrefs.append(href)
+            element.clear(keep_tail=False)
+
+    for start in range(0, len(html_content), _STREAM_ANCHORS_CHUNK_CHARS):
+        pull_parser.feed(html_content[start:start + _STREAM_ANCHORS_CHUNK_CHARS])
+        drain()
+    pull_parser.close()
+    drain() # Elements still open at the end of the input only end on close()
+    return hrefs
+
+# hrefs whose join is not plain concatenation: control characters or spaces (urlsplit strips some), an empty
+# query, fragment or params (urlunparse drops them), dot segments (resolved in relative paths) and brackets
+# (urlsplit rejects malformed IPv6 hosts).
+_HREF_JOIN_UNSAFE_RE = re.compile(r'[\x00-\x20\x7f\[\]]|[;?#](?:[?#]|\Z)|/\.\.?(?:[/;?#]|\Z)')
+
+
+def _fast_join_href(origin: str, href: str) -> Optional[str]:
+    """
+    urljoin(base, href) by string concatenation for absolute http(s), scheme-relative and root-relative
+    hrefs against a base whose scheme://host is `origin`. Returns None for every other form.
+    """
+    if _HREF_JOIN_UNSAFE_RE.search(href): return None
+    if href.startswith(('http://', 'https://')):
+        return href if href[href.index('//') + 2:][:1] not in ('', '/', '?', '#') else None # Must name a host
+    if href.startswith('//'):
+        return origin[:origin.index(':') + 1] + href if href[2:3] not in ('', '/', '?', '#') else None
+    if href.startswith('/'): return origin + href
+    return None
+
+
+# Query parameters that only track where a click came from; dropped by _canonical_url.
+_TRACKING_QUERY_PREFIXES = ('utm_',)
+_TRACKING_QUERY_KEYS = frozenset(('fbclid', 'gclid', 'ref'))
+
+
+def _canonical_url(url: str) -> str:
+    """
+    Canonical form of an absolute URL, so near-duplicates share one entry: lower-cased scheme and host, no
+    fragment, '/' for an empty path, and the query's parameters sorted with tracking parameters removed.
+    Parameters are compared and kept in their raw (still percent-encoded) form.
+    """
+    url = url.partition('#')[0]
+    authority_start = url.find('//') + 2
+    if authority_start < 2: return url
+    authority_end = len(url)
+    for delimiter in ('/', '?'):
+        index = url.find(delimiter, authority_start)
+        if index != -1 and index < authority_end: authority_end = index
+    userinfo, at, host = url[authority_start:authority_end].rpartition('@')
+    path, _, query = url[authority_end:].partition('?')
+    canonical = url[:authority_start].lower() + userinfo + at + host.lower() + (path or '/')
+    if query:
+        params = sorted(param for param in query.split('&') if param and
+                        not ((key := param.partition('=')[0].lower()) in _TRACKING_QUERY_KEYS or key.startswith(_TRACKING_QUERY_PREFIXES)))
+        if params: canonical += '?' + '&'.join(params)
+    return canonical
+
+
+# Links that never lead to articles: account pages, listings, feeds and static assets.
+_EXCLUDED_LINK_PATTERNS = (
+    r"/login", r"/signin", r"/register", r"/signup",
+    r"/tag/", r"/user/", r"/profile/", r"/account/",
+    r"/search", r"/privacy", r"/terms", r"/contact", r"/about",
+    r"/\?replytocom=", r"/wp-json/", r"/feed/$", r"/comments/feed/$",
+    r"\.pdf$", r"\.zip$", r"\.jpg$", r"\.jpeg$", r"\.png$", r"\.gif$", r"\.css$", r"\.js$",
+    r"archive\.org/web/", # Example: exclude archive.org wayback machine links
+)
+# Compiled once as a single alternation, so each link costs one search rather than one per pattern.
+_EXCLUDED_LINK_RE = _fast_re.compile('(?i)' + '|'.join(_EXCLUDED_LINK_PATTERNS))
+
+# score_and_select_links: a link scores _LINK_KEYWORD_WEIGHT * (share of these keywords found in it, case-insensitively)
+# plus _LINK_DEPTH_WEIGHT / (1 + distance of its path depth from _LINK_OPTIMAL_DEPTH).
+_LINK_KEYWORDS = (
+    "news", "article", "story", "post", "blog", "report", "update", "analysis", "breaking", "latest",
+    "headline", "summary", "release", "bulletin", "journal", "chronicle", "review", "insight",
+    # Date related keywords could be useful if they appear in paths
+    "2023", "2024", "jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec",
+)
+_LINK_KEYWORD_WEIGHT = 0.6
+_LINK_DEPTH_WEIGHT = 0.4
+_LINK_OPTIMAL_DEPTH = 3
+
+
+@functools.lru_cache(maxsize=16384)
+def _score_link(link: str) -> float:
+    """
+    Keyword relevance plus path-depth score of one link; see _LINK_KEYWORDS. Memoized, as a site's navigation
+    and section links reappear on every seed page scored during a run.
+    """
+    lowered = link.lower()
+    keyword_share = sum(keyword in lowered for keyword in _LINK_KEYWORDS) / len(_LINK_KEYWORDS)
+    path = urlsplit(link).path.strip('/')
+    depth = path.count('/') + 1 if path else 0
+    return _LINK_KEYWORD_WEIGHT * keyword_share + _LINK_DEPTH_WEIGHT / (1 + abs(depth - _LINK_OPTIMAL_DEPTH))
+
+
+# Every node the Schema.org and meta-author lookups need, gathered by one walk of the document in document order.
+_PAGE_SIGNALS_XPATH = etree.XPath('//script[@type="application/ld+json"] | //meta[translate(@name, "AUTHOR", "author")="author"] | //*[@itemscope]')
+# Visible text nodes of an element (script/style bodies excluded, as BeautifulSoup's get_text does).
+_VISIBLE_TEXT_XPATH = etree.XPath('descendant-or-self::text()[not(parent::script or parent::style)]', smart_strings=False)
+
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_css_xpath(selector: str, first_only: bool = False) -> etree.XPath:
+    """
+    Translates a CSS selector to a compiled lxml XPath once per process. Sources often share
+    selectors (h1, time[datetime], ...), so this sits beneath the per-source selector cache.
+    """
+    path = CSSSelector(selector, translator='html').path
+    return etree.XPath(f'({path})[1]' if first_only else path)
+
+
+# Selectors made only of type, class and id selectors and combinators; anything else (attributes, pseudo-classes,
+# escapes) is not prefiltered. Their class and id names appear verbatim in the markup of any page they match.
+_SIMPLE_CSS_RE = re.compile(r'[\w\s.#>+~*,-]+')
+_CSS_NAME_RE = re.compile(r'[.#]([\w-]+)')
+
+
+def _selector_needles(selector: str) -> Tuple[Tuple[str, ...], ...]:
+    """
+    For each comma-separated alternative of `selector`, the class and id names that must all occur in a
+    page's raw HTML for it to match. An empty tuple means the alternative may match any page.
+    """
+    if not _SIMPLE_CSS_RE.fullmatch(selector): return ((),)
+    return tuple(tuple(_CSS_NAME_RE.findall(alternative)) for alternative in selector.split(','))
+
+
+# User-agent / Crawl-delay / (Dis)allow lines of a robots.txt, scanned in one pass over the whole file.
+# Rule lines are matched only so that they end a run of User-agent lines that share one group.
+# Flags are inline and there is no lookaround, so the pattern compiles unchanged under RE2.
+_ROBOTS_DIRECTIVE_RE = _fast_re.compile(r'(?im)^[ \t]*(?:user-agent[ \t]*:[ \t]*(?P<agent>\S+)'
+                                        r'|crawl-delay[ \t]*:[ \t]*(?P<delay>\d+(?:\.\d*)?|\.\d+)(?:[^\d.]|$)|(?:dis)?allow[ \t]*:)')
+# Sitemap lines; only the keyword is matched case-insensitively, the URL keeps its case.
+_ROBOTS_SITEMAP_RE = _fast_re.compile(r'(?im)^[ \t]*sitemap[ \t]*:[ \t]*(\S+)')
+
+# Atom namespace prefix, as lxml spells qualified tag names.
+_ATOM_NS = '{http://www.w3.org/2005/Atom}'
+# Alternate-link lookup of the lxml feed reader, compiled once rather than re-resolved per entry.
+_ATOM_ALTERNATE_HREF_XPATH = etree.XPath('atom:link[not(@rel) or @rel="alternate"][@href != ""][1]/@href',
+                                         namespaces={'atom': _ATOM_NS[1:-1]}, smart_strings=False)
+# Atom titles carrying (x)html markup, which the lxml feed reader hands to feedparser.
+_ATOM_MARKUP_TITLE_XPATH = etree.XPath('atom:title[@type="xhtml" or @type="html"]', namespaces={'atom': _ATOM_NS[1:-1]})
+
+# Slice size fed to the incremental sitemap parser.
+_SITEMAP_FEED_CHUNK = 1 << 20
+
+# Marks a crawler that could not be built, so Parser.crawler does not retry construction on every access.
+_CRAWLER_UNAVAILABLE = object()
+
+# Number of pages whose Schema.org result is kept for retries and re-runs.
+_SCHEMA_CACHE_SIZE = 256
+
+# Number of sufficient parse_content results kept in memory, keyed by page, URL and source selectors.
+_PARSE_MEMO_SIZE = 256
+
+# Bumped whenever extraction logic changes what parse_content returns, so older on-disk entries stop matching.
+_PARSE_CACHE_VERSION = 1
+
+# Author names shorter than this are interned; longer values are usually scraped bylines or bios, not names.
+_INTERN_AUTHOR_MAX_LEN = 64
+
+# Fields that make up a normalized article result.
+_RESULT_FIELDS = ('title', 'text', 'authors', 'published_date_utc')
+
+# Schema.org types that may carry an article, ranked by preference (lower wins).
+_SCHEMA_ORG_TYPE_PRIORITY: Dict[str, int] = {'NewsArticle': 0, 'Article': 1, 'BlogPosting': 2, 'WebPage': 3}
+# Subtypes (OpinionNewsArticle, TechArticle, LiveBlogPosting, ItemPage's WebPage kin...) and lower-case spellings
+# rank as the first base type their name contains, in this order.
+_SCHEMA_ORG_TYPE_FRAGMENTS = (('newsarticle', 0), ('article', 1), ('blogposting', 2), ('webpage', 3))
+# JSON-LD blocks mentioning none of those types (BreadcrumbList, Organization, ...) cannot yield an article.
+_SCHEMA_ORG_TYPE_HINT_RE = re.compile('article|blogposting|webpage', re.IGNORECASE)
+
+# How long a fetched (or missing) robots.txt is trusted before handle_robots_txt fetches it again.
+_ROBOTS_TTL_SECONDS = 12 * 3600
+# Only the start of a robots.txt is read, as Google caps it at 500 KiB; larger files are almost always generated junk.
+_ROBOTS_MAX_CHARS = 500 * 1024
+
+# Pool of the shared httpx client. Idle connections are kept for 30s rather than httpx's 5s, so a host's connection
+# opened for robots.txt is still warm when the HEAD checks reach it after link scoring.
+_HTTP_POOL_LIMITS = httpx.Limits(max_keepalive_connections=100, max_connections=200, keepalive_expiry=30.0)
+
+# Concurrent HEAD requests in filter_by_content_type, overall and per host.
+_HEAD_CONCURRENCY = 20
+_HEAD_CONCURRENCY_PER_HOST = 4
+# HEAD statuses meaning the server refuses HEAD itself, not the URL; filter_by_content_type retries with a ranged GET.
+_HEAD_REFUSED_STATUSES = frozenset((400, 403, 405, 501))
+# Article pages process_seed_url fetches and parses at once, by default.
+_ARTICLE_CONCURRENCY = 8
+# Canonical article URLs a Parser remembers as already fetched; the oldest are forgotten past this many.
+_SEEN_ARTICLE_URLS_MAX = 100_000
+# Content types filter_by_content_type keeps: common types for web pages.
+_ALLOWED_CONTENT_TYPES = frozenset(("text/html", "text/plain", "application/xhtml+xml"))
+# Path extensions served as HTML in practice; links ending in one (or in no extension, or '/') skip the HEAD check.
+_HTML_PATH_EXTENSIONS = frozenset(('', '.html', '.htm', '.php', '.aspx', '.jsp'))
+
+
+def _likely_html(url: str) -> bool:
+    """True when the path of `url` already implies an HTML page, e.g. /2024/01/slug/ or /story.html."""
+    path = urlsplit(url).path
+    return path.endswith('/') or os.path.splitext(path)[1].lower() in _HTML_PATH_EXTENSIONS
+
+# Shared pool for the synchronous extraction strategies, keeping HTML parsing off the event loop. lxml releases
+# the GIL while parsing and matching, so one worker per core lets concurrent parse_content calls scale out.
+_STRATEGY_EXECUTOR = ThreadPoolExecutor(max_workers=max(2, os.cpu_count() or 1), thread_name_prefix="parser-strategy")
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """json.loads, through orjson when it is installed (its JSONDecodeError subclasses json's)."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps(obj: Any) -> str:
+    """json.dumps, through orjson when it is installed."""
+    return orjson.dumps(obj).decode('utf-8') if orjson is not None else json.dumps(obj)
+
+
+def _json_default(obj: Any) -> str:
+    """json.dump fallback for parse results: datetimes as ISO-8601, anything else as its str()."""
+    return obj.isoformat() if isinstance(obj, datetime) else str(obj)
+
+
+def _content_key(content: Union[str, bytes]) -> Union[int, bytes]:
+    """
+    Returns a fast, non-cryptographic key for content-addressed caches.
+    Uses xxh3_64 when xxhash is installed, otherwise a 16-byte blake2b digest.
+    """
+    data = content.encode('utf-8') if isinstance(content, str) else content
+    if xxhash is not None: return xxhash.xxh3_64_intdigest(data)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+@functools.lru_cache(maxsize=256)
+def _schema_type_priority(local_name: str) -> Optional[int]:
+    """Priority of a Schema.org type's local name, or None when it is not an article type or subtype."""
+    priority = _SCHEMA_ORG_TYPE_PRIORITY.get(local_name)
+    if priority is not None: return priority
+    lowered = local_name.lower()
+    return next((priority for fragment, priority in _SCHEMA_ORG_TYPE_FRAGMENTS if fragment in lowered), None)
+
+
+def _crawl_result_url(page_result: Any) -> Optional[str]:
+    """URL a crawl4ai run result was crawled for: its own `url`, else that of its first page."""
+    result_url = getattr(page_result, 'url', None)
+    if isinstance(result_url, str): return result_url
+    pages = getattr(page_result, 'results', None)
+    result_url = getattr(pages[0], 'url', None) if pages else None
+    return result_url if isinstance(result_url, str) else None
+
+
+def _schema_type_rank(item: Dict[str, Any]) -> Optional[Tuple[int, str]]:
+    """
+    Best (priority, type name) among all of the item's '@type' values, or None when none is an article type.
+    Full IRIs ('https://schema.org/NewsArticle') and compact ones ('schema:NewsArticle') match by their local name.
+    """
+    type_val = item.get('@type')
+    best: Optional[Tuple[int, str]] = None
+    for type_name in (type_val if isinstance(type_val, list) else (type_val,)):
+        if not isinstance(type_name, str): continue
+        local_name = type_name[max(type_name.rfind('/'), type_name.rfind(':')) + 1:]
+        priority = _schema_type_priority(local_name)
+        if priority is not None and (best is None or priority < best[0]): best = (priority, local_name)
+    return best
+
+
+def _skeletonize(page: Union[str, lxml.html.HtmlElement], text_limit: int = 80, max_depth: int = 12, max_children: int = 100) -> str:
+    """
+    Reduces a page to its DOM skeleton for LLM schema generation: scripts, styles, SVG and
+    comments are stripped, long text is collapsed to "...", and the body is pruned below
+    `max_depth` levels and after `max_children` siblings. Tags, ids and classes are kept.
+    `page` may be raw HTML or an already parsed document, which is copied rather than re-parsed.
+    """
+    if isinstance(page, str):
+        try:
+            root = lxml.html.fromstring(page)
+        except (etree.ParserError, ValueError):
+            return page
+    else:
+        root = copy.deepcopy(page) # The shared document must stay intact for the other strategies
+    etree.strip_elements(root, 'script', 'style', 'svg', 'noscript', etree.Comment, with_tail=False)
+
+    def prune(element, depth: int) -> None:
+        if element.text and len(element.text) > text_limit: element.text = "..."
+        for index, child in enumerate(list(element)):
+            if depth >= max_depth or index >= max_children:
+                element.remove(child)
+                continue
+            if child.tail and len(child.tail) > text_limit: child.tail = "..."
+            prune(child, depth + 1)
+
+    body = root.find('body') if root.tag == 'html' else None
+    prune(body if body is not None else root, 0)
+    return lxml.html.tostring(root, encoding='unicode')
+
+
+@dataclass(slots=True, frozen=True)
+class SitemapItem:
+    """One <url> entry of a sitemap urlset; slotted, as large sitemaps yield tens of thousands of them."""
+    loc: str
+    lastmod_utc: Optional[datetime]
+    source_sitemap_url: str
+
+
+@dataclass(slots=True)
+class _GeneralAIBatch:
+    """
+    Pages of one Parser.parse_contents_batch call that fell back to crawl4ai. They are sent as a
+    single arun_many once every page of the batch has either queued here or finished parsing.
+    """
+    running: int # Pages still being parsed that have not queued
+    queued: List[Tuple[str, str, asyncio.Future]] = field(default_factory=list) # (url, html, result future)
+
+
+# Paths RobotFileParser.can_fetch leaves unchanged through its unquote/urlparse/quote round trip.
+_ROBOTS_PLAIN_PATH_RE = re.compile(r'/[\w.~/-]*', re.ASCII)
+
+
+class _RobotsMatcher:
+    """
+    RobotFileParser.can_fetch for one user agent, with the applicable entry's rule paths in a character trie.
+    A URL path is matched in one walk rather than a startswith per rule; the rule the walk finds first in file
+    order wins, exactly as in can_fetch.
+    """
+    __slots__ = ('rfp', 'mtime', '_trie', '_allowances')
+
+    def __init__(self, rfp: RobotFileParser, useragent: str):
+        self.rfp = rfp
+        self.mtime = rfp.mtime()
+        entry = next((entry for entry in rfp.entries if entry.applies_to(useragent)), rfp.default_entry)
+        rulelines = entry.rulelines if entry is not None else []
+        self._allowances = [line.allowance for line in rulelines]
+        # node: {char: child node, None: index of the first rule whose path ends here}
+        self._trie: Dict[Optional[str], Any] = {}
+        for index, line in enumerate(rulelines):
+            node = self._trie
+            for char in ('' if line.path == '*' else line.path): node = node.setdefault(char, {})
+            node.setdefault(None, index)
+
+    def can_fetch(self, url: str) -> bool:
+        rfp = self.rfp
+        if rfp.disallow_all: return False
+        if rfp.allow_all: return True
+        if not rfp.last_checked: return False
+        path_start = url.find('/', url.find('//') + 2)
+        if url.startswith(('http://', 'https://')) and (path_start == -1 or _ROBOTS_PLAIN_PATH_RE.fullmatch(url, path_start)) \
+                and not any(char in url for char in '%?#'):
+            filename = url[path_start:] if path_start != -1 else '/'
+        else:
+            parsed_url = urlparse(unquote(url))
+            filename = quote(urlunparse(('', '', parsed_url.path, parsed_url.params, parsed_url.query, parsed_url.fragment))) or '/'
+        node = self._trie
+        first = node.get(None)
+        for char in filename:
+            node = node.get(char)
+            if node is None: break
+            index = node.get(None)
+            if index is not None and (first is None or index < first): first = index
+        return True if first is None else self._allowances[first]
+
+
+# The batch the current parse_content task belongs to; each task of a batch gets its own context copy.
+_GENERAL_AI_BATCH: contextvars.ContextVar[Optional[_GeneralAIBatch]] = contextvars.ContextVar('_GENERAL_AI_BATCH', default=None)
 
 
 class Parser:
-    def __init__(self, monitor_instance=None, planner_reference=None): # structure_analyzer_instance removed
+    def __init__(self, monitor_instance=None, planner_reference=None, llm_batch_size: int = 8,
+                 parse_cache_dir: Optional[Union[str, Path]] = None, robots_ttl_seconds: float = _ROBOTS_TTL_SECONDS,
+                 debug_events: bool = True, article_concurrency: int = _ARTICLE_CONCURRENCY): # structure_analyzer_instance removed
         self.monitor = monitor_instance
         self.planner_ref = planner_reference
+        # When False, per-link/per-value DEBUG events are skipped before their message and details are built.
+        self._debug_enabled = debug_events
+        self._article_concurrency = article_concurrency
+        # Canonical article URLs process_seed_url has claimed (being fetched) or fetched, so later or concurrent seeds skip
+        # them before scoring, HEAD checks and fetching. An exact, insertion-ordered set capped at _SEEN_ARTICLE_URLS_MAX;
+        # URLs whose fetch fails are released, and aclose() forgets them all.
+        self._seen_article_urls: Dict[str, None] = {}
         # self.structure_analyzer = structure_analyzer_instance # Removed
         self.robot_parsers: Dict[str, RobotFileParser] = {}
-
-        if AsyncWebCrawler is None:
-            self._log_event("ERROR", "Parser: crawl4ai.AsyncWebCrawler is not available. AI parsing will fail.")
-            self.crawler = None
-        else:
-            try:
-                self.crawler = AsyncWebCrawler()
-                self._log_event("INFO", "Parser: crawl4ai AsyncWebCrawler initialized.")
-            except Exception as e:
-                self._log_event("ERROR", f"Parser: Failed to initialize crawl4ai AsyncWebCrawler: {e}")
-                self.crawler = None
+        # domain -> _content_key(robots.txt) its RobotFileParser was built from; an unchanged file is not re-parsed.
+        self._robots_content_keys: Dict[str, Union[int, bytes]] = {}
+        # domain -> time.monotonic() when its robots.txt was last fetched (or found missing); refetched after the TTL.
+        self._robots_fetched_at: Dict[str, float] = {}
+        self._robots_ttl_seconds = robots_ttl_seconds
+        # domain -> lock held while its robots.txt is fetched, so concurrent seeds of a domain share one fetch; reset
+        # with the event loop the locks belong to.
+        self._robots_locks: Dict[str, asyncio.Lock] = {}
+        self._robots_locks_loop: Optional[asyncio.AbstractEventLoop] = None
+        # (_content_key(robots.txt), lower-cased user agent) -> crawl delay, so each distinct file is scanned once per agent.
+        self._crawl_delay_cache: Dict[Tuple[Union[int, bytes], str], Optional[float]] = {}
+        # RobotFileParser -> its "*" _RobotsMatcher, built on first use and dropped along with the parser.
+        self._robots_matchers: weakref.WeakKeyDictionary[RobotFileParser, _RobotsMatcher] = weakref.WeakKeyDictionary()
+        # Opt-in on-disk cache of sufficient parse_content results; None keeps the parser stateless across runs.
+        self._parse_cache_dir: Optional[Path] = Path(parse_cache_dir) if parse_cache_dir else None
+        # Pages waiting for LLM schema generation: (source_name, url, html). One LLM call is made per source.
+        self._llm_queue: List[Tuple[str, str, str]] = []
+        self._llm_batch_size = llm_batch_size
+        # source_name -> generated schema (None when generation failed), shared by every page of that source.
+        self._llm_schema_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+        # _content_key(html sent to the LLM) -> raw generate_schema output, so identical templates share one call.
+        self._llm_template_cache: Dict[Union[int, bytes], Optional[Dict[str, Any]]] = {}
+        # Generations under way, which later callers await instead of starting their own: source_name -> future of its
+        # recorded schema, and template key -> task of the raw generate_schema output.
+        self._llm_inflight: Dict[str, asyncio.Future] = {}
+        self._llm_template_inflight: Dict[Union[int, bytes], asyncio.Future] = {}
+        # Last (html_content, lxml document) pair, so every strategy run on one page shares a single parse.
+        self._doc_cache: Optional[Tuple[str, lxml.html.HtmlElement]] = None
+        # Last (html_content, soup) pair, for the few lookups that still need BeautifulSoup.
+        self._soup_cache: Optional[Tuple[str, BeautifulSoup]] = None
+        # Last (document, page signals) pair; see _get_page_signals.
+        self._signals_cache: Optional[Tuple[lxml.html.HtmlElement, Dict[str, Any]]] = None
+        # source name -> (active selectors, lxml-or-soupsieve flag, compiled selectors, raw-text needles or None);
+        # recompiled when the selectors change.
+        self._compiled_selectors: Dict[str, Tuple[Dict[str, str], bool, Dict[str, Any], Optional[Tuple[Tuple[str, ...], ...]]]] = {}
+        # (url, _content_key(html)) -> Schema.org result (None included), LRU-capped so retries of a page skip extraction.
+        self._schema_cache: OrderedDict[Tuple[str, Union[int, bytes]], Optional[Dict[str, Any]]] = OrderedDict()
+        # _parse_cache_key(...) -> sufficient parse_content output, LRU-capped; re-crawls of an unchanged page skip every strategy.
+        self._parse_memo: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        # Guards both LRU caches above: _STRATEGY_EXECUTOR threads read and evict them concurrently.
+        self._lru_lock = threading.Lock()
+        # feed url -> (_content_key(last feed body), parsed items); an unchanged feed is returned without re-parsing.
+        self._feed_cache: Dict[str, Tuple[Union[int, bytes], List[Dict[str, Any]]]] = {}
+
+        # Keep-alive httpx client shared by robots.txt and HEAD requests, with the event loop it was created on.
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        # crawl4ai AsyncWebCrawler, built on first access to .crawler; most pages never reach the AI strategies.
+        self._crawler: Any = None
+        self._crawler_lock = threading.Lock()
 
         if self.planner_ref is None: self._log_event("WARNING", "Parser: Planner reference not provided.")
         # if self.structure_analyzer is None: self._log_event("WARNING", "Parser: StructureAnalyzer not provided.") # Removed
 
+    @property
+    def crawler(self) -> Any:
+        """The shared AsyncWebCrawler, constructed on first use; None when crawl4ai is missing or failed to start."""
+        if self._crawler is None:
+            with self._crawler_lock:
+                if self._crawler is None: self._crawler = self._create_crawler()
+        return None if self._crawler is _CRAWLER_UNAVAILABLE else self._crawler
+
+    @crawler.setter
+    def crawler(self, value: Any) -> None:
+        self._crawler = _CRAWLER_UNAVAILABLE if value is None else value
+
+    def _create_crawler(self) -> Any:
+        if AsyncWebCrawler is None:
+            self._log_event("ERROR", "Parser: crawl4ai.AsyncWebCrawler is not available. AI parsing will fail.")
+            return _CRAWLER_UNAVAILABLE
+        try:
+            crawler = AsyncWebCrawler()
+            self._log_event("INFO", "Parser: crawl4ai AsyncWebCrawler initialized.")
+            return crawler
+        except Exception as e: # Remembered as unavailable, so a broken install is not retried on every page
+            self._log_event("ERROR", f"Parser: Failed to initialize crawl4ai AsyncWebCrawler: {e}")
+            return _CRAWLER_UNAVAILABLE
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """The shared connection-pooled client, rebuilt when it was closed or belongs to another event loop."""
+        loop = asyncio.get_running_loop()
+        if self._http_client is None or self._http_client.is_closed or self._http_client_loop is not loop:
+            self._http_client = httpx.AsyncClient(follow_redirects=True, timeout=10.0, http2=h2 is not None, limits=_HTTP_POOL_LIMITS)
+            self._http_client_loop = loop
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """Closes the shared HTTP client's pooled connections and forgets the article URLs seen so far."""
+        if self._http_client is not None and not self._http_client.is_closed: await self._http_client.aclose()
+        self._http_client = self._http_client_loop = None
+        self._seen_article_urls.clear()
+
+    def _claim_article_url(self, url: str) -> bool:
+        """Marks the article URL as taken by this seed; False when another seed already claimed or fetched it."""
+        key = _canonical_url(url)
+        if key in self._seen_article_urls: return False
+        self._seen_article_urls[key] = None
+        if len(self._seen_article_urls) > _SEEN_ARTICLE_URLS_MAX: del self._seen_article_urls[next(iter(self._seen_article_urls))]
+        return True
+
+    def _release_article_url(self, url: str) -> None:
+        """Forgets a claimed article URL (not fetched after all), so a later seed may queue it again."""
+        self._seen_article_urls.pop(_canonical_url(url), None)
+
     def _log_event(self, level: str, message: str, details: Optional[Dict[str, Any]] = None):
         if self.monitor: self.monitor.log_event(level.upper(), message, details)
-        else: print(f"[{level.upper()}] {message}{(' | ' + json.dumps(details)) if details else ''}")
+        else: print(f"[{level.upper()}] {message}{(' | ' + _json_dumps(details)) if details else ''}")
 
     def _parse_generic_date_to_utc(self, date_input: Any) -> Optional[datetime]: # context_url removed
-        if date_input is None: return None
-        if isinstance(date_input, datetime):
-            return date_input.astimezone(timezone.utc) if date_input.tzinfo else date_input.replace(tzinfo=timezone.utc)
-        if isinstance(date_input, str):
-            try:
-                dt = dateutil_parser.parse(date_input)
-                return dt.astimezone(timezone.utc) if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
-            except (ValueError, TypeError, OverflowError): # Logged where this is called if context needed
-                return None
-        if isinstance(date_input, time.struct_time):
-            try: return datetime.fromtimestamp(time.mktime(date_input), tz=timezone.utc)
-            except Exception: return None
-        return None
+        return _date_to_utc(date_input)
 
 
     def _is_data_sufficient(self, parsed_data_dict: Optional[Dict[str, Any]]) -> bool:
         if not parsed_data_dict: return False
         return bool(parsed_data_dict.get('title') and parsed_data_dict.get('text'))
 
+    def _get_doc(self, html_content: str) -> lxml.html.HtmlElement:
+        """Parses `html_content` into an lxml.html document, reusing the previous tree if this exact string was parsed last."""
+        cached = self._doc_cache
+        if cached is not None and cached[0] is html_content: return cached[1]
+        try: doc = lxml.html.document_fromstring(html_content)
+        except ValueError: # str input carrying an XML encoding declaration
+            doc = lxml.html.document_fromstring(html_content.encode('utf-8'), parser=lxml.html.HTMLParser(encoding='utf-8'))
+        except etree.ParserError: doc = lxml.html.Element('html') # Blank page: nothing for any strategy to find
+        self._doc_cache = (html_content, doc)
+        return doc
+
+    def _get_soup(self, html_content: str) -> BeautifulSoup:
+        """Parses `html_content` with lxml, reusing the previous tree if this exact string was parsed last."""
+        cached = self._soup_cache
+        if cached is not None and cached[0] is html_content: return cached[1]
+        soup = BeautifulSoup(html_content, 'lxml')
+        self._soup_cache = (html_content, soup)
+        return soup
+
+    def _get_page_signals(self, doc: lxml.html.HtmlElement) -> Dict[str, Any]:
+        """
+        Collects, in a single walk of `doc`, the JSON-LD script bodies, <meta name="author"> names,
+        whether any microdata (itemscope) is present and whether any of it could be an article
+        (an untyped item, or an itemtype naming a ranked Schema.org type). Cached for the last document seen.
+        """
+        cached = self._signals_cache
+        if cached is not None and cached[0] is doc: return cached[1]
+        json_ld: List[str] = []
+        meta_authors: List[str] = []
+        has_microdata = has_article_microdata = False
+        for element in _PAGE_SIGNALS_XPATH(doc):
+            if element.get('itemscope') is not None:
+                has_microdata = True
+                item_type = element.get('itemtype')
+                if item_type is None or _SCHEMA_ORG_TYPE_HINT_RE.search(item_type): has_article_microdata = True
+            if element.tag == 'script':
+                if element.text: json_ld.append(element.text)
+            elif element.tag == 'meta' and (element.get('name') or '').lower() == 'author':
+                meta_authors.extend(name.strip() for name in (element.get('content') or '').split(',') if name.strip())
+        signals = {'json_ld': json_ld, 'meta_authors': meta_authors, 'has_microdata': has_microdata,
+                   'has_article_microdata': has_article_microdata}
+        self._signals_cache = (doc, signals)
+        return signals
+
+    def _extract_json_ld(self, doc: lxml.html.HtmlElement, type_hint: Optional[re.Pattern] = None) -> List[Dict[str, Any]]:
+        """
+        json.loads every <script type="application/ld+json"> block of an already parsed page.
+        With `type_hint`, blocks whose raw text the pattern does not match are skipped without decoding.
+        """
+        return list(self._iter_json_ld(doc, type_hint))
+
+    def _iter_json_ld(self, doc: lxml.html.HtmlElement, type_hint: Optional[re.Pattern] = None) -> Iterator[Dict[str, Any]]:
+        """Lazy form of _extract_json_ld: a block is only decoded once the consumer asks for its items."""
+        for script_text in self._get_page_signals(doc)['json_ld']:
+            if type_hint is not None and not type_hint.search(script_text): continue
+            try: data = _json_loads(script_text)
+            except (ValueError, TypeError): continue
+            for entry in (data if isinstance(data, list) else [data]):
+                if not isinstance(entry, dict): continue
+                graph = entry.get('@graph')
+                if isinstance(graph, list): yield from (node for node in graph if isinstance(node, dict)) # Yoast & co. nest everything here
+                else: yield entry
+
+    def _missing_fields(self, parsed_data_dict: Optional[Dict[str, Any]]) -> Set[str]:
+        if not parsed_data_dict: return set(_RESULT_FIELDS)
+        return {field for field in _RESULT_FIELDS if not parsed_data_dict.get(field)}
+
+    def _merge_partial(self, primary: Dict[str, Any], secondary: Dict[str, Any]) -> Dict[str, Any]:
+        """Fills the fields missing from `primary` with `secondary`'s values; both methods are kept in `extraction_method`."""
+        merged = dict(primary)
+        for field in self._missing_fields(primary):
+            if secondary.get(field): merged[field] = secondary[field]
+        merged['extraction_method'] = f"{primary.get('extraction_method')}+{secondary.get('extraction_method')}"
+        return merged
+
+    def _extract_meta_authors(self, html_content: str, doc: Optional[lxml.html.HtmlElement] = None) -> List[str]:
+        """Reads authors from <meta name="author"> tags of the shared document."""
+        return list(self._get_page_signals(doc if doc is not None else self._get_doc(html_content))['meta_authors'])
+
     def _normalize_extracted_data(self, data_dict: Dict[str, Any], source_url: str, extraction_method_used: str) -> Dict[str, Any]:
         if not isinstance(data_dict, dict): data_dict = {}
         title = data_dict.get('title') or data_dict.get('headline')
         text = data_dict.get('text') or data_dict.get('content') or data_dict.get('articleBody')
         raw_date = data_dict.get('published_date_utc') or data_dict.get('datePublished') or \
                    data_dict.get('dateModified') or data_dict.get('date') or data_dict.get('published_time')
-        published_date_utc = self._parse_generic_date_to_utc(raw_date) # context_url removed
-        if raw_date and not published_date_utc: # Log if parsing failed with a value
+        published_date_utc = _date_to_utc(raw_date) # context_url removed
+        if raw_date and not published_date_utc and self._debug_enabled: # Log if parsing failed with a value
             self._log_event("DEBUG", f"Date parsing failed for value '{raw_date}'", {"url": source_url, "method": extraction_method_used})
 
         authors_data: Union[List[Any], Dict[str, Any], str, None] = data_dict.get('authors') or data_dict.get('author')
-        authors_list: List[str] = []
-        if isinstance(authors_data, list):
-            for auth in authors_data: authors_list.append(auth.get('name') if isinstance(auth, dict) else str(auth))
-        elif isinstance(authors_data, dict): authors_list.append(authors_data.get('name', str(authors_data)))
-        elif isinstance(authors_data, str): authors_list = [n.strip() for n in authors_data.split(',')]
+        raw_authors: List[Any] = []
+        if isinstance(authors_data, list): raw_authors = authors_data # Used as-is; dict entries are resolved below
+        elif isinstance(authors_data, dict): raw_authors = [authors_data.get('name', str(authors_data))]
+        elif isinstance(authors_data, str): raw_authors = authors_data.split(',')
+
+        # One pass: each author's name is looked up, stringified and stripped exactly once; nameless dicts are dropped.
+        # Names recur across a source's articles, so short ones are interned to share one string per byline.
+        authors: List[str] = [sys.intern(name) if len(name) < _INTERN_AUTHOR_MAX_LEN else name for author in raw_authors
+                              if (value := author.get('name') if isinstance(author, dict) else author) is not None
+                              and (name := _stripped_str(value))]
 
         return {
-            "title": str(title).strip() if title else None,
-            "text": str(text).strip() if text else None,
+            "title": _stripped_str(title) if title else None,
+            "text": _stripped_str(text) if text else None,
             "published_date_utc": published_date_utc,
-            "authors": [str(a).strip() for a in authors_list if str(a).strip()],
+            "authors": authors,
             "url": data_dict.get('url', source_url),
             "extraction_method": extraction_method_used,
         }
 
-    def _parse_with_custom_selectors(self, html_content: str, url: str, source_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _get_compiled_selectors(self, source_name: str, active_selectors: Dict[str, str]) -> Tuple[bool, Dict[str, Any], Optional[Tuple[Tuple[str, ...], ...]]]:
+        """
+        Compiles a source's CSS selectors once rather than on every page: to lxml XPath when cssselect
+        can translate them all (True), else to soupsieve patterns for the BeautifulSoup path (False).
+        Also returns the needle sets of every selector alternative (see _selector_needles), or None
+        when some alternative may match any page.
+        """
+        cached = self._compiled_selectors.get(source_name)
+        if cached is not None and cached[0] == active_selectors: return cached[1], cached[2], cached[3]
+        needles: Optional[Tuple[Tuple[str, ...], ...]] = tuple(alternative for selector in active_selectors.values() for alternative in _selector_needles(selector))
+        if () in needles: needles = None
+        try:
+            # Only the first match is read for title and date, so have libxml2 return just that node.
+            use_lxml, compiled = True, {field: _compile_css_xpath(selector, field in ('title', 'date')) for field, selector in active_selectors.items()}
+        except SelectorError as e:
+            # Selectors cssselect cannot translate (e.g. :-soup-contains()) are still served by soupsieve.
+            self._log_event("DEBUG", f"lxml custom CSS unavailable for source '{source_name}', using BeautifulSoup: {e}")
+            use_lxml, compiled = False, {field: soupsieve.compile(selector) for field, selector in active_selectors.items()}
+        self._compiled_selectors[source_name] = (dict(active_selectors), use_lxml, compiled, needles)
+        return use_lxml, compiled, needles
+
+    def _parse_with_custom_selectors(self, html_content: str, url: str, source_config: Dict[str, Any], doc: Optional[lxml.html.HtmlElement] = None) -> Optional[Dict[str, Any]]:
         selectors = source_config.get("extraction_selectors")
         if not selectors or not isinstance(selectors, dict): return None
         strategy_map = {"title": selectors.get("article_title_selector"), "text": selectors.get("article_content_selector"),
@@ -126,35 +847,96 @@ class Parser:
         if not active_selectors: return None
         self._log_event("INFO", f"Attempting extraction with custom CSS for {url}", {"selectors_count": len(active_selectors)})
         try:
-            soup = BeautifulSoup(html_content, 'lxml')
+            use_lxml, compiled_selectors, needles = self._get_compiled_selectors(source_config.get("name", "UnknownSource"), active_selectors)
+            # A page missing some class/id name of every selector alternative cannot match; skip parsing and matching it.
+            if needles is not None and not any(all(name in html_content for name in alternative) for alternative in needles):
+                self._log_event("DEBUG", f"No custom CSS selector can match {url}; skipped without parsing.")
+                return None
+            if not use_lxml: return self._parse_with_custom_selectors_soup(html_content, url, compiled_selectors)
+            if doc is None: doc = self._get_doc(html_content)
             extracted_data: Dict[str, Any] = {}
-            for field, selector in active_selectors.items():
-                elements = soup.select(selector)
-                if elements:
-                    if field == "text": extracted_data[field] = "\n".join([el.get_text(separator="\n", strip=True) for el in elements])
-                    elif field == "authors": extracted_data[field] = [el.get_text(strip=True) for el in elements]
-                    elif field == "date": extracted_data[field] = elements[0].get('datetime', elements[0].get_text(strip=True))
-                    else: extracted_data[field] = elements[0].get_text(strip=True)
+            for field, compiled in compiled_selectors.items():
+                elements = compiled(doc)
+                if not elements: continue
+                if field == "text": extracted_data[field] = "\n".join(["\n".join(t for t in (n.strip() for n in _VISIBLE_TEXT_XPATH(el)) if t) for el in elements])
+                elif field == "authors": extracted_data[field] = ["".join(n.strip() for n in _VISIBLE_TEXT_XPATH(el)) for el in elements]
+                else: # Only the first match is used for title and date
+                    element = elements[0]
+                    value = element.get('datetime') if field == "date" else None
+                    extracted_data[field] = value if value is not None else "".join(n.strip() for n in _VISIBLE_TEXT_XPATH(element))
             return self._normalize_extracted_data(extracted_data, url, "custom_css") if extracted_data else None
         except Exception as e: self._log_event("ERROR", f"Custom CSS parsing error: {e}", {"url": url}); return None
 
-    def _parse_with_schema_org(self, html_content: str, url: str) -> Optional[Dict[str, Any]]:
+    def _parse_with_custom_selectors_soup(self, html_content: str, url: str, compiled_selectors: Dict[str, soupsieve.SoupSieve]) -> Optional[Dict[str, Any]]:
+        """BeautifulSoup/soupsieve variant of the custom CSS strategy, for what lxml cannot handle."""
+        soup = self._get_soup(html_content)
+        extracted_data: Dict[str, Any] = {}
+        for field, compiled in compiled_selectors.items():
+            if field == "text" or field == "authors":
+                elements = compiled.select(soup)
+                if not elements: continue
+                if field == "text": extracted_data[field] = "\n".join([el.get_text(separator="\n", strip=True) for el in elements])
+                else: extracted_data[field] = [el.get_text(strip=True) for el in elements]
+            else: # Only the first match is used for title and date
+                element = compiled.select_one(soup)
+                if element is None: continue
+                if field == "date": extracted_data[field] = element.get('datetime', element.get_text(strip=True))
+                else: extracted_data[field] = element.get_text(strip=True)
+        return self._normalize_extracted_data(extracted_data, url, "custom_css") if extracted_data else None
+
+    def _pick_schema_org_article(self, items, url: str) -> Optional[Dict[str, Any]]:
+        # One pass keeping the best-ranked article that has a title or text; document order breaks ties.
+        best: Optional[Tuple[int, str, Dict[str, Any]]] = None
+        for item in items:
+            if not isinstance(item, dict): continue
+            ranked = _schema_type_rank(item)
+            if ranked is None or (best is not None and ranked[0] >= best[0]): continue
+            priority, item_type = ranked
+            mapped = {'title': item.get('headline') or item.get('name'), 'text': item.get('articleBody') or item.get('text'),
+                      'authors': item.get('author'), 'date': item.get('datePublished') or item.get('dateModified'), 'url': item.get('url')}
+            if mapped['title'] or mapped['text']:
+                best = (priority, item_type, mapped)
+                if priority == 0: break # Nothing outranks a NewsArticle
+        # Interned: every result of this type shares one method-name string instead of a fresh f-string.
+        return self._normalize_extracted_data(best[2], url, sys.intern(f"schema_org_{best[1].lower()}")) if best else None
+
+    def _parse_with_schema_org(self, html_content: str, url: str, doc: Optional[lxml.html.HtmlElement] = None) -> Optional[Dict[str, Any]]:
+        # Substring scans run at memchr speed; without either marker there is no structured data to parse or hash.
+        if 'application/ld+json' not in html_content and 'itemscope' not in html_content:
+            self._log_event("DEBUG", f"No JSON-LD or microdata markers in {url}, skipping Schema.org")
+            return None
+        cache_key = (url, _content_key(html_content))
+        with self._lru_lock:
+            hit = cache_key in self._schema_cache
+            if hit:
+                self._schema_cache.move_to_end(cache_key)
+                cached = self._schema_cache[cache_key]
+        if hit:
+            self._log_event("DEBUG", f"Schema.org result for {url} served from cache")
+            return dict(cached) if cached is not None else None
+        result = self._extract_schema_org(html_content, url, doc)
+        with self._lru_lock:
+            self._schema_cache[cache_key] = result
+            while len(self._schema_cache) > _SCHEMA_CACHE_SIZE: self._schema_cache.popitem(last=False)
+        return dict(result) if result is not None else None
+
+    def _extract_schema_org(self, html_content: str, url: str, doc: Optional[lxml.html.HtmlElement] = None) -> Optional[Dict[str, Any]]:
         self._log_event("INFO", f"Attempting Schema.org (extruct) for {url}")
         try:
-            data = extruct.extract(html_content, base_url=urljoin(url, "/"), syntaxes=['json-ld', 'microdata'], uniform=True)
-            for entry_type in ['json-ld', 'microdata']:
-                for item in data.get(entry_type, []):
-                    item_type_val = item.get('@type')
-                    item_type_str = str(item_type_val[0] if isinstance(item_type_val, list) else item_type_val).lower() if item_type_val else ""
-                    if any(t in item_type_str for t in ['article', 'newsarticle', 'blogposting', 'webpage']):
-                        mapped = {'title': item.get('headline') or item.get('name'), 'text': item.get('articleBody') or item.get('text'),
-                                  'authors': item.get('author'), 'date': item.get('datePublished') or item.get('dateModified'), 'url': item.get('url')}
-                        if mapped.get('title') or mapped.get('text'):
-                            return self._normalize_extracted_data(mapped, url, f"schema_org_{item_type_str}")
+            if doc is None: doc = self._get_doc(html_content)
+            # Fast path: most news sites publish their Article as JSON-LD, read straight from the shared document.
+            result = self._pick_schema_org_article(self._iter_json_ld(doc, _SCHEMA_ORG_TYPE_HINT_RE), url) # Stops decoding at the first NewsArticle
+            if result is not None: return result
+            # No itemscope anywhere, or only items typed as something other than an article: extruct could not help.
+            if not self._get_page_signals(doc)['has_article_microdata']: return None
+            # Microdata is the last hope; extruct walks the shared document instead of re-parsing the page.
+            data = extruct.extract(doc, base_url=urljoin(url, "/"), syntaxes=['microdata'], uniform=True)
+            return self._pick_schema_org_article(data.get('microdata', []), url)
         except Exception as e: self._log_event("ERROR", f"Schema.org parsing error: {e}", {"url":url});
         return None
 
-    async def _parse_with_general_ai(self, html_content: str, url: str) -> Optional[Dict[str, Any]]:
+    async def _parse_with_general_ai(self, html_content: str, url: str, needed: Optional[Set[str]] = None) -> Optional[Dict[str, Any]]:
+        """Runs crawl4ai on the page. When `needed` is given, only those result fields are mapped from its output."""
         if not self.crawler or AsyncWebCrawler is None or Url is None or CrawlerRunConfig is None:
             self._log_event("ERROR", "crawl4ai components not available for general AI parsing.", {"url": url}); return None
         self._log_event("INFO", f"Attempting general AI (crawl4ai) for {url}")
@@ -162,16 +944,21 @@ class Parser:
             # Configure for single-page processing, not deep crawling.
             # Assuming max_depth=0 or similar tells it to only process the provided content.
             # The exact parameters for CrawlerRunConfig might need adjustment based on crawl4ai's API.
-            config = CrawlerRunConfig(max_depth=0, max_pages=1)
-            # AsyncWebCrawler's equivalent of 'read' is often 'arun' or similar.
-            # It likely returns a list of results, even for a single URL.
-            results = await self.crawler.arun(seed_url=Url(url=url, html_content=html_content), crawler_run_config=config)
+            batch = _GENERAL_AI_BATCH.get()
+            if batch is not None: # Part of parse_contents_batch: crawled together with the batch's other fallbacks
+                results = await self._queue_general_ai(batch, url, html_content)
+            else:
+                config = CrawlerRunConfig(max_depth=0, max_pages=1)
+                # AsyncWebCrawler's equivalent of 'read' is often 'arun' or similar.
+                # It likely returns a list of results, even for a single URL.
+                results = await self.crawler.arun(seed_url=Url(url=url, html_content=html_content), crawler_run_config=config)
 
             # Process the first result if available
             if results and results.results and (results.results[0].text or results.results[0].metadata):
                 res = results.results[0]
-                ai_data = {'title': res.metadata.get('title'), 'text': res.text, 'date': res.metadata.get('date'),
+                ai_data = {'title': res.metadata.get('title'), 'text': res.text, 'published_date_utc': res.metadata.get('date'),
                            'authors': [res.metadata.get('author')] if res.metadata.get('author') else []}
+                if needed is not None: ai_data = {field: value for field, value in ai_data.items() if field in needed}
                 return self._normalize_extracted_data(ai_data, url, "general_ai")
             elif results and not results.results:
                  self._log_event("DEBUG", "General AI parsing returned no results.", {"url":url})
@@ -181,28 +968,247 @@ class Parser:
         except Exception as e: self._log_event("ERROR", f"General AI parsing error: {e}", {"url":url});
         return None
 
+    async def _queue_general_ai(self, batch: _GeneralAIBatch, url: str, html_content: str) -> Any:
+        """Adds the page to its batch and waits for the batch's crawl; the last page to arrive starts it."""
+        _GENERAL_AI_BATCH.set(None) # This task has queued; parse_contents_batch must not count it again
+        result = asyncio.get_running_loop().create_future()
+        batch.queued.append((url, html_content, result))
+        batch.running -= 1
+        if batch.running == 0: await self._flush_general_ai(batch)
+        return await result
+
+    async def _flush_general_ai(self, batch: _GeneralAIBatch) -> None:
+        """Runs every queued page of the batch through one arun_many call and hands each caller its own result."""
+        queued, batch.queued = batch.queued, []
+        if not queued: return
+        self._log_event("INFO", f"Running general AI (crawl4ai) for {len(queued)} page(s) in one batch.")
+        try:
+            seeds = [Url(url=url, html_content=html) for url, html, _ in queued]
+            config = CrawlerRunConfig(max_depth=0, max_pages=len(seeds))
+            arun_many = getattr(self.crawler, 'arun_many', None)
+            if arun_many is not None:
+                # arun_many does not promise input order: each page is matched to the result crawled for its own URL.
+                results_by_url = {}
+                for page_result in await arun_many(seeds, crawler_run_config=config) or ():
+                    result_url = _crawl_result_url(page_result)
+                    if result_url is not None: results_by_url.setdefault(result_url, page_result)
+                for url, _, future in queued: future.set_result(results_by_url.get(url))
+            else: # gather keeps input order
+                results = await asyncio.gather(*(self.crawler.arun(seed_url=seed, crawler_run_config=config) for seed in seeds))
+                for (_, _, future), page_result in zip(queued, results): future.set_result(page_result)
+        except Exception as e:
+            for _, _, future in queued:
+                if not future.done(): future.set_exception(e)
+        for _, _, future in queued: # A page without a matching result gets no output
+            if not future.done(): future.set_result(None)
+
+    async def parse_contents_batch(self, items: List[Tuple[str, str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        parse_content for many (html_content, url, source_config) items at once, results in input order.
+        Pages that fall back to general AI share a single crawl4ai arun_many call instead of one arun each.
+        """
+        batch = _GeneralAIBatch(running=len(items))
+
+        async def parse_one(html_content: str, url: str, source_config: Dict[str, Any]) -> Dict[str, Any]:
+            _GENERAL_AI_BATCH.set(batch)
+            try: return await self.parse_content(html_content, url, source_config)
+            finally:
+                if _GENERAL_AI_BATCH.get() is batch: # Finished without queuing; the rest may now be complete
+                    batch.running -= 1
+                    if batch.running == 0: await self._flush_general_ai(batch)
+
+        return list(await asyncio.gather(*(parse_one(*item) for item in items)))
+
+    def _generate_llm_schema(self, url: str, html_content: str) -> Optional[Dict[str, Any]]:
+        """Asks the LLM for a JsonCssExtractionStrategy schema describing the article page."""
+        self._log_event("INFO", f"Attempting LLM schema generation for {url}.")
+        # Define LLMConfig (ensure LLMConfig class is available)
+        current_llm_config = LLMConfig(provider="OpenAI/gpt-3.5-turbo", api_token="env:OPENAI_API_KEY") # Smaller model for schema gen
+
+        # Define Query
+        # TODO: Query might need to be more sophisticated, e.g. providing examples of desired output structure.
+        schema_gen_query = (
+            f"Generate an extraction schema for a news article from {url}. "
+            "The schema should identify and provide CSS selectors for the following fields: "
+            "title, text (main content), authors, published_date_utc (or any date field), and image_url (main article image if any). "
+            "Provide the output as a JSON object where keys are field names and values are CSS selectors. "
+            "If a field is not found, its selector can be null or an empty string."
+        )
+        try:
+            # generate_schema is a static method
+            self._log_event("DEBUG", f"Calling JsonCssExtractionStrategy.generate_schema for {url}")
+            return JsonCssExtractionStrategy.generate_schema(html=html_content, llm_config=current_llm_config, query=schema_gen_query)
+        except Exception as e:
+            self._log_event("ERROR", f"Error during JsonCssExtractionStrategy.generate_schema for {url}: {e}", {"exc_type": type(e).__name__})
+            return {"_isEmpty": True, "error": str(e)} # Mark as empty on error
+
+    def _record_llm_schema(self, source_name: str, url: str, new_generated_schema: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Persists the outcome of a schema generation via the planner; returns the schema if it is usable."""
+        if new_generated_schema and not new_generated_schema.get("_isEmpty"):
+            self._log_event("INFO", f"LLM successfully generated new schema for {url}.", {"schema": new_generated_schema})
+            if self.planner_ref:
+                self.planner_ref.update_source_extraction_selectors(source_name, new_generated_schema)
+                self.planner_ref.set_llm_analysis_flag(source_name, False, generated_new_selectors=True)
+                if hasattr(self.planner_ref, 'save_config'): self.planner_ref.save_config()
+            return new_generated_schema
+        self._log_event("WARNING", f"LLM schema generation failed or returned empty schema for {url}.", {"returned_schema": new_generated_schema})
+        if self.planner_ref:
+            # Store the empty/error schema to prevent retries if it's marked _isEmpty
+            if new_generated_schema and new_generated_schema.get("_isEmpty"):
+                self.planner_ref.update_source_extraction_selectors(source_name, new_generated_schema)
+            self.planner_ref.set_llm_analysis_flag(source_name, False, generated_new_selectors=False)
+            if hasattr(self.planner_ref, 'save_config'): self.planner_ref.save_config()
+        return None
+
+    def queue_llm_analysis(self, source_name: str, url: str, html_content: str) -> bool:
+        """
+        Queues a page for LLM schema generation. Pages from a source that is already queued,
+        being generated or already has a schema are ignored, since one schema serves the whole source.
+        Returns True once the queue holds a full batch and `flush_llm` should be awaited.
+        """
+        if (source_name not in self._llm_schema_cache and source_name not in self._llm_inflight
+                and all(queued[0] != source_name for queued in self._llm_queue)):
+            self._llm_queue.append((source_name, url, html_content))
+        return len(self._llm_queue) >= self._llm_batch_size
+
+    async def flush_llm(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Generates schemas for every queued source concurrently and caches them per source. Each source and
+        template is marked in flight before the first await, so concurrent callers wait for this flush.
+        """
+        queued, self._llm_queue = self._llm_queue, []
+        if not queued: return {}
+        self._log_event("INFO", f"Generating LLM schemas for {len(queued)} queued source(s).")
+        loop = asyncio.get_running_loop()
+        source_futures = {source_name: loop.create_future() for source_name, _, _ in queued}
+        self._llm_inflight.update(source_futures)
+        flushed: Dict[str, Optional[Dict[str, Any]]] = {}
+        try:
+            keys = [_content_key(html) for _, _, html in queued]
+            pending: Dict[Union[int, bytes], asyncio.Future] = {}
+            for key, (_, url, html) in zip(keys, queued):
+                if key in self._llm_template_cache or key in pending: continue
+                task = self._llm_template_inflight.get(key)
+                if task is None:
+                    task = asyncio.ensure_future(asyncio.to_thread(self._generate_llm_schema, url, html))
+                    self._llm_template_inflight[key] = task
+                pending[key] = task
+            generated = await asyncio.gather(*(asyncio.shield(task) for task in pending.values()))
+            for (key, task), raw_schema in zip(pending.items(), generated):
+                self._llm_template_cache[key] = raw_schema
+                if self._llm_template_inflight.get(key) is task: del self._llm_template_inflight[key]
+            for (source_name, url, _), key in zip(queued, keys):
+                schema = self._record_llm_schema(source_name, url, self._llm_template_cache[key])
+                flushed[source_name] = self._llm_schema_cache[source_name] = schema
+                source_futures[source_name].set_result(schema)
+        finally:
+            for source_name, future in source_futures.items():
+                if not future.done(): future.set_result(None) # Failed flush: waiters go without, a later page retries
+                if self._llm_inflight.get(source_name) is future: del self._llm_inflight[source_name]
+        return flushed
+
+    async def _get_llm_schema(self, source_name: str, url: str, html_content: str) -> Optional[Dict[str, Any]]:
+        if source_name in self._llm_schema_cache: return self._llm_schema_cache[source_name]
+        if source_name not in self._llm_inflight:
+            if not self.queue_llm_analysis(source_name, url, html_content):
+                await asyncio.sleep(0) # One loop turn lets pages of other sources parsed concurrently join this batch
+            if any(queued[0] == source_name for queued in self._llm_queue): await self.flush_llm()
+        inflight = self._llm_inflight.get(source_name)
+        if inflight is not None: await asyncio.shield(inflight) # Another page of this source is generating its schema
+        return self._llm_schema_cache.get(source_name)
+
+    def _parse_cache_key(self, html_content: str, url: str, source_config: Dict[str, Any]) -> str:
+        """
+        sha256 over the cache version, source name, URL, extraction selectors and page, each length-prefixed
+        so field boundaries cannot be shifted into a collision. Stable across runs, unlike hash().
+        """
+        digest = hashlib.sha256()
+        selectors = json.dumps(source_config.get("extraction_selectors") or {}, sort_keys=True, default=str)
+        for part in (str(_PARSE_CACHE_VERSION), source_config.get("name", "UnknownSource"), url, selectors, html_content):
+            data = part.encode('utf-8', 'surrogatepass')
+            digest.update(len(data).to_bytes(8, 'little')); digest.update(data)
+        return digest.hexdigest()
+
+    def _parse_cache_path(self, cache_key: str) -> Optional[Path]:
+        """<cache_dir>/<key[:2]>/<key>.json, or None when the on-disk cache is off."""
+        if self._parse_cache_dir is None: return None
+        return self._parse_cache_dir / cache_key[:2] / f"{cache_key}.json"
+
+    def _load_cached_parse(self, cache_path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(cache_path, 'rb') as f: entry = _json_loads(f.read()) # Bytes straight to the decoder, no str copy
+        except FileNotFoundError: return None
+        except (OSError, ValueError) as e:
+            self._log_event("WARNING", f"Unreadable parse cache entry {cache_path}: {e}"); return None
+        result = entry.get('result') if isinstance(entry, dict) else None
+        # Only entries with the full result shape are trusted; anything else is re-parsed and overwritten.
+        if not isinstance(result, dict) or not all(field in result for field in _RESULT_FIELDS) or not self._is_data_sufficient(result):
+            self._log_event("WARNING", f"Discarding malformed parse cache entry {cache_path}"); return None
+        if isinstance(result.get('published_date_utc'), str):
+            try: result['published_date_utc'] = _parse_iso_datetime(result['published_date_utc']) # Written by isoformat()
+            except ValueError: result['published_date_utc'] = None
+        return result
+
+    def _store_cached_parse(self, cache_path: Path, result: Dict[str, Any]) -> None:
+        entry = {"cached_at_utc": datetime.now(timezone.utc).isoformat(), "result": result}
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix('.tmp')
+            payload = (orjson.dumps(entry, default=_json_default) if orjson is not None
+                       else json.dumps(entry, ensure_ascii=False, default=_json_default).encode('utf-8'))
+            with open(tmp_path, 'wb') as f: f.write(payload)
+            os.replace(tmp_path, cache_path) # Readers never see a half-written entry
+        except (OSError, TypeError, ValueError) as e:
+            self._log_event("WARNING", f"Could not write parse cache entry {cache_path}: {e}")
+
     async def parse_content(self, html_content: str, url: str, source_config: Dict[str, Any]) -> Dict[str, Any]:
         source_config = source_config or {}
         source_name = source_config.get("name", "UnknownSource")
+        cache_key = self._parse_cache_key(html_content, url, source_config)
+        with self._lru_lock:
+            memoized = self._parse_memo.get(cache_key)
+            if memoized is not None: self._parse_memo.move_to_end(cache_key)
+        if memoized is not None:
+            self._log_event("DEBUG", f"Returning memoized parse result for {url}", {"source": source_name})
+            return copy.deepcopy(memoized)
+        cache_path = self._parse_cache_path(cache_key)
+        if cache_path is not None and (cached := self._load_cached_parse(cache_path)) is not None:
+            self._log_event("INFO", f"Returning cached parse result for {url}", {"source": source_name, "cache_path": str(cache_path)})
+            return cached
         self._log_event("INFO", f"Starting new article extraction strategy for {url}", {"source": source_name})
 
         final_result: Optional[Dict[str, Any]] = None
         extraction_schema_used: Optional[Any] = None # Can be selectors dict or string like "schema.org"
+        partial_result: Optional[Dict[str, Any]] = None # Best insufficient result; later strategies only fill its gaps
+
+        loop = asyncio.get_running_loop()
+        doc = await loop.run_in_executor(_STRATEGY_EXECUTOR, self._get_doc, html_content) # Parsed once, shared by every strategy below
+
+        custom_selectors = source_config.get("extraction_selectors")
+        # Heuristic: if selectors have keys like 'article_title_selector', it's old format.
+        is_likely_new_schema_format = bool(custom_selectors) and (not any(key.endswith("_selector") for key in custom_selectors.keys()) or custom_selectors.get("_is_json_css_schema"))
+        # Old-format CSS selectors don't depend on the Schema.org outcome, so run them alongside it. This includes
+        # `_is_json_css_schema` configs still carrying `*_selector` keys, whose CSS pass is the last fallback below.
+        custom_future = None
+        if custom_selectors and not custom_selectors.get("_isEmpty") and any(key.endswith("_selector") for key in custom_selectors.keys()):
+            custom_future = loop.run_in_executor(_STRATEGY_EXECUTOR, self._parse_with_custom_selectors, html_content, url, source_config, doc)
 
         # 1. Schema.org First
         self._log_event("DEBUG", f"Attempting Schema.org parsing for {url}")
-        result_schema = self._parse_with_schema_org(html_content, url)
+        result_schema = await loop.run_in_executor(_STRATEGY_EXECUTOR, self._parse_with_schema_org, html_content, url, doc)
         if self._is_data_sufficient(result_schema):
+            if custom_future is not None:
+                custom_future.cancel() # Schema.org wins; the speculative CSS result is not needed
             final_result = result_schema
             extraction_schema_used = "schema.org"
             self._log_event("INFO", f"Sufficient data extracted using Schema.org for {url}")
         else:
             self._log_event("DEBUG", f"Schema.org parsing did not yield sufficient data for {url}")
+            partial_result = result_schema
 
         # 2. Custom/LLM Selectors (if Schema.org failed or was insufficient)
         if not self._is_data_sufficient(final_result):
             self._log_event("DEBUG", f"Schema.org insufficient, proceeding to custom/LLM selectors for {url}")
-            custom_selectors = source_config.get("extraction_selectors")
             # Determine if LLM analysis should be considered
             # It's needed if:
             #   - No custom selectors exist OR custom selectors are marked as empty (e.g. from a previous failed LLM run)
@@ -223,12 +1229,13 @@ class Parser:
             #   The LLM block in parse_content will be addressed in a later subtask if it needs adjustment.
             #   The current subtask is only to remove StructureAnalyzer from __init__ and its direct references.
 
-            llm_components_available = bool(self.planner_ref and self.crawler and LLMConfig is not None and JsonCssExtractionStrategy is not None and Url is not None and CrawlerRunConfig is not None)
-
             needs_llm_analysis = (not custom_selectors or custom_selectors.get("_isEmpty", False)) and \
                                  source_config.get("llm_analysis_pending", True)
+            # Only checked when a schema is wanted, so sources with working selectors never construct the crawler.
+            llm_components_available = needs_llm_analysis and bool(self.planner_ref and self.crawler and LLMConfig is not None and JsonCssExtractionStrategy is not None and Url is not None and CrawlerRunConfig is not None)
 
             schema_to_use_for_extraction: Optional[Dict[str, Any]] = None
+            result_custom_old_format: Optional[Dict[str, Any]] = None
 
             # Strategy:
             # 1. If llm_analysis_pending is true: Try to generate a new schema.
@@ -237,75 +1244,31 @@ class Parser:
 
             if needs_llm_analysis:
                 if llm_components_available:
-                    self._log_event("INFO", f"Attempting LLM schema generation for {source_name} ({url}).")
-                    html_input_for_schema = source_config.get("html_snippet_for_schema_gen", html_content) # Use snippet if available
-
-                    # Define LLMConfig (ensure LLMConfig class is available)
-                    current_llm_config = LLMConfig(provider="OpenAI/gpt-3.5-turbo", api_token="env:OPENAI_API_KEY") # Smaller model for schema gen
-
-                    # Define Query
-                    # TODO: Query might need to be more sophisticated, e.g. providing examples of desired output structure.
-                    schema_gen_query = (
-                        f"Generate an extraction schema for a news article from {url}. "
-                        "The schema should identify and provide CSS selectors for the following fields: "
-                        "title, text (main content), authors, published_date_utc (or any date field), and image_url (main article image if any). "
-                        "Provide the output as a JSON object where keys are field names and values are CSS selectors. "
-                        "If a field is not found, its selector can be null or an empty string."
-                    )
-
-                    new_generated_schema: Optional[Dict[str, Any]] = None
-                    try:
-                        # generate_schema is a static method
-                        self._log_event("DEBUG", f"Calling JsonCssExtractionStrategy.generate_schema for {url}")
-                        new_generated_schema = JsonCssExtractionStrategy.generate_schema(
-                            html=html_input_for_schema,
-                            llm_config=current_llm_config,
-                            query=schema_gen_query
-                        )
-                    except Exception as e:
-                        self._log_event("ERROR", f"Error during JsonCssExtractionStrategy.generate_schema for {url}: {e}", {"exc_type": type(e).__name__})
-                        new_generated_schema = {"_isEmpty": True, "error": str(e)} # Mark as empty on error
-
-                    if new_generated_schema and not new_generated_schema.get("_isEmpty"):
-                        self._log_event("INFO", f"LLM successfully generated new schema for {url}.", {"schema": new_generated_schema})
-                        if self.planner_ref:
-                            self.planner_ref.update_source_extraction_selectors(source_name, new_generated_schema)
-                            self.planner_ref.set_llm_analysis_flag(source_name, False, generated_new_selectors=True)
-                            if hasattr(self.planner_ref, 'save_config'): self.planner_ref.save_config()
-                        schema_to_use_for_extraction = new_generated_schema
-                    else:
-                        self._log_event("WARNING", f"LLM schema generation failed or returned empty schema for {url}.", {"returned_schema": new_generated_schema})
-                        if self.planner_ref:
-                            # Store the empty/error schema to prevent retries if it's marked _isEmpty
-                            if new_generated_schema and new_generated_schema.get("_isEmpty"):
-                                self.planner_ref.update_source_extraction_selectors(source_name, new_generated_schema)
-                            self.planner_ref.set_llm_analysis_flag(source_name, False, generated_new_selectors=False)
-                            if hasattr(self.planner_ref, 'save_config'): self.planner_ref.save_config()
-                        # Do not set schema_to_use_for_extraction, rely on existing or fallback
+                    # Use snippet if available; otherwise only the DOM skeleton is worth the LLM's tokens.
+                    html_input_for_schema = source_config.get("html_snippet_for_schema_gen") or _skeletonize(doc)
+                    schema_to_use_for_extraction = await self._get_llm_schema(source_name, url, html_input_for_schema)
                 else: # llm_components_available is false
                      self._log_event("WARNING", f"LLM components (LLMConfig, JsonCssExtractionStrategy, Crawler, Planner) not available for {url}. Cannot generate new schema.", {"url": url})
 
             # If no new schema was generated (either because llm_analysis_pending was false, or generation failed),
             # try to use existing selectors if they are in the new JsonCssExtractionStrategy format.
             if not schema_to_use_for_extraction and custom_selectors and not custom_selectors.get("_isEmpty"):
-                # Heuristic: if selectors have keys like 'article_title_selector', it's old format.
                 # New format schemas are typically more complex dicts, might not have these specific top-level keys directly
                 # or might have a specific marker like "_schema_type": "JsonCssExtractionStrategy".
-                # For now, assume any non-_isEmpty custom_selectors could be a new schema.
                 # A more robust check for schema format might be needed.
-                is_likely_new_schema_format = not any(key.endswith("_selector") for key in custom_selectors.keys()) or custom_selectors.get("_is_json_css_schema")
-
                 if is_likely_new_schema_format:
                     self._log_event("INFO", f"Using existing JsonCssExtractionStrategy schema from source_config for {url}")
                     schema_to_use_for_extraction = custom_selectors
                 else:
                     # This is where we'd use the old _parse_with_custom_selectors if selectors are in old format
                     self._log_event("INFO", f"Existing selectors for {url} appear to be in old format. Attempting with _parse_with_custom_selectors.")
-                    result_custom_old_format = self._parse_with_custom_selectors(html_content, url, source_config)
+                    result_custom_old_format = await custom_future
                     if self._is_data_sufficient(result_custom_old_format):
                         final_result = result_custom_old_format
                         extraction_schema_used = custom_selectors # old format dict
                         self._log_event("INFO", f"Sufficient data extracted using existing old-format custom CSS for {url}")
+                    elif result_custom_old_format:
+                        partial_result = self._merge_partial(result_custom_old_format, partial_result) if partial_result else result_custom_old_format
 
 
             # Attempt extraction if a JsonCssExtractionStrategy schema is available (either newly generated or from config)
@@ -331,7 +1294,7 @@ class Parser:
                             extracted_data_str = crawl_results.results[0].extracted_content
                             extracted_data_dict = {}
                             try:
-                                extracted_data_dict = json.loads(extracted_data_str)
+                                extracted_data_dict = _json_loads(extracted_data_str)
                                 if not isinstance(extracted_data_dict, dict): # Ensure it's a dict
                                      self._log_event("ERROR", f"JsonCssExtractionStrategy output is not a dict: {type(extracted_data_dict)}", {"url": url})
                                      extracted_data_dict = {"error_message": "Extracted content was not a JSON dictionary."}
@@ -345,6 +1308,7 @@ class Parser:
                             if self._is_data_sufficient(result_from_llm_schema):
                                 final_result = result_from_llm_schema
                                 extraction_schema_used = schema_to_use_for_extraction # Store the schema dict itself
+                                if custom_future is not None: custom_future.cancel() # The CSS fallback is no longer needed
                                 self._log_event("INFO", f"Sufficient data extracted using JsonCssExtractionStrategy for {url}")
                             else:
                                 self._log_event("WARNING", f"JsonCssExtractionStrategy did not yield sufficient data for {url}", {"extracted_fields": list(extracted_data_dict.keys())})
@@ -359,54 +1323,32 @@ class Parser:
                  self._log_event("WARNING", f"LLM analysis was needed for {url} but components are not available. Skipping LLM schema generation and extraction.", {"url": url})
 
             # If, after all LLM/JsonCss attempts, no sufficient data, and old custom selectors haven't been tried yet
-            # (e.g. if schema_to_use_for_extraction was None, and is_likely_new_schema_format was false earlier but didn't yield results)
-            if not self._is_data_sufficient(final_result) and custom_selectors and not custom_selectors.get("_isEmpty"):
-                is_likely_old_format = any(key.endswith("_selector") for key in custom_selectors.keys())
-                if is_likely_old_format:
-                    self._log_event("INFO", f"Re-attempting with _parse_with_custom_selectors as fallback for {url}")
-                    result_custom_old_format_fallback = self._parse_with_custom_selectors(html_content, url, source_config)
-                    if self._is_data_sufficient(result_custom_old_format_fallback):
-                        final_result = result_custom_old_format_fallback
-                        extraction_schema_used = custom_selectors # old format dict
-                        self._log_event("INFO", f"Sufficient data extracted using fallback old-format custom CSS for {url}")
-                        if self.planner_ref:
-                             self.planner_ref.update_source_extraction_selectors(source_name, new_selectors)
-                             # Also mark llm_analysis_pending as False because we have new selectors
-                             self.planner_ref.set_llm_analysis_flag(source_name, False, generated_new_selectors=True)
-                             if hasattr(self.planner_ref, 'save_config'): self.planner_ref.save_config()
-
-                        current_source_config_for_llm_parse = {**source_config, "extraction_selectors": new_selectors}
-                        result_after_llm = self._parse_with_custom_selectors(html_content, url, current_source_config_for_llm_parse)
-
-                        if self._is_data_sufficient(result_after_llm):
-                            final_result = result_after_llm
-                            extraction_schema_used = new_selectors # Store the new selectors
-                            self._log_event("INFO", f"Sufficient data extracted using LLM-generated selectors for {url}")
-                        else:
-                            self._log_event("DEBUG", f"LLM-generated selectors did not yield sufficient data for {url}")
-                            # Optional: If LLM selectors fail immediately, consider them "bad"
-                            # and potentially revert or mark them as _isEmpty. For now, they are saved.
-                    elif new_selectors and new_selectors.get("_isEmpty", False):
-                        self._log_event("WARNING", f"LLM indicated no good selectors could be generated for {url}. Marking to prevent retries.")
-                        if self.planner_ref:
-                            self.planner_ref.update_source_extraction_selectors(source_name, new_selectors) # Save the _isEmpty state
-                            self.planner_ref.set_llm_analysis_flag(source_name, False, generated_new_selectors=False)
-                            if hasattr(self.planner_ref, 'save_config'): self.planner_ref.save_config()
-                    else: # new_selectors is None or some other falsey value
-                        self._log_event("WARNING", f"LLM selector generation failed or returned no selectors for {url}. Marking to prevent retries.")
-                        if self.planner_ref:
-                            self.planner_ref.set_llm_analysis_flag(source_name, False, generated_new_selectors=False)
-                            if hasattr(self.planner_ref, 'save_config'): self.planner_ref.save_config()
-                else: # llm_can_run is false
-                     self._log_event("WARNING", f"LLM components (StructureAnalyzer or Planner reference) not available for {url}. Cannot generate selectors.", {"url": url})
-            elif not self._is_data_sufficient(final_result) and needs_llm_analysis and not llm_can_run:
-                 self._log_event("WARNING", f"LLM analysis was needed for {url} but components are not available.", {"url": url})
-
+            # (e.g. a schema flagged `_is_json_css_schema` that still carries old-format `*_selector` keys)
+            if not self._is_data_sufficient(final_result) and result_custom_old_format is None and custom_future is not None:
+                self._log_event("INFO", f"Re-attempting with _parse_with_custom_selectors as fallback for {url}")
+                result_custom_old_format_fallback = await custom_future # Started alongside Schema.org, off the event loop
+                if self._is_data_sufficient(result_custom_old_format_fallback):
+                    final_result = result_custom_old_format_fallback
+                    extraction_schema_used = custom_selectors # old format dict
+                    self._log_event("INFO", f"Sufficient data extracted using fallback old-format custom CSS for {url}")
+                elif result_custom_old_format_fallback:
+                    partial_result = self._merge_partial(result_custom_old_format_fallback, partial_result) if partial_result else result_custom_old_format_fallback
+
+
+        # Partial results from Schema.org and custom CSS may complement each other.
+        if not self._is_data_sufficient(final_result) and self._is_data_sufficient(partial_result):
+            final_result = partial_result
+            extraction_schema_used = "merged_partial"
+            self._log_event("INFO", f"Sufficient data extracted by merging partial results for {url}", {"method": partial_result.get('extraction_method')})
 
         # 3. Fallback to General AI (if other methods failed or were insufficient)
         if not self._is_data_sufficient(final_result):
             self._log_event("INFO", f"Falling back to General AI parsing for {url} as other methods were insufficient.")
-            result_general_ai = await self._parse_with_general_ai(html_content, url)
+            # With a partial result in hand, crawl4ai only has to supply the missing fields.
+            needed = self._missing_fields(partial_result) if partial_result else None
+            result_general_ai = await self._parse_with_general_ai(html_content, url, needed=needed)
+            if partial_result and result_general_ai:
+                result_general_ai = self._merge_partial(partial_result, result_general_ai)
             if self._is_data_sufficient(result_general_ai):
                 final_result = result_general_ai
                 extraction_schema_used = "general_ai"
@@ -417,6 +1359,13 @@ class Parser:
                 self._log_event("DEBUG", f"Partial data extracted using General AI for {url} (used as best available).")
             else:
                 self._log_event("DEBUG", f"General AI parsing did not yield sufficient data for {url}")
+                if partial_result and not final_result:
+                    final_result = partial_result
+
+        # Missing authors alone never justify another strategy; the meta tag is read with a regex instead.
+        if self._is_data_sufficient(final_result) and not final_result.get('authors'):
+            meta_authors = self._extract_meta_authors(html_content, doc) # This page's tree, even if other pages were parsed meanwhile
+            if meta_authors: final_result = {**final_result, 'authors': meta_authors}
 
         # 4. Finalize and Return
         timestamp = datetime.now(timezone.utc).isoformat()
@@ -429,6 +1378,11 @@ class Parser:
                 "timestamp_utc": timestamp
             }
             self._log_event("INFO", f"Successfully extracted sufficient data for {url}", {"method_used_final": final_result.get('extraction_method'), "schema_details": extraction_schema_used})
+            memoized = copy.deepcopy(output)
+            with self._lru_lock:
+                self._parse_memo[cache_key] = memoized
+                while len(self._parse_memo) > _PARSE_MEMO_SIZE: self._parse_memo.popitem(last=False)
+            if cache_path is not None: self._store_cached_parse(cache_path, output)
             return output
         else:
             self._log_event("WARNING", f"No sufficient data extracted for {url} after all attempts.", {"url": url})
@@ -445,29 +1399,28 @@ class Parser:
                 "timestamp_utc": timestamp
             }
 
-    def find_rss_links_in_html(self, html_content: str, base_url: str) -> List[str]:
+    def find_rss_links_in_html(self, html_content: str, base_url: str, soup: Optional[BeautifulSoup] = None) -> List[str]:
         rss_links: List[str] = []
         if not html_content:
             self._log_event("DEBUG", "No HTML content provided to find_rss_links_in_html.", {"base_url": base_url})
             return rss_links
-        found_hrefs: set[str] = set()
+        if soup is None and not _RSS_TYPE_HINT_RE.search(html_content):
+            self._log_event("DEBUG", "No RSS MIME type in page, skipping RSS link parsing.", {"base_url": base_url})
+            return rss_links
         try:
-            soup = BeautifulSoup(html_content, 'lxml')
-            all_link_tags = soup.find_all('link')
-            for tag in all_link_tags:
-                tag_type_attr = tag.get('type')
-                tag_rel_attr = tag.get('rel', [])
-                rel_values: set[str] = set()
-                if isinstance(tag_rel_attr, str): rel_values = {tag_rel_attr.lower()}
-                elif isinstance(tag_rel_attr, list): rel_values = {r.lower() for r in tag_rel_attr if isinstance(r, str)}
-                is_rss_type = isinstance(tag_type_attr, str) and 'application/rss+xml' in tag_type_attr.lower()
-                is_alternate_rel = 'alternate' in rel_values
-                if is_rss_type and is_alternate_rel:
-                    href_attr = tag.get('href')
-                    if isinstance(href_attr, str) and href_attr.strip():
-                        full_url = urljoin(base_url, href_attr.strip())
-                        if full_url not in found_hrefs:
-                            rss_links.append(full_url); found_hrefs.add(full_url)
+            hrefs: List[Any]
+            # Each slot is read once: another page's parse may replace it at any moment.
+            cached_doc, cached_soup = self._doc_cache, self._soup_cache
+            if soup is None and cached_doc is not None and cached_doc[0] is html_content:
+                hrefs = _RSS_LINK_HREF_XPATH(cached_doc[1]) # The page's lxml tree is already built; filter in libxml2
+            elif soup is not None or (cached_soup is not None and cached_soup[0] is html_content):
+                hrefs = [tag.get('href') for tag in _RSS_LINK_SOUPSIEVE.select(soup if soup is not None else cached_soup[1])]
+            elif LexborHTMLParser is not None:
+                # No shared tree to reuse: lexbor's C selector engine is cheaper still than building an lxml tree.
+                hrefs = [node.attributes.get('href') for node in LexborHTMLParser(html_content).css(_RSS_LINK_SELECTOR)]
+            else: hrefs = _RSS_LINK_HREF_XPATH(self._get_doc(html_content))
+            # dict.fromkeys keeps first-seen order while dropping duplicates.
+            rss_links = list(dict.fromkeys(urljoin(base_url, stripped) for href in hrefs if isinstance(href, str) and (stripped := href.strip())))
             if not rss_links: self._log_event("DEBUG", "No RSS links matching primary criteria found.", {"base_url": base_url})
             else: self._log_event("DEBUG", f"Found {len(rss_links)} RSS links.", {"base_url": base_url, "links": rss_links})
         except Exception as e:
@@ -477,60 +1430,97 @@ class Parser:
     def find_sitemap_links_in_robots(self, robots_txt_content: str) -> List[str]:
         sitemap_links: List[str] = []
         if not robots_txt_content: return sitemap_links
-        try:
-            for line in robots_txt_content.splitlines():
-                if line.strip().lower().startswith('sitemap:'):
-                    parts = line.split(':', 1)
-                    if len(parts) > 1 and parts[1].strip(): sitemap_links.append(parts[1].strip())
+        try: sitemap_links = _ROBOTS_SITEMAP_RE.findall(robots_txt_content)
         except Exception as e: self._log_event("ERROR", f"robots.txt sitemap link parsing error: {e}")
-        return list(set(sitemap_links))
-
-    def parse_rss_feed(self, feed_xml_content: str, feed_url: str) -> List[Dict[str, Any]]:
-        if not feed_xml_content: return []
-        parsed = feedparser.parse(feed_xml_content) # type: ignore[reportUnknownMemberType]
-        if parsed.get("bozo", False): self._log_event("WARNING", f"Ill-formed RSS feed {feed_url}", {"exc": str(parsed.get("bozo_exception", "Unknown"))})
+        return list(dict.fromkeys(sitemap_links))
+
+    def _parse_feed_with_lxml(self, feed_xml_content: Union[str, bytes], feed_url: str) -> Optional[List[Dict[str, Any]]]:
+        """Reads plain RSS 2.0 / Atom entries with an lxml pull parser. Returns None for other shapes; raises on malformed XML."""
+        # Only entry elements are reported; str input is fed as-is, so it is never re-encoded into a second copy.
+        pull_parser = etree.XMLPullParser(events=('end',), tag=('item', _ATOM_NS + 'entry'), resolve_entities=False, no_network=True)
+        pull_parser.feed(feed_xml_content)
+        root = pull_parser.close()
+        if root.tag == 'rss': is_atom = False
+        elif root.tag == _ATOM_NS + 'feed': is_atom = True
+        else: return None
         items: List[Dict[str, Any]] = []
-        for entry in parsed.entries:
-            link = entry.get('link')
+        for _, entry in pull_parser.read_events():
+            if not is_atom and entry.getparent().tag != 'channel': continue # Stray <item> outside rss/channel
+            # Child text by local tag name; only used for the lookups below, never kept on the item.
+            # itertext() so markup nested in a child (RSS titles with stray tags) keeps its text, not just the text before it.
+            raw = {child.tag.rpartition('}')[2]: ''.join(child.itertext()).strip() for child in entry if isinstance(child.tag, str)}
+            if is_atom:
+                # feedparser keeps and sanitizes the markup of (x)html text constructs; leave such feeds to it.
+                if _ATOM_MARKUP_TITLE_XPATH(entry): return None
+                hrefs = _ATOM_ALTERNATE_HREF_XPATH(entry)
+                raw['link'] = hrefs[0] if hrefs else None
+                entry_id, date_text = raw.get('id'), raw.get('published') or raw.get('updated')
+            else:
+                entry_id, date_text = raw.get('guid'), raw.get('pubDate') or raw.get('date')
+            link = raw.get('link')
             if not link: continue
-            date_struct = entry.get('published_parsed') or entry.get('updated_parsed')
-            items.append({"id": entry.get('id', link), "link": link, "title": entry.get('title'),
-                          "published_date_utc": self._parse_generic_date_to_utc(date_struct), # context_url removed
-                          "source_feed_url": feed_url, "feed_entry_raw": dict(entry)})
+            items.append({"id": entry_id or link, "link": link, "title": raw.get('title'),
+                          "published_date_utc": _parse_date_str(date_text) if date_text else None,
+                          "source_feed_url": feed_url})
         return items
 
-    def parse_sitemap(self, sitemap_xml_content: str, sitemap_url: str) -> Optional[Dict[str, Any]]:
+    def parse_rss_feed(self, feed_xml_content: Union[str, bytes], feed_url: str) -> List[Dict[str, Any]]:
+        if not feed_xml_content: return []
+        feed_url = sys.intern(feed_url) # Items from every poll of this feed share one URL object, as do the cache keys
+        content_key = _content_key(feed_xml_content)
+        cached = self._feed_cache.get(feed_url)
+        if cached is not None and cached[0] == content_key:
+            self._log_event("DEBUG", f"RSS feed unchanged since last poll: {feed_url}")
+            return [dict(item) for item in cached[1]]
+        try: items = self._parse_feed_with_lxml(feed_xml_content, feed_url)
+        except (etree.XMLSyntaxError, ValueError): items = None # Ill-formed or exotic feeds go through feedparser's lenient parser
+        if items is None:
+            parsed = feedparser.parse(feed_xml_content) # type: ignore[reportUnknownMemberType]
+            if parsed.get("bozo", False): self._log_event("WARNING", f"Ill-formed RSS feed {feed_url}", {"exc": str(parsed.get("bozo_exception", "Unknown"))})
+            # No copy of the full FeedParserDict is kept on the item; nothing downstream reads it.
+            # feedparser's *_parsed values are always struct_time or None, so their converter is called directly.
+            items = [{"id": entry.get('id') or link, "link": link, "title": entry.get('title'),
+                      "published_date_utc": _struct_time_to_utc(parsed_time[:6])
+                      if (parsed_time := entry.get('published_parsed') or entry.get('updated_parsed')) else None,
+                      "source_feed_url": feed_url}
+                     for entry in parsed.entries if (link := entry.get('link'))]
+        self._feed_cache[feed_url] = (content_key, items)
+        return [dict(item) for item in items]
+
+    def parse_sitemap(self, sitemap_xml_content: Union[str, bytes], sitemap_url: str) -> Optional[Dict[str, Any]]:
         if not sitemap_xml_content:
             self._log_event("WARNING", "Sitemap XML content is empty.", {"sitemap_url": sitemap_url})
             return None
+        sitemap_url = sys.intern(sitemap_url) # Referenced by every SitemapItem, across repeated fetches too
         try:
-            soup = BeautifulSoup(sitemap_xml_content, 'xml')
-            sitemap_index_tag = soup.find('sitemapindex')
-            if sitemap_index_tag:
-                sitemap_urls: List[str] = []
-                for sitemap_tag_entry in sitemap_index_tag.find_all('sitemap', recursive=False):
-                    if not isinstance(sitemap_tag_entry, Tag): continue
-                    loc_tag = sitemap_tag_entry.find('loc')
-                    if loc_tag and isinstance(loc_tag, Tag) and loc_tag.string:
-                        loc_text = loc_tag.string.strip()
-                        if loc_text: sitemap_urls.append(loc_text)
+            # Feed the pull parser in slices so decoded text is never re-encoded whole; huge_tree lifts libxml2's size caps.
+            pull_parser = etree.XMLPullParser(events=('end',), tag=('{*}url', '{*}sitemap'), recover=True, huge_tree=True)
+            sitemap_urls: List[str] = []
+            items_data: List[SitemapItem] = []
+            for offset in range(0, len(sitemap_xml_content), _SITEMAP_FEED_CHUNK):
+                pull_parser.feed(sitemap_xml_content[offset:offset + _SITEMAP_FEED_CHUNK])
+                for _, elem in pull_parser.read_events():
+                    parent = elem.getparent()
+                    if parent is None: continue
+                    parent_name, entry_name = parent.tag.rpartition('}')[2], elem.tag.rpartition('}')[2]
+                    loc_text = (elem.findtext('{*}loc') or '').strip()
+                    if loc_text and parent_name == 'sitemapindex' and entry_name == 'sitemap':
+                        sitemap_urls.append(loc_text)
+                    elif loc_text and parent_name == 'urlset' and entry_name == 'url':
+                        lastmod_text = (elem.findtext('{*}lastmod') or '').strip()
+                        lastmod_utc = _parse_date_str(lastmod_text) if lastmod_text else None
+                        items_data.append(SitemapItem(loc_text, lastmod_utc, sitemap_url))
+                    # Drop processed entries so memory stays flat on multi-MB sitemaps.
+                    elem.clear()
+                    while elem.getprevious() is not None: del parent[0]
+            root = pull_parser.close()
+            root_name = root.tag.rpartition('}')[2] if root is not None else None
+            if root_name == 'sitemapindex':
                 if sitemap_urls:
                     return {'type': 'sitemap_index', 'sitemap_urls': sitemap_urls, 'source_sitemap_url': sitemap_url}
                 else: return None
-            urlset_tag = soup.find('urlset')
-            if urlset_tag:
-                items_data: List[Dict[str, Any]] = []
-                for url_tag_entry in urlset_tag.find_all('url', recursive=False):
-                    if not isinstance(url_tag_entry, Tag): continue
-                    loc_tag = url_tag_entry.find('loc')
-                    if not (loc_tag and isinstance(loc_tag, Tag) and loc_tag.string and loc_tag.string.strip()):
-                        continue
-                    current_loc = loc_tag.string.strip()
-                    lastmod_utc: Optional[datetime] = None
-                    lastmod_tag = url_tag_entry.find('lastmod')
-                    if lastmod_tag and isinstance(lastmod_tag, Tag) and lastmod_tag.string and lastmod_tag.string.strip():
-                        lastmod_utc = self._parse_generic_date_to_utc(lastmod_tag.string.strip()) # context_url removed
-                    items_data.append({'loc': current_loc, 'lastmod_utc': lastmod_utc, 'source_sitemap_url': sitemap_url})
+            if root_name == 'urlset':
+                self._log_event("DEBUG", f"Parsed {len(items_data)} sitemap entries.", {"sitemap_url": sitemap_url, "date_cache": _parse_date_str.cache_info()._asdict()})
                 return {'type': 'urlset', 'items': items_data, 'source_sitemap_url': sitemap_url}
             self._log_event("WARNING", "Sitemap XML not recognized as index or urlset.", {"sitemap_url": sitemap_url})
             return None
@@ -540,20 +1530,30 @@ class Parser:
 
     def parse_crawl_delay(self, robots_txt_content: str, target_user_agent:str ="*") -> Optional[float]:
         if not robots_txt_content: return None
-        lines = robots_txt_content.splitlines(); specific_delay, wildcard_delay = None, None
-        in_target_agent_block, in_wildcard_block = False, False
-        for line in lines:
-            line = line.strip().lower()
-            if line.startswith('user-agent:'):
-                agent = line.split(':',1)[1].strip()
-                in_target_agent_block = (agent == target_user_agent.lower())
-                in_wildcard_block = (agent == '*')
-            elif line.startswith('crawl-delay:'):
-                try:
-                    delay = float(line.split(':',1)[1].strip())
-                    if in_target_agent_block: specific_delay = delay; break
-                    if in_wildcard_block: wildcard_delay = delay
-                except ValueError: pass
+        target_agent = target_user_agent.lower()
+        cache_key = (_content_key(robots_txt_content), target_agent)
+        if cache_key not in self._crawl_delay_cache:
+            self._crawl_delay_cache[cache_key] = self._scan_crawl_delay(robots_txt_content, target_agent)
+        return self._crawl_delay_cache[cache_key]
+
+    def _scan_crawl_delay(self, robots_txt_content: str, target_agent: str) -> Optional[float]:
+        specific_delay, wildcard_delay = None, None
+        in_target_agent_block, in_wildcard_block, after_agent_line = False, False, False
+        for match in _ROBOTS_DIRECTIVE_RE.finditer(robots_txt_content):
+            agent, delay_str = match.group('agent', 'delay')
+            if agent is not None:
+                agent = agent.lower()
+                # Consecutive User-agent lines open one group that applies to each of them.
+                if not after_agent_line: in_target_agent_block = in_wildcard_block = False
+                in_target_agent_block |= (agent == target_agent)
+                in_wildcard_block |= (agent == '*')
+                after_agent_line = True
+                continue
+            after_agent_line = False
+            if delay_str is None: continue # Allow/Disallow rule
+            delay = float(delay_str) # The pattern only captures well-formed decimals
+            if in_target_agent_block: specific_delay = delay; break
+            if in_wildcard_block: wildcard_delay = delay
         return specific_delay if specific_delay is not None else wildcard_delay
 
     async def fetch_robots_txt(self, domain_url: str) -> Optional[str]:
@@ -563,17 +1563,16 @@ class Parser:
         robots_url = urljoin(domain_url, "/robots.txt")
         self._log_event("INFO", f"Fetching robots.txt from {robots_url}")
         try:
-            async with httpx.AsyncClient(follow_redirects=True, timeout=10.0) as client:
-                response = await client.get(robots_url)
-                if response.status_code == 200:
-                    self._log_event("INFO", f"Successfully fetched robots.txt for {domain_url}", {"status_code": response.status_code})
-                    return response.text
-                elif response.status_code == 404:
-                    self._log_event("INFO", f"robots.txt not found for {domain_url}", {"status_code": response.status_code})
-                    return None
-                else:
-                    self._log_event("WARNING", f"Failed to fetch robots.txt for {domain_url}", {"status_code": response.status_code})
-                    return None
+            response = await self._get_http_client().get(robots_url)
+            if response.status_code == 200:
+                self._log_event("INFO", f"Successfully fetched robots.txt for {domain_url}", {"status_code": response.status_code})
+                return response.text[:_ROBOTS_MAX_CHARS]
+            elif response.status_code == 404:
+                self._log_event("INFO", f"robots.txt not found for {domain_url}", {"status_code": response.status_code})
+                return None
+            else:
+                self._log_event("WARNING", f"Failed to fetch robots.txt for {domain_url}", {"status_code": response.status_code})
+                return None
         except httpx.RequestError as e:
             self._log_event("ERROR", f"Network error fetching robots.txt for {domain_url}: {e}", {"url": robots_url})
             return None
@@ -585,8 +1584,15 @@ class Parser:
         """
         Parses the content of a robots.txt file.
         """
+        robots_content = robots_content[:_ROBOTS_MAX_CHARS] # No copy when the file is within the cap
+        self._robots_fetched_at[domain_url] = time.monotonic()
+        content_key = _content_key(robots_content)
+        if self._robots_content_keys.get(domain_url) == content_key and domain_url in self.robot_parsers:
+            self._log_event("DEBUG", f"robots.txt for {domain_url} unchanged, reusing its parser")
+            return self.robot_parsers[domain_url]
         rfp = RobotFileParser(url=domain_url) # Provide domain_url as per documentation for context
         rfp.parse(robots_content.splitlines())
+        self.robot_parsers[domain_url], self._robots_content_keys[domain_url] = rfp, content_key
         self._log_event("INFO", f"Parsed robots.txt content for {domain_url}")
         # Further analysis like rfp.disallow_all or rfp.allow_all can be logged if needed
         return rfp
@@ -605,19 +1611,35 @@ class Parser:
             self._log_event("ERROR", f"Error parsing seed_url for robots.txt handling: {e}", {"seed_url": seed_url})
             return None
 
-        if domain_url in self.robot_parsers:
+        cached = self._cached_robot_parser(domain_url)
+        if cached is not None: return cached
+
+        loop = asyncio.get_running_loop()
+        if self._robots_locks_loop is not loop: self._robots_locks, self._robots_locks_loop = {}, loop
+        async with self._robots_locks.setdefault(domain_url, asyncio.Lock()):
+            # Another seed of this domain may have fetched it while this one waited for the lock
+            cached = self._cached_robot_parser(domain_url)
+            if cached is not None: return cached
+            return await self._fetch_robot_parser(domain_url)
+
+    def _cached_robot_parser(self, domain_url: str) -> Optional[RobotFileParser]:
+        """The cached RobotFileParser of `domain_url` while it is within the TTL, else None."""
+        fetched_at = self._robots_fetched_at.get(domain_url)
+        if domain_url in self.robot_parsers and (fetched_at is None or time.monotonic() - fetched_at < self._robots_ttl_seconds):
             self._log_event("DEBUG", f"Reusing cached RobotFileParser for {domain_url}")
             return self.robot_parsers[domain_url]
+        return None
 
+    async def _fetch_robot_parser(self, domain_url: str) -> Optional[RobotFileParser]:
+        """Fetches and parses the robots.txt of `domain_url`, caching a permissive parser when there is none."""
         robots_content = await self.fetch_robots_txt(domain_url)
         if robots_content:
             try:
-                rfp = self.parse_robots_content(robots_content, domain_url)
-                self.robot_parsers[domain_url] = rfp
+                rfp = self.parse_robots_content(robots_content, domain_url) # Also caches it and records the fetch time
                 # Example: Log disallowed paths for common user-agent
                 # This is illustrative; can_fetch will be the primary use.
                 # For now, just confirm it's parsed.
-                self._log_event("INFO", f"robots.txt processed for {domain_url}. Rules now available.", {"disallow_all": rfp.disallow_all("*"), "allow_all": rfp.allow_all("*")})
+                self._log_event("INFO", f"robots.txt processed for {domain_url}. Rules now available.", {"disallow_all": rfp.disallow_all, "allow_all": rfp.allow_all})
                 return rfp
             except Exception as e:
                 self._log_event("ERROR", f"Error parsing robots.txt content for {domain_url}: {e}")
@@ -633,9 +1655,19 @@ class Parser:
             # Create a default, permissive RobotFileParser instance
             default_rfp = RobotFileParser(url=domain_url)
             default_rfp.allow_all = True # Explicitly set allow all
-            self.robot_parsers[domain_url] = default_rfp # Cache this default one
+            self.robot_parsers[domain_url] = default_rfp # Cache this default one, so the domain is not re-requested until the TTL
+            self._robots_fetched_at[domain_url] = time.monotonic()
+            self._robots_content_keys.pop(domain_url, None) # The cached parser no longer reflects any fetched file
             return default_rfp
 
+    def _robots_can_fetch(self, robot_parser: RobotFileParser) -> Callable[[str], bool]:
+        """can_fetch("*", url) of `robot_parser`, through a cached _RobotsMatcher when it is a stock RobotFileParser."""
+        if type(robot_parser) is not RobotFileParser: return functools.partial(robot_parser.can_fetch, "*")
+        matcher = self._robots_matchers.get(robot_parser)
+        if matcher is None or matcher.mtime != robot_parser.mtime(): # parse() was called again since it was built
+            matcher = self._robots_matchers[robot_parser] = _RobotsMatcher(robot_parser, "*")
+        return matcher.can_fetch
+
     def extract_and_filter_links(
         self,
         base_url: str,
@@ -651,85 +1683,81 @@ class Parser:
             self._log_event("DEBUG", "No HTML content provided to extract_and_filter_links.", {"base_url": base_url})
             return []
 
-        initial_links: List[str] = []
+        # Deduplicated on their canonical form (_canonical_url) as links are collected; the first URL seen for each
+        # canonical form is the one kept, as sites may route on query order or parameters _canonical_url drops.
+        initial_links: Dict[str, str] = {}
+        # base_url is split once; most hrefs are then joined against its origin without urljoin re-parsing it.
+        base_split = urlsplit(base_url)
+        origin = f"{base_split.scheme}://{base_split.netloc}" if base_split.scheme in ('http', 'https') and base_split.netloc else None
         try:
-            soup = BeautifulSoup(html_content, 'lxml')
-            for anchor_tag in soup.find_all('a', href=True):
-                href = anchor_tag['href']
-                if href and isinstance(href, str) and not href.startswith(('javascript:', 'mailto:', '#')):
+            hrefs: List[Any]
+            # Each slot is read once: another page's parse may replace it at any moment.
+            cached_doc, cached_soup = self._doc_cache, self._soup_cache
+            if cached_doc is not None and cached_doc[0] is html_content:
+                hrefs = _ANCHOR_HREF_XPATH(cached_doc[1]) # The page's lxml tree is already built
+            elif cached_soup is not None and cached_soup[0] is html_content:
+                hrefs = [anchor_tag['href'] for anchor_tag in cached_soup[1].find_all('a', href=True)]
+            elif len(html_content) >= _STREAM_ANCHORS_MIN_CHARS: hrefs = _stream_anchor_hrefs(html_content)
+            elif LexborHTMLParser is not None:
+                # Only the anchors are needed; lexbor's C parser and selector engine beat building any full tree for them.
+                hrefs = [node.attributes.get('href') for node in LexborHTMLParser(html_content).css('a[href]')]
+            else: hrefs = _ANCHOR_HREF_XPATH(self._get_doc(html_content))
+            if len(hrefs) > _MAX_ANCHORS_PER_PAGE:
+                self._log_event("DEBUG", f"Page has {len(hrefs)} anchors; only the first {_MAX_ANCHORS_PER_PAGE} are used.", {"base_url": base_url})
+                hrefs = hrefs[:_MAX_ANCHORS_PER_PAGE]
+            for href in hrefs:
+                if href and isinstance(href, str) and len(href) <= _MAX_HREF_CHARS and not href.startswith(('javascript:', 'mailto:', '#')):
                     try:
-                        absolute_url = urljoin(base_url, href.strip())
-                        # Basic validation of the joined URL structure
-                        parsed_absolute_url = urlparse(absolute_url)
-                        if parsed_absolute_url.scheme and parsed_absolute_url.netloc:
-                             initial_links.append(absolute_url)
+                        stripped_href = href.strip()
+                        absolute_url = _fast_join_href(origin, stripped_href) if origin is not None else None
+                        if absolute_url is not None: initial_links.setdefault(_canonical_url(absolute_url), absolute_url) # Always has a scheme and host
                         else:
-                            self._log_event("DEBUG", f"Skipping malformed URL after join: {absolute_url}", {"original_href": href, "base_url": base_url})
+                            absolute_url = urljoin(base_url, stripped_href)
+                            if len(absolute_url) > _MAX_HREF_CHARS: continue # A long base_url can still push it over
+                            # Basic validation of the joined URL structure
+                            split_absolute_url = urlsplit(absolute_url)
+                            if split_absolute_url.scheme and split_absolute_url.netloc:
+                                 initial_links.setdefault(_canonical_url(absolute_url), absolute_url)
+                            elif self._debug_enabled:
+                                self._log_event("DEBUG", f"Skipping malformed URL after join: {absolute_url}", {"original_href": href, "base_url": base_url})
                     except Exception as e: # Catch errors during urljoin or parsing
-                        self._log_event("DEBUG", f"Error joining or parsing URL: {href}", {"base_url": base_url, "error": str(e)})
+                        if self._debug_enabled: self._log_event("DEBUG", f"Error joining or parsing URL: {href}", {"base_url": base_url, "error": str(e)})
         except Exception as e:
             self._log_event("ERROR", f"Error parsing HTML content for link extraction: {e}", {"base_url": base_url})
             return [] # Return empty if HTML parsing fails
 
-        # Deduplicate after initial extraction
-        extracted_links = sorted(list(set(initial_links)))
-        self._log_event("DEBUG", f"Extracted {len(extracted_links)} unique links initially.", {"base_url": base_url, "count_before_robots": len(extracted_links)})
-
-        # Filter links based on robots.txt
-        links_after_robots = []
-        if respect_robots and robot_parser:
-            for link in extracted_links:
+        extracted_links = initial_links.values()
+        self._log_event("DEBUG", f"Extracted {len(extracted_links)} unique links initially.", {"base_url": base_url, "count_before_pattern": len(extracted_links)})
+
+        can_fetch: Optional[Callable[[str], bool]] = None
+        if respect_robots and robot_parser: can_fetch = self._robots_can_fetch(robot_parser)
+        elif respect_robots:
+            self._log_event("DEBUG", "robots.txt respect enabled but no parser provided. Skipping robots filter.", {"base_url": base_url})
+
+        # One pass applies both filters. The combined exclusion regex runs first: one search per link is far cheaper
+        # than a robots.txt lookup, and both filters are pure, so the order does not change the result.
+        kept_links: List[str] = []
+        excluded_count = 0
+        for link in extracted_links:
+            if _EXCLUDED_LINK_RE.search(link):
+                excluded_count += 1
+                continue
+            if can_fetch is not None:
                 try:
-                    if robot_parser.can_fetch("*", link):
-                        links_after_robots.append(link)
-                    else:
-                        self._log_event("DEBUG", f"Link disallowed by robots.txt: {link}", {"base_url": base_url})
-                except Exception as e: # Catch potential errors in can_fetch implementations
+                    if not can_fetch(link):
+                        if self._debug_enabled: self._log_event("DEBUG", f"Link disallowed by robots.txt: {link}", {"base_url": base_url})
+                        continue
+                except Exception as e: # Catch potential errors in can_fetch implementations; the link is then allowed
                     self._log_event("WARNING", f"Error during robots.txt can_fetch for link {link}: {e}", {"base_url": base_url})
-                    links_after_robots.append(link) # Default to allowing if can_fetch errors
-            self._log_event("DEBUG", f"Retained {len(links_after_robots)} links after robots.txt filtering.", {"base_url": base_url, "count_after_robots": len(links_after_robots)})
-        else:
-            links_after_robots = extracted_links
-            if respect_robots and not robot_parser:
-                 self._log_event("DEBUG", "robots.txt respect enabled but no parser provided. Skipping robots filter.", {"base_url": base_url})
-
-
-        # Filter links with URLPatternFilter
-        links_after_pattern_filter = []
-        if URLPatternFilter is not None: # Check if class was imported
-            # Define a list of exclusion patterns
-            exclude_patterns = [
-                r"/login", r"/signin", r"/register", r"/signup",
-                r"/tag/", r"/user/", r"/profile/", r"/account/",
-                r"/search", r"/privacy", r"/terms", r"/contact", r"/about",
-                r"/\?replytocom=", r"/wp-json/", r"/feed/$", r"/comments/feed/$",
-                r"\.pdf$", r"\.zip$", r"\.jpg$", r"\.jpeg$", r"\.png$", r"\.gif$", r"\.css$", r"\.js$",
-                r"archive\.org/web/" # Example: exclude archive.org wayback machine links
-            ]
-            try:
-                # Assuming URLPatternFilter expects list of strings. If it needs Url objects:
-                # url_objects_to_filter = [Url(url=link_str) for link_str in links_after_robots]
-                # filtered_url_objects = url_filter.filter(url_objects_to_filter)
-                # links_after_pattern_filter = [uo.url for uo in filtered_url_objects]
-
-                # Current assumption: URLPatternFilter takes list of strings and returns list of strings
-                url_filter = URLPatternFilter(patterns=exclude_patterns, exclude=True) # exclude=True means remove matching patterns
-                links_after_pattern_filter = url_filter.filter(links_after_robots)
-                self._log_event("DEBUG", f"Retained {len(links_after_pattern_filter)} links after URLPatternFilter.", {"base_url": base_url, "count_after_pattern": len(links_after_pattern_filter)})
-            except Exception as e:
-                self._log_event("ERROR", f"Error applying URLPatternFilter: {e}", {"base_url": base_url})
-                links_after_pattern_filter = links_after_robots # Fallback to pre-filter list
-        else:
-            self._log_event("WARNING", "URLPatternFilter not available, skipping pattern filtering.", {"base_url": base_url})
-            links_after_pattern_filter = links_after_robots
+            kept_links.append(link)
 
-
-        # Final deduplication
-        final_links = sorted(list(set(links_after_pattern_filter)))
-        self._log_event("INFO", f"Link extraction complete for {base_url}. Initial: {len(extracted_links)}, After robots: {len(links_after_robots)}, After patterns: {len(links_after_pattern_filter)}, Final: {len(final_links)}",
+        # Links are already unique; sort once for a stable output order.
+        kept_links.sort()
+        count_after_patterns = len(extracted_links) - excluded_count
+        self._log_event("INFO", f"Link extraction complete for {base_url}. Initial: {len(extracted_links)}, After patterns: {count_after_patterns}, After robots: {len(kept_links)}, Final: {len(kept_links)}",
                         {"base_url": base_url})
 
-        return final_links
+        return kept_links
 
     def score_and_select_links(
         self,
@@ -747,70 +1775,28 @@ class Parser:
         num_initial_links = len(links)
         self._log_event("DEBUG", f"Starting link scoring for {num_initial_links} links.", {"top_n": top_n, "relevance_threshold": relevance_threshold})
 
-        # Check if crawl4ai components are available
-        if not all([Url, KeywordRelevanceScorer, PathDepthScorer, CompositeScorer]):
-            self._log_event("WARNING", "crawl4ai scorer components not available. Skipping scoring.",
-                            {"available": {"Url": Url is not None, "KeywordRelevanceScorer": KeywordRelevanceScorer is not None,
-                                           "PathDepthScorer": PathDepthScorer is not None, "CompositeScorer": CompositeScorer is not None}})
-            # Fallback: return top_n links without scoring if top_n is specified, else all links
-            return links[:top_n] if top_n is not None else links
-
         try:
-            # Convert URL strings to Url objects
-            try:
-                url_objects = [Url(url=link_str) for link_str in links]
-            except Exception as e:
-                self._log_event("ERROR", f"Failed to convert link strings to Url objects: {e}", {"links_sample": links[:5]})
-                # Fallback if Url object creation fails
-                return links[:top_n] if top_n is not None else links
-
-            # Initialize Scorers
-            # Keywords can be expanded or customized based on typical content sought
-            keyword_scorer = KeywordRelevanceScorer(
-                keywords=["news", "article", "story", "post", "blog", "report", "update", "analysis", "breaking", "latest",
-                          "headline", "summary", "release", "bulletin", "journal", "chronicle", "review", "insight",
-                          # Date related keywords could be useful if they appear in paths
-                          "2023", "2024", "jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"],
-                weight=0.6
-            )
-            path_depth_scorer = PathDepthScorer(weight=0.4) # Favor shallower paths
-            composite_scorer = CompositeScorer(scorers=[keyword_scorer, path_depth_scorer])
-
-            # Score Links
-            # Assuming composite_scorer.score modifies Url objects in-place by adding a .score attribute
-            # or returns new Url objects with .score. If it returns (score, Url_object) tuples, this needs adjustment.
-            # For now, let's assume it returns a list of Url objects, each with a .score attribute.
-            # Based on typical crawl4ai patterns, score() might return a list of the same Url objects, now scored.
-            scored_url_objects = composite_scorer.score(url_objects) # This might modify url_objects or return a new list
-
-            # Sort Url objects by score in descending order
-            # Ensure objects have a 'score' attribute; provide default if not
-            for uo in scored_url_objects:
-                if not hasattr(uo, 'score') or uo.score is None:
-                    uo.score = 0.0 # Default score if not set by scorer
-
-            scored_url_objects.sort(key=lambda uo: uo.score, reverse=True)
-
-            selected_urls = scored_url_objects
-            num_after_scoring = len(selected_urls)
-
-            # Filter by relevance_threshold
+            # Scores are plain floats computed straight from the strings.
+            scored_links = [(_score_link(link), link) for link in links]
+            num_after_scoring = len(scored_links)
+
+            # Filter by relevance_threshold before ranking, so fewer links are ranked
             if relevance_threshold is not None:
-                selected_urls = [uo for uo in selected_urls if uo.score >= relevance_threshold]
-                self._log_event("DEBUG", f"{len(selected_urls)} links after relevance threshold ({relevance_threshold}). Originally {num_after_scoring}.",
-                                {"threshold": relevance_threshold, "retained_count": len(selected_urls)})
+                scored_links = [pair for pair in scored_links if pair[0] >= relevance_threshold]
+                self._log_event("DEBUG", f"{len(scored_links)} links after relevance threshold ({relevance_threshold}). Originally {num_after_scoring}.",
+                                {"threshold": relevance_threshold, "retained_count": len(scored_links)})
 
-            num_after_threshold = len(selected_urls)
+            num_after_threshold = len(scored_links)
 
-            # Select top_n
+            # Rank; both orderings are stable, so ties keep page order. nlargest only keeps a top_n-sized heap.
             if top_n is not None:
-                selected_urls = selected_urls[:top_n]
-                self._log_event("DEBUG", f"Selected top {len(selected_urls)} links (max {top_n}). Originally {num_after_threshold}.",
-                                {"top_n": top_n, "final_selected_count": len(selected_urls)})
-
+                scored_links = heapq.nlargest(top_n, scored_links, key=itemgetter(0))
+                self._log_event("DEBUG", f"Selected top {len(scored_links)} links (max {top_n}). Originally {num_after_threshold}.",
+                                {"top_n": top_n, "final_selected_count": len(scored_links)})
+            else:
+                scored_links.sort(key=itemgetter(0), reverse=True)
 
-            # Convert selected Url objects back to URL strings
-            final_link_strings = [uo.url for uo in selected_urls]
+            final_link_strings = [link for _, link in scored_links]
 
             self._log_event("INFO", f"Link scoring and selection complete. Initial: {num_initial_links}, Scored: {num_after_scoring}, After threshold: {num_after_threshold}, Final selected: {len(final_link_strings)}",
                             {"top_n": top_n, "relevance_threshold": relevance_threshold})
@@ -826,7 +1812,8 @@ class Parser:
     async def filter_by_content_type(self, links: List[str]) -> List[str]:
         """
         Filters a list of URLs based on their Content-Type header.
-        Only allows types like 'text/html' or 'text/plain'.
+        Only allows types like 'text/html' or 'text/plain'. Links whose path already implies HTML
+        (see _likely_html) are kept without a HEAD request.
         """
         if not links:
             self._log_event("DEBUG", "No links provided to filter_by_content_type.")
@@ -835,53 +1822,48 @@ class Parser:
         num_initial_links = len(links)
         self._log_event("DEBUG", f"Starting content-type filtering for {num_initial_links} links.")
 
-        if ContentTypeFilter is None:
-            self._log_event("WARNING", "ContentTypeFilter not available. Skipping content-type filtering.")
-            return links
+        # Reuses the parser's shared keep-alive client for all requests
+        client = self._get_http_client()
+        # HEAD requests run concurrently, bounded overall and per host so no single site sees a burst.
+        overall_limit = asyncio.Semaphore(_HEAD_CONCURRENCY)
+        host_limits: Dict[str, asyncio.Semaphore] = {}
 
-        # Initialize ContentTypeFilter with allowed types
-        # These are common types for web pages; can be expanded (e.g., application/xhtml+xml)
-        try:
-            content_type_filter = ContentTypeFilter(allowed_types=["text/html", "text/plain", "application/xhtml+xml"])
-        except Exception as e:
-            self._log_event("ERROR", f"Failed to initialize ContentTypeFilter: {e}. Skipping content-type filtering.")
-            return links
-
-        valid_links: List[str] = []
-
-        # Using a single AsyncClient for all requests
-        async with httpx.AsyncClient(follow_redirects=True, timeout=10.0) as client:
-            for link_url_str in links:
-                try:
-                    self._log_event("DEBUG", f"Checking content-type for: {link_url_str}")
+        async def check(link_url_str: str) -> Optional[str]:
+            if _likely_html(link_url_str): return link_url_str
+            host_limit = host_limits.setdefault(urlparse(link_url_str).netloc, asyncio.Semaphore(_HEAD_CONCURRENCY_PER_HOST))
+            try:
+                async with host_limit, overall_limit:
+                    if self._debug_enabled: self._log_event("DEBUG", f"Checking content-type for: {link_url_str}")
                     response = await client.head(link_url_str)
-                    response.raise_for_status() # Raise an exception for 4XX or 5XX status codes
+                    if response.status_code in _HEAD_REFUSED_STATUSES or (response.is_success and not response.headers.get('content-type')):
+                        # HEAD refused or uninformative: ask for the first byte instead. Streaming reads only the
+                        # headers, and leaving the block closes the response even if the Range was ignored.
+                        async with client.stream('GET', link_url_str, headers={'Range': 'bytes=0-0'}) as response: pass
+                response.raise_for_status() # Raise an exception for 4XX or 5XX status codes
+
+                content_type_header = response.headers.get('content-type')
+                if not content_type_header:
+                    if self._debug_enabled: self._log_event("DEBUG", f"No content-type header for {link_url_str}. Skipping.", {"url": link_url_str})
+                    return None
 
-                    content_type_header = response.headers.get('content-type')
-                    if not content_type_header:
-                        self._log_event("DEBUG", f"No content-type header for {link_url_str}. Skipping.", {"url": link_url_str})
-                        continue
+                # Normalize content type: lowercase and take the part before any semicolon (e.g., charset)
+                normalized_content_type = content_type_header.lower().split(';')[0].strip()
 
-                    # Normalize content type: lowercase and take the part before any semicolon (e.g., charset)
-                    normalized_content_type = content_type_header.lower().split(';')[0].strip()
-
-                    # Use ContentTypeFilter.is_allowed_by_type (or similar method)
-                    # Assuming is_allowed_by_type takes the string content type.
-                    # If ContentTypeFilter is designed to work on Url objects with pre-fetched headers,
-                    # the call might be different, e.g., content_type_filter.filter([Url(url=link_url_str, headers=response.headers)])
-                    # For now, proceeding with the assumption of a direct check method.
-                    if content_type_filter.is_allowed_by_type(normalized_content_type):
-                        valid_links.append(link_url_str)
-                        self._log_event("DEBUG", f"Allowed content-type '{normalized_content_type}' for {link_url_str}", {"url": link_url_str})
-                    else:
-                        self._log_event("DEBUG", f"Disallowed content-type '{normalized_content_type}' for {link_url_str}", {"url": link_url_str})
+                if normalized_content_type in _ALLOWED_CONTENT_TYPES:
+                    if self._debug_enabled: self._log_event("DEBUG", f"Allowed content-type '{normalized_content_type}' for {link_url_str}", {"url": link_url_str})
+                    return link_url_str
+                if self._debug_enabled: self._log_event("DEBUG", f"Disallowed content-type '{normalized_content_type}' for {link_url_str}", {"url": link_url_str})
+
+            except httpx.HTTPStatusError as e:
+                if self._debug_enabled: self._log_event("DEBUG", f"HTTP status error checking content-type for {link_url_str}: {e.response.status_code}", {"url": link_url_str, "error": str(e)})
+            except httpx.RequestError as e: # Covers network errors, timeouts, etc.
+                if self._debug_enabled: self._log_event("DEBUG", f"Request error checking content-type for {link_url_str}: {type(e).__name__}", {"url": link_url_str, "error": str(e)})
+            except Exception as e: # Catch any other unexpected errors
+                self._log_event("WARNING", f"Unexpected error checking content-type for {link_url_str}: {e}", {"url": link_url_str, "exc_type": type(e).__name__})
+            return None
 
-                except httpx.HTTPStatusError as e:
-                    self._log_event("DEBUG", f"HTTP status error checking content-type for {link_url_str}: {e.response.status_code}", {"url": link_url_str, "error": str(e)})
-                except httpx.RequestError as e: # Covers network errors, timeouts, etc.
-                    self._log_event("DEBUG", f"Request error checking content-type for {link_url_str}: {type(e).__name__}", {"url": link_url_str, "error": str(e)})
-                except Exception as e: # Catch any other unexpected errors
-                    self._log_event("WARNING", f"Unexpected error checking content-type for {link_url_str}: {e}", {"url": link_url_str, "exc_type": type(e).__name__})
+        # gather keeps the input order of the links.
+        valid_links: List[str] = [link for link in await asyncio.gather(*(check(link) for link in links)) if link is not None]
 
         num_final_links = len(valid_links)
         self._log_event("INFO", f"Content-type filtering complete. Initial: {num_initial_links}, Final allowed: {num_final_links}",
@@ -956,6 +1938,8 @@ class Parser:
             respect_robots=respect_robots
         )
         self._log_event("INFO", f"Extracted {len(candidate_links)} candidate links from {seed_url_str}.", {"count": len(candidate_links)})
+        seen_article_urls = self._seen_article_urls
+        candidate_links = [link for link in candidate_links if _canonical_url(link) not in seen_article_urls]
 
         scored_links = self.score_and_select_links(
             links=candidate_links,
@@ -963,43 +1947,50 @@ class Parser:
             relevance_threshold=relevance_threshold
         )
         self._log_event("INFO", f"Scored and selected {len(scored_links)} links (top_n={top_n_links}, threshold={relevance_threshold}).", {"count": len(scored_links)})
+        # Claimed before the first await, so a concurrent seed that scored the same links cannot select them too.
+        scored_links = [link for link in scored_links if self._claim_article_url(link)]
 
         final_article_urls = await self.filter_by_content_type(links=scored_links)
         self._log_event("INFO", f"Content-type filtering resulted in {len(final_article_urls)} final article URLs.", {"count": len(final_article_urls)})
+        kept_urls = set(final_article_urls)
+        for link in scored_links:
+            if link not in kept_urls: self._release_article_url(link)
 
         if not final_article_urls:
             self._log_event("INFO", f"No suitable article links found or selected from seed URL {seed_url_str} after all filtering stages.")
             # Option: Parse the seed URL itself as an article if no links are found/selected
             # This behavior can be added if desired. For now, we only process discovered links.
 
-        # 4. Process Selected Article Links
-        for article_url_str in final_article_urls:
-            try:
-                self._log_event("INFO", f"Processing discovered article link: {article_url_str}", {"source_seed": seed_url_str})
-
-                # Check robots.txt for each article_url_str individually as well if respect_robots is True
-                # This is because extract_and_filter_links already does this, but good for defense-in-depth
-                # or if links came from a source not yet checked by robots.txt (not the case here).
-                # For this flow, links are already robot-checked by extract_and_filter_links.
-
-                article_html_content: Optional[str] = None
-                article_final_url = article_url_str # Initialize with the URL to be processed
-
-                article_page_data_list = await self.crawler.arun(
-                    seed_url=Url(url=article_url_str),
-                    crawler_run_config=CrawlerRunConfig(max_depth=0, max_pages=1, store_content=True, allow_redirects=True)
-                )
-
-                if article_page_data_list and article_page_data_list.results and article_page_data_list.results[0].content:
-                    article_html_content = article_page_data_list.results[0].content
-                    article_final_url = article_page_data_list.results[0].url # Update URL if redirected
-                    if article_final_url != article_url_str:
-                         self._log_event("DEBUG", f"Article URL redirected from {article_url_str} to {article_final_url}")
-                else:
-                    self._log_event("WARNING", f"Failed to fetch content for article link: {article_url_str}", {"url": article_url_str})
-                    continue # Skip to next article if content fetch fails
+        # 4. Process Selected Article Links, up to self._article_concurrency of them at once
+        article_limit = asyncio.Semaphore(self._article_concurrency)
+
+        async def process_article(article_url_str: str) -> Optional[Dict[str, Any]]:
+            async with article_limit:
+                fetched = False
+                try:
+                    self._log_event("INFO", f"Processing discovered article link: {article_url_str}", {"source_seed": seed_url_str})
+
+                    # Links are already robot-checked by extract_and_filter_links, so they are not re-checked here.
+
+                    article_html_content: Optional[str] = None
+                    article_final_url = article_url_str # Initialize with the URL to be processed
+
+                    article_page_data_list = await self.crawler.arun(
+                        seed_url=Url(url=article_url_str),
+                        crawler_run_config=CrawlerRunConfig(max_depth=0, max_pages=1, store_content=True, allow_redirects=True)
+                    )
+
+                    if article_page_data_list and article_page_data_list.results and article_page_data_list.results[0].content:
+                        article_html_content = article_page_data_list.results[0].content
+                        article_final_url = article_page_data_list.results[0].url # Update URL if redirected
+                        fetched = True
+                        if article_final_url != article_url_str:
+                             self._log_event("DEBUG", f"Article URL redirected from {article_url_str} to {article_final_url}")
+                    else:
+                        self._log_event("WARNING", f"Failed to fetch content for article link: {article_url_str}", {"url": article_url_str})
+                        self._release_article_url(article_url_str) # A later seed may retry it
+                        return None
 
-                if article_html_content:
                     article_data = await self.parse_content(
                         html_content=article_html_content,
                         url=article_final_url, # Use the final URL after potential redirects
@@ -1007,15 +1998,19 @@ class Parser:
                     )
                     # Check for sufficiency based on primary fields (title and text)
                     if article_data and article_data.get("title") and article_data.get("text"):
-                        extracted_articles.append(article_data)
                         self._log_event("INFO", f"Successfully extracted article from {article_final_url}",
                                         {"title": article_data.get("title"), "original_url": article_url_str})
-                    else:
-                        self._log_event("WARNING", f"No sufficient data extracted from {article_final_url} after parsing.",
-                                        {"url": article_final_url, "original_url": article_url_str})
-            except Exception as e:
-                self._log_event("ERROR", f"Error processing article link {article_url_str}: {e}",
-                                {"url": article_url_str, "exc_type": type(e).__name__, "error_details": str(e)})
+                        return article_data
+                    self._log_event("WARNING", f"No sufficient data extracted from {article_final_url} after parsing.",
+                                    {"url": article_final_url, "original_url": article_url_str})
+                except Exception as e:
+                    self._log_event("ERROR", f"Error processing article link {article_url_str}: {e}",
+                                    {"url": article_url_str, "exc_type": type(e).__name__, "error_details": str(e)})
+                    if not fetched: self._release_article_url(article_url_str)
+                return None
+
+        # gather keeps the order of final_article_urls.
+        extracted_articles = [article for article in await asyncio.gather(*(process_article(url) for url in final_article_urls)) if article is not None]
 
         self._log_event("INFO", f"Completed processing for seed URL {seed_url_str}. Extracted {len(extracted_articles)} articles from discovered links.",
                         {"seed_url": seed_url_str, "extracted_count": len(extracted_articles)})
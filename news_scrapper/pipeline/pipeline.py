@@ -4,15 +4,32 @@ The Pipeline is responsible for managing the queue of items (articles) to be pro
 storing the parsed results to files, and potentially triggering downstream tasks.
 """
 import collections
+import hashlib
 import json
 import os
 import re
 import time # For fallback item ID if needed
-from datetime import datetime # For processed_timestamp_utc, though main.py adds this
+from datetime import datetime, timezone # For processed_timestamp_utc, though main.py adds this
+
+try:
+    import orjson # type: ignore[reportMissingImports]
+except ImportError:
+    orjson = None # type: ignore
+
+try:
+    import xxhash # type: ignore[reportMissingImports]
+except ImportError:
+    xxhash = None # type: ignore
+
+try:
+    from pybloom_live import ScalableBloomFilter # type: ignore[reportMissingImports]
+except ImportError:
+    ScalableBloomFilter = None # type: ignore
 
 # Attempt to import config values
 try:
-    from ..config import RESULTS_DIR, MAX_RESULTS_TO_STORE_IN_MEMORY # Corrected to ..config
+    from ..config import (RESULTS_DIR, MAX_RESULTS_TO_STORE_IN_MEMORY, PRETTY_PRINT_RESULTS, # Corrected to ..config
+                          RESULTS_FORMAT, RESULTS_BATCH_MAX_BYTES, RESULTS_BATCH_MAX_ITEMS, USE_BLOOM_SEEN_STORE)
 except ImportError: # Likely running pipeline.py directly or config is not in python path
     print("Pipeline: Could not import from ..config, using default result storage settings.")
     # Define defaults if config import fails (e.g. for standalone testing)
@@ -20,6 +37,87 @@ except ImportError: # Likely running pipeline.py directly or config is not in py
     # For now, assume it might be set by main.py or test environment
     RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scraped_results_pipeline_default")
     MAX_RESULTS_TO_STORE_IN_MEMORY = 100
+    PRETTY_PRINT_RESULTS = False
+    RESULTS_FORMAT = "json"
+    RESULTS_BATCH_MAX_BYTES = 64 << 20
+    RESULTS_BATCH_MAX_ITEMS = 50_000
+    USE_BLOOM_SEEN_STORE = False
+
+
+def _json_default(o):
+    """Serializes datetimes as ISO-8601 strings; anything else unserializable becomes null."""
+    if isinstance(o, datetime):
+        return o.isoformat()
+
+
+# Seen-item keys a Pipeline expects over its lifetime unless told otherwise.
+_DEFAULT_EXPECTED_ITEMS = 100_000
+
+
+def _key_digest(key):
+    """64-bit digest of a seen-item key: xxh3_64 when xxhash is installed, otherwise an 8-byte blake2b."""
+    data = str(key).encode('utf-8')
+    if xxhash is not None: return xxhash.xxh3_64_intdigest(data)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+
+class _SeenDigests:
+    """
+    Exact set of seen item keys that keeps each key's 64-bit digest (a small int) instead of the key string.
+    Collisions are negligible below billions of keys.
+    """
+    __slots__ = ('_digests',)
+
+    def __init__(self):
+        self._digests = set()
+
+    def __contains__(self, key):
+        return _key_digest(key) in self._digests
+
+    def add(self, key):
+        self._digests.add(_key_digest(key))
+
+    def __len__(self):
+        return len(self._digests)
+
+
+def _new_seen_store(expected_items=_DEFAULT_EXPECTED_ITEMS, bloom=False):
+    """
+    Membership store for seen item keys: an exact _SeenDigests, or with bloom=True (and pybloom_live installed)
+    a scalable bloom filter of about 2 bytes per key that skips 0.1% of new keys as false positives. The bloom
+    filter is sized for expected_items up front, so a crawl of that size stays in one sub-filter and each lookup
+    probes one bit array. Python sets cannot be pre-sized, so the hint does not apply to _SeenDigests.
+    """
+    if bloom and ScalableBloomFilter is not None:
+        return ScalableBloomFilter(initial_capacity=expected_items, error_rate=0.001)
+    return _SeenDigests()
+
+
+def _write_json_file(filepath, data, pretty=False):
+    """
+    Writes data as UTF-8 JSON, compact or (pretty) indented, through orjson when it is installed (same output
+    as json.dump). orjson serializes the whole document first, so the file gets a single write.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        payload = orjson.dumps(data, default=_json_default, option=option)
+        with open(filepath, 'wb') as f:
+            f.write(payload)
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2 if pretty else None, separators=None if pretty else (',', ':'),
+                      ensure_ascii=False, default=_json_default)
+
+
+# Write buffer of an open jsonl batch file; lines reach the OS once this fills, not once per article.
+_BATCH_BUFFER_BYTES = 1 << 20
+
+
+def _json_line(data):
+    """Serializes data as one compact UTF-8 JSON line (newline-terminated bytes), through orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=_json_default) + '\n').encode('utf-8')
 
 
 class Pipeline:
@@ -27,7 +125,8 @@ class Pipeline:
     Manages the workflow of item processing, from queuing to storing results as JSON files.
     Items are typically dictionaries containing article metadata from RSS feeds or parsed pages.
     """
-    def __init__(self, monitor_instance=None, results_output_dir=None, max_results_in_memory=None):
+    def __init__(self, monitor_instance=None, results_output_dir=None, max_results_in_memory=None, expected_items=None,
+                 pretty_print=None, results_format=None, batch_max_bytes=None, batch_max_items=None, bloom_seen_store=None):
         """
         Initializes the Pipeline.
         Sets up a queue for items and a list to store recent results (or references).
@@ -35,14 +134,38 @@ class Pipeline:
             monitor_instance (Monitor, optional): An instance of the Monitor component.
             results_output_dir (str, optional): Directory to save JSON results. Defaults to config.RESULTS_DIR.
             max_results_in_memory (int, optional): Max items to keep in self.processed_results. Defaults to config.MAX_RESULTS_TO_STORE_IN_MEMORY.
+            expected_items (int, optional): Number of distinct items expected, used to size the seen-item store.
+            pretty_print (bool, optional): Write indented rather than compact JSON. Defaults to config.PRETTY_PRINT_RESULTS.
+            results_format (str, optional): "json" for one file per article or "jsonl" for rolling batch files.
+                                            Defaults to config.RESULTS_FORMAT.
+            batch_max_bytes (int, optional): Size at which a jsonl batch file is rolled. Defaults to config.RESULTS_BATCH_MAX_BYTES.
+            batch_max_items (int, optional): Item count at which a jsonl batch file is rolled. Defaults to config.RESULTS_BATCH_MAX_ITEMS.
+            bloom_seen_store (bool, optional): Track seen items in a lossy bloom filter instead of an exact store.
+                                               Defaults to config.USE_BLOOM_SEEN_STORE.
         """
         self.item_queue = collections.deque()
-        self.seen_item_ids = set() # To avoid processing duplicate items based on their ID
         self.monitor = monitor_instance
+        self.expected_items = expected_items if expected_items is not None else _DEFAULT_EXPECTED_ITEMS
+        self.bloom_seen_store = bloom_seen_store if bloom_seen_store is not None else USE_BLOOM_SEEN_STORE
+        if self.bloom_seen_store and ScalableBloomFilter is None:
+            self._log_event("WARNING", "Bloom seen-item store requested but pybloom_live is not installed; using the exact store.")
+            self.bloom_seen_store = False
+        self.seen_item_ids = _new_seen_store(self.expected_items, self.bloom_seen_store) # To avoid processing duplicate items based on their ID
 
         self.processed_results_in_memory = [] # Stores recent full items or references
         self.results_output_dir = results_output_dir if results_output_dir is not None else RESULTS_DIR
         self.max_results_in_memory = max_results_in_memory if max_results_in_memory is not None else MAX_RESULTS_TO_STORE_IN_MEMORY
+        self.pretty_print = pretty_print if pretty_print is not None else PRETTY_PRINT_RESULTS
+        self.results_format = results_format if results_format is not None else RESULTS_FORMAT
+        if self.results_format not in ("json", "jsonl"):
+            raise ValueError(f"Unknown results_format {self.results_format!r}; expected 'json' or 'jsonl'.")
+        self.batch_max_bytes = batch_max_bytes if batch_max_bytes is not None else RESULTS_BATCH_MAX_BYTES
+        self.batch_max_items = batch_max_items if batch_max_items is not None else RESULTS_BATCH_MAX_ITEMS
+        self._batch_file = None # Open jsonl batch file, created on the first stored result
+        self._batch_path = None
+        self._batch_bytes = 0
+        self._batch_items = 0
+        self._batch_seq = 0
 
         self._ensure_results_dir()
         self._log_event("INFO", f"Pipeline initialized. Results will be saved to: {self.results_output_dir}")
@@ -107,6 +230,9 @@ class Pipeline:
             self.seen_item_ids.add(seen_key)
             self._log_event("DEBUG", "Added item to queue.",
                             {"id": item_id, "link": item_link, "seen_key": seen_key, "queue_size": len(self.item_queue)})
+        elif self.bloom_seen_store: # The bloom filter may be wrong; leave a trace of every item it drops
+            self._log_event("INFO", "Item already seen or a bloom-filter false positive, skipping.",
+                            {"id": item_id, "link": item_link, "seen_key": seen_key})
         else:
             self._log_event("DEBUG", "Item already seen or in queue (based on link/id), skipping.",
                             {"id": item_id, "link": item_link, "seen_key": seen_key})
@@ -143,6 +269,10 @@ class Pipeline:
             self._log_event("WARNING", "Article data missing 'link', 'url', and 'id'. Using timestamp as identifier.",
                             {"title": article_data.get('title', 'N/A')})
 
+        if self.results_format == "jsonl":
+            self._append_batch_line(article_data, article_identifier)
+            return
+
         filename_base = self._sanitize_filename(article_identifier)
         filename = filename_base + ".json"
         filepath = os.path.join(self.results_output_dir, filename)
@@ -150,29 +280,75 @@ class Pipeline:
         log_details = {"filepath": filepath, "article_id": article_identifier, "title": article_data.get("title", "N/A")}
 
         try:
-            # Ensure all datetime objects are ISO formatted strings before saving to JSON
-            def datetime_converter(o):
-                if isinstance(o, datetime):
-                    return o.isoformat()
-
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(article_data, f, indent=2, ensure_ascii=False, default=datetime_converter)
+            # datetime objects are saved as ISO formatted strings
+            _write_json_file(filepath, article_data, self.pretty_print)
 
             self._log_event("INFO", "Result saved to file.", log_details)
-
-            if len(self.processed_results_in_memory) < self.max_results_in_memory:
-                # Store a reference or a summary, not necessarily the full data if memory is a concern
-                # For now, storing the full dict as per previous behavior of self.results
-                self.processed_results_in_memory.append(article_data)
-                # self.processed_results_in_memory.append({"id": article_identifier, "filepath": filepath, "title": article_data.get("title")})
-            else:
-                self._log_event("DEBUG", "Max in-memory results reached. Not adding to list.", {"limit": self.max_results_in_memory})
+            self._remember_result(article_data)
 
         except Exception as e:
             self._log_event("ERROR", f"Failed to save result to JSON file {filepath}: {e}",
                             {**log_details, "exception_type": type(e).__name__, "error": str(e)})
 
 
+    def _remember_result(self, article_data):
+        if len(self.processed_results_in_memory) < self.max_results_in_memory:
+            # Store a reference or a summary, not necessarily the full data if memory is a concern
+            # For now, storing the full dict as per previous behavior of self.results
+            self.processed_results_in_memory.append(article_data)
+        else:
+            self._log_event("DEBUG", "Max in-memory results reached. Not adding to list.", {"limit": self.max_results_in_memory})
+
+    def _open_batch_file(self):
+        """Opens a new results-YYYYMMDD-HHMMSS-<seq>.jsonl batch file in the results directory."""
+        self._batch_seq += 1
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+        self._batch_path = os.path.join(self.results_output_dir, f"results-{stamp}-{self._batch_seq}.jsonl")
+        self._batch_file = open(self._batch_path, 'ab', buffering=_BATCH_BUFFER_BYTES)
+        self._batch_bytes = 0
+        self._batch_items = 0
+        self._log_event("INFO", "Opened results batch file.", {"filepath": self._batch_path})
+
+    def _append_batch_line(self, article_data, article_identifier):
+        """Appends article_data as one line of the current jsonl batch file, rolling the file when it is full."""
+        log_details = {"article_id": article_identifier, "title": article_data.get("title", "N/A")}
+        try:
+            line = _json_line(article_data)
+            if self._batch_file is None: self._open_batch_file()
+            self._batch_file.write(line)
+            self._batch_bytes += len(line)
+            self._batch_items += 1
+            self._log_event("DEBUG", "Result appended to batch file.", {**log_details, "filepath": self._batch_path})
+            self._remember_result(article_data)
+            if self._batch_bytes >= self.batch_max_bytes or self._batch_items >= self.batch_max_items:
+                self._close_batch_file(fsync=False) # Durability is only promised at close()/clear_queue()
+        except Exception as e:
+            self._log_event("ERROR", f"Failed to append result to batch file {self._batch_path}: {e}",
+                            {**log_details, "exception_type": type(e).__name__, "error": str(e)})
+
+    def _close_batch_file(self, fsync=True):
+        if self._batch_file is None: return
+        try:
+            self._batch_file.flush()
+            if fsync: os.fsync(self._batch_file.fileno())
+        finally:
+            self._batch_file.close()
+            self._log_event("INFO", "Closed results batch file.", {"filepath": self._batch_path, "items": self._batch_items})
+            self._batch_file = None
+
+    def flush(self):
+        """Flushes buffered jsonl results to disk and fsyncs the batch file (no-op for per-file json)."""
+        if self._batch_file is None: return
+        self._batch_file.flush()
+        os.fsync(self._batch_file.fileno())
+
+    def close(self):
+        """Flushes, fsyncs and closes the current jsonl batch file, if any. Storing again opens a new one."""
+        try:
+            self._close_batch_file(fsync=True)
+        except OSError as e:
+            self._log_event("ERROR", f"Could not close results batch file {self._batch_path}: {e}")
+
     def has_pending_items(self):
         # ... (existing has_pending_items) ...
         return len(self.item_queue) > 0
@@ -186,9 +362,17 @@ class Pipeline:
         return len(self.processed_results_in_memory)
 
     def get_processed_item_count_on_disk(self):
-        """Counts the number of .json files in the results directory."""
+        """Counts the .json files in the results directory, or the stored lines of its .jsonl batch files."""
         try:
             if os.path.exists(self.results_output_dir):
+                if self.results_format == "jsonl":
+                    if self._batch_file is not None: self._batch_file.flush()
+                    count = 0
+                    for name in os.listdir(self.results_output_dir):
+                        if not name.endswith(".jsonl"): continue
+                        with open(os.path.join(self.results_output_dir, name), 'rb') as f:
+                            count += sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(_BATCH_BUFFER_BYTES), b''))
+                    return count
                 return len([name for name in os.listdir(self.results_output_dir) if name.endswith(".json")])
         except OSError as e:
             self._log_event("ERROR", f"Could not count files in results directory {self.results_output_dir}: {e}")
@@ -202,7 +386,8 @@ class Pipeline:
     def clear_queue(self):
         # ... (existing clear_queue) ...
         self.item_queue.clear()
-        self.seen_item_ids.clear() # Also clear seen IDs when queue is cleared
+        self.close() # Make results stored so far durable before forgetting which items were seen
+        self.seen_item_ids = _new_seen_store(self.expected_items, self.bloom_seen_store) # Also clear seen IDs when queue is cleared; bloom filters have no clear()
         self._log_event("INFO", "Item queue and seen item IDs have been cleared.")
 
 
@@ -12,6 +12,11 @@ import urllib.parse # For urljoin and urlparse
 from urllib.parse import urlparse as lib_urlparse # Specific alias to avoid conflict
 from datetime import datetime, timedelta, timezone
 
+try:
+    import orjson # type: ignore[reportMissingImports]
+except ImportError:
+    orjson = None # type: ignore
+
 try:
     from ..fetcher.fetcher import Fetcher
     from ..parser.parser import Parser
@@ -70,8 +75,8 @@ class Planner:
                 self._log_event("ERROR", "Planner configuration file not found.", {"path": self.config_path, "cwd": os.getcwd()})
                 self.sources = []
                 return
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.config_path, 'rb') as f:
+                data = orjson.loads(f.read()) if orjson is not None else json.loads(f.read())
                 loaded_sources = data.get("sources", [])
                 for src in loaded_sources:
                     src.setdefault('parser_config_name', src.get('parser_config', 'default'))
@@ -102,7 +107,11 @@ class Planner:
     def save_config(self): # ... (no changes) ...
         self._log_event("INFO", f"Saving configuration to: {self.config_path}")
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f: json.dump({"sources": self.sources}, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                payload = orjson.dumps({"sources": self.sources}, option=orjson.OPT_INDENT_2) # Serialized first, so a failure leaves the file intact
+                with open(self.config_path, 'wb') as f: f.write(payload)
+            else:
+                with open(self.config_path, 'w', encoding='utf-8') as f: json.dump({"sources": self.sources}, f, indent=2, ensure_ascii=False)
         except Exception as e: self._log_event("ERROR", f"Failed to save config: {e}")
     def update_source_rss_feed(self, source_name, rss_feed_url): # ... (no changes) ...
         source = self.get_source_by_name(source_name)
@@ -150,17 +159,17 @@ class Planner:
         processed_sitemaps = processed_sitemaps or set()
         if sitemap_url in processed_sitemaps: return 0
         processed_sitemaps.add(sitemap_url)
-        xml = self.fetcher.fetch_url(sitemap_url); items_added=0
+        xml = self.fetcher.fetch_url(sitemap_url, as_bytes=True); items_added=0 # parse_sitemap streams the raw bytes
         if not xml: return 0
         if (parsed := self.parser.parse_sitemap(xml, sitemap_url)):
             if parsed['type'] == 'sitemap_index':
                 for sub_url in parsed['sitemap_urls']: items_added += self.process_sitemap(source_name, sub_url, recency_delta_days, processed_sitemaps)
             elif parsed['type'] == 'urlset':
-                for item in parsed['items']: # item is {'loc': str, 'lastmod_utc': datetime, 'source_sitemap_url': str}
-                    loc = item['loc']
-                    if self.monitor.is_article_new_by_date(loc,item.get('lastmod_utc'),recency_delta_days):
+                for item in parsed['items']: # item is a parser.SitemapItem (loc, lastmod_utc, source_sitemap_url)
+                    loc = item.loc
+                    if self.monitor.is_article_new_by_date(loc,item.lastmod_utc,recency_delta_days):
                         adapted = {'id':loc,'link':loc,'title':f"Sitemap: {os.path.basename(lib_urlparse(loc).path)}",
-                                   'published_date_utc':item.get('lastmod_utc'), 'source_sitemap_url':sitemap_url,
+                                   'published_date_utc':item.lastmod_utc, 'source_sitemap_url':sitemap_url,
                                    'type':'sitemap_derived', 'source_name': source_name} # Add source_name
                         self.pipeline.add_item(adapted); items_added+=1
         return items_added
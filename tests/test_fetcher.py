@@ -98,6 +98,18 @@ class TestFetcher(unittest.TestCase):
         self.assertIn(urlparse(test_url).netloc, self.fetcher.last_request_time)
 
 
+    @patch('requests.get')
+    @patch.object(Fetcher, '_get_robot_parser')
+    def test_fetch_url_as_bytes_returns_undecoded_body(self, mock_get_robot_parser, mock_page_get):
+        mock_rp_instance = MagicMock()
+        mock_rp_instance.can_fetch.return_value = True
+        mock_rp_instance.crawl_delay.return_value = None
+        mock_get_robot_parser.return_value = mock_rp_instance
+        mock_page_response = MagicMock(status_code=200, content=b"<urlset/>", text="<urlset/>")
+        mock_page_get.return_value = mock_page_response
+
+        self.assertEqual(self.fetcher.fetch_url("http://allowed-site.com/sitemap.xml", as_bytes=True), b"<urlset/>")
+
     @patch.object(Fetcher, '_get_robot_parser')
     def test_fetch_url_disallowed_by_robots(self, mock_get_robot_parser):
         mock_rp_instance = MagicMock()
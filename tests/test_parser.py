@@ -1,10 +1,26 @@
+import asyncio
 import unittest
-from unittest.mock import MagicMock, patch, call
+from unittest.mock import ANY, MagicMock, patch, call
 from datetime import datetime, timezone, timedelta
 import os
+import sys
+import tempfile
+import threading
+import time
 import json
+import warnings
+from urllib.parse import urljoin
+from urllib.robotparser import RobotFileParser
 
-from news_scrapper.parser.parser import Parser
+import feedparser
+import httpx
+import soupsieve
+import lxml.html
+from bs4 import BeautifulSoup
+from lxml import etree
+from lxml.cssselect import CSSSelector
+
+from news_scrapper.parser.parser import Parser, _skeletonize, _parse_date_str, _struct_time_to_utc, _SCHEMA_ORG_TYPE_HINT_RE, _compile_css_xpath, _fast_join_href, _score_link, _LINK_KEYWORDS, _stream_anchor_hrefs, _canonical_url
 from news_scrapper.analyzer.structure_analyzer import StructureAnalyzer
 # from news_scrapper.planner.planner import Planner # For type hinting/mocking planner_ref (actual import not needed for mock)
 
@@ -190,5 +206,890 @@ class TestParserMultiStrategy(unittest.TestCase): # Renamed class
         self.assertEqual(result.get("extraction_method"), "general_ai")
 
 
+class TestParserExtractionHelpers(unittest.TestCase):
+    def setUp(self):
+        self.mock_monitor = MagicMock()
+        self.parser = Parser(monitor_instance=self.mock_monitor)
+        self.sample_url = "http://example.com/article_sample"
+
+    @patch('extruct.extract')
+    def test_parse_with_schema_org_prefers_news_article(self, mock_extruct_extract):
+        mock_extruct_extract.return_value = {"microdata": [{"@type": "Product", "name": "Widget"}]}
+        html = ("<html><head>"
+                "<script type='application/ld+json'>{\"@type\": \"BreadcrumbList\", \"name\": \"Crumbs\"}</script>"
+                "<script type='application/ld+json'>[{\"@type\": [\"Article\"], \"headline\": \"Generic\", \"articleBody\": \"Generic body\"},"
+                " {\"@type\": \"NewsArticle\", \"headline\": \"News\", \"articleBody\": \"News body\"}]</script>"
+                "</head></html>")
+        with patch.object(self.parser, '_normalize_extracted_data', wraps=self.parser._normalize_extracted_data) as m_norm:
+            result = self.parser._parse_with_schema_org(html, self.sample_url)
+        self.assertEqual(result.get("title"), "News")
+        self.assertEqual(result.get("extraction_method"), "schema_org_newsarticle")
+        m_norm.assert_called_once()
+        mock_extruct_extract.assert_not_called() # JSON-LD article found, no extruct re-parse
+        later_block = "<script type='application/ld+json'>{\"@type\": \"Article\", \"headline\": \"Later\"}</script>"
+        html = html.replace("</head>", later_block + "</head>")
+        with patch('news_scrapper.parser.parser._json_loads', wraps=json.loads) as m_loads:
+            self.assertEqual(self.parser._parse_with_schema_org(html, self.sample_url)["title"], "News")
+        self.assertEqual(m_loads.call_count, 1) # Breadcrumbs skipped by the type hint, the later block never decoded
+
+    def test_pick_schema_org_article_ranks_every_listed_type(self):
+        items = [{"@type": ["WebPage", "https://schema.org/NewsArticle"], "headline": "Listed"},
+                 {"@type": "schema:Article", "headline": "Compact"}, {"@type": "Product", "name": "Widget"}]
+        result = self.parser._pick_schema_org_article(items, self.sample_url)
+        self.assertEqual((result["title"], result["extraction_method"]), ("Listed", "schema_org_newsarticle"))
+        self.assertEqual(self.parser._pick_schema_org_article(items[1:], self.sample_url)["extraction_method"], "schema_org_article")
+
+    @patch('extruct.extract')
+    def test_parse_with_schema_org_accepts_article_subtypes(self, mock_extruct_extract):
+        html = ("<script type='application/ld+json'>{\"@type\": \"OpinionNewsArticle\", \"headline\": \"Opinion\","
+                " \"articleBody\": \"Op-ed body\"}</script>")
+        result = self.parser._parse_with_schema_org(html, self.sample_url)
+        self.assertEqual((result["title"], result["extraction_method"]), ("Opinion", "schema_org_opinionnewsarticle"))
+        mock_extruct_extract.assert_not_called()
+        items = [{"@type": "LiveBlogPosting", "headline": "Live"}, {"@type": "TechArticle", "headline": "Tech"},
+                 {"@type": "newsarticle", "headline": "Lower"}]
+        self.assertEqual(self.parser._pick_schema_org_article(items, self.sample_url)["title"], "Lower")
+        self.assertEqual(self.parser._pick_schema_org_article(items[:2], self.sample_url)["title"], "Tech")
+
+    @patch('extruct.extract')
+    def test_parse_with_schema_org_reads_json_ld_graph(self, mock_extruct_extract):
+        html = ("<script type='application/ld+json'>{\"@context\": \"https://schema.org\", \"@graph\": ["
+                "{\"@type\": \"WebSite\", \"name\": \"Site\"}, {\"@type\": \"NewsArticle\", \"headline\": \"Graph News\"}]}</script>")
+        result = self.parser._parse_with_schema_org(html, self.sample_url)
+        self.assertEqual(result.get("title"), "Graph News")
+        with patch('news_scrapper.parser.parser.orjson', None): # stdlib json fallback reads the same blocks
+            self.assertEqual(self.parser._extract_json_ld(lxml.html.document_fromstring(html))[1]["headline"], "Graph News")
+        mock_extruct_extract.assert_not_called()
+
+    @patch('extruct.extract')
+    def test_parse_with_schema_org_falls_back_to_microdata(self, mock_extruct_extract):
+        mock_extruct_extract.return_value = {"microdata": [{"@type": "Article", "headline": "Micro", "articleBody": "Body"}]}
+        result = self.parser._parse_with_schema_org("<html><body><div itemscope>No JSON-LD</div></body></html>", self.sample_url)
+        self.assertEqual(result.get("title"), "Micro")
+        self.assertEqual(mock_extruct_extract.call_args.kwargs["syntaxes"], ['microdata'])
+        mock_extruct_extract.reset_mock()
+        html = "<html><body><div itemscope itemtype='https://schema.org/Product'><span itemprop='name'>Widget</span></div></body></html>"
+        self.assertIsNone(self.parser._parse_with_schema_org(html, self.sample_url))
+        mock_extruct_extract.assert_not_called()
+
+    @patch('news_scrapper.parser.parser.extruct.extract', return_value={"microdata": []})
+    def test_parse_with_schema_org_caches_by_content(self, mock_extruct_extract):
+        html = "<html><body><p itemscope>No article</p></body></html>"
+        self.assertIsNone(self.parser._parse_with_schema_org(html, self.sample_url))
+        self.assertIsNone(self.parser._parse_with_schema_org(html, self.sample_url))
+        mock_extruct_extract.assert_called_once()
+        self.parser._parse_with_schema_org(html + " ", self.sample_url)
+        self.assertEqual(mock_extruct_extract.call_count, 2)
+        with patch('news_scrapper.parser.parser._SCHEMA_CACHE_SIZE', 1):
+            self.parser._parse_with_schema_org(html, "http://example.com/other")
+        self.assertEqual(len(self.parser._schema_cache), 1)
+
+    def test_parse_with_schema_org_cache_survives_concurrent_eviction(self):
+        pages = [f"<script type='application/ld+json'>{{\"@type\": \"Article\", \"headline\": \"{i}\"}}</script>" for i in range(6)]
+        errors = []
+
+        def worker():
+            try:
+                for i in range(300):
+                    self.parser._parse_with_schema_org(pages[i % len(pages)], self.sample_url)
+            except Exception as e:
+                errors.append(e)
+
+        with patch('news_scrapper.parser.parser._SCHEMA_CACHE_SIZE', 2), \
+             patch.object(self.parser, '_extract_schema_org', side_effect=lambda html, url, doc=None: {"title": html[-20:]}):
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(self.parser._schema_cache), 2)
+
+    @patch('news_scrapper.parser.parser.extruct.extract')
+    def test_parse_content_skips_extruct_and_ai_when_not_needed(self, mock_extruct_extract):
+        html = "<html><body><h1>Title</h1><div class='body'>Body</div></body></html>"
+        source_config = {"name": "CssSource", "llm_analysis_pending": False,
+                         "extraction_selectors": {"article_title_selector": "h1", "article_content_selector": "div.body"}}
+        self.parser.planner_ref = MagicMock()
+        with patch.object(self.parser, '_parse_with_general_ai') as m_ai, patch.object(self.parser, '_create_crawler') as m_create_crawler:
+            result = asyncio.run(self.parser.parse_content(html, self.sample_url, source_config))
+        self.assertEqual(result["extraction_method"], "custom_css")
+        mock_extruct_extract.assert_not_called()
+        m_ai.assert_not_called()
+        m_create_crawler.assert_not_called()
+
+    @patch('news_scrapper.parser.parser._content_key')
+    def test_parse_with_schema_org_prefilters_on_markers(self, mock_content_key):
+        self.assertIsNone(self.parser._parse_with_schema_org("<html><body><p>Plain page</p></body></html>", self.sample_url))
+        mock_content_key.assert_not_called()
+        self.assertIsNone(self.parser._doc_cache)
+
+    def test_parse_content_reuses_disk_cache_across_parsers(self):
+        html = "<html><body><h1>Title</h1><time datetime='2024-01-15T12:00:00Z'></time><div class='body'>Body</div></body></html>"
+        source_config = {"name": "CssSource", "llm_analysis_pending": False,
+                         "extraction_selectors": {"article_title_selector": "h1", "article_content_selector": "div.body",
+                                                  "article_date_selector": "time"}}
+        with tempfile.TemporaryDirectory() as cache_dir:
+            first = asyncio.run(Parser(monitor_instance=MagicMock(), parse_cache_dir=cache_dir).parse_content(html, self.sample_url, source_config))
+            restarted = Parser(monitor_instance=MagicMock(), parse_cache_dir=cache_dir)
+            with patch.object(restarted, '_parse_with_custom_selectors') as m_custom:
+                cached = asyncio.run(restarted.parse_content(html, self.sample_url, source_config))
+            m_custom.assert_not_called()
+            self.assertEqual(cached, first)
+            # A corrupt entry is ignored and rewritten.
+            cache_file = restarted._parse_cache_path(restarted._parse_cache_key(html, self.sample_url, source_config))
+            cache_file.write_text("{not json", encoding="utf-8")
+            self.assertEqual(asyncio.run(restarted.parse_content(html, self.sample_url, source_config))["title"], "Title")
+            self.assertEqual(json.loads(cache_file.read_text(encoding="utf-8"))["result"]["title"], "Title")
+            with patch('news_scrapper.parser.parser.orjson', None): # stdlib json writes and reads the same entries
+                cache_file.unlink()
+                fresh = Parser(monitor_instance=MagicMock(), parse_cache_dir=cache_dir)
+                self.assertEqual(asyncio.run(fresh.parse_content(html, self.sample_url, source_config)), first | {"timestamp_utc": ANY})
+                self.assertEqual(fresh._load_cached_parse(cache_file)["published_date_utc"], datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc))
+
+    def test_parse_content_memoizes_by_page_url_and_selectors(self):
+        html = "<html><body><h1>Title</h1><h2>Other</h2><div class='body'>Body</div></body></html>"
+        source_config = {"name": "CssSource", "llm_analysis_pending": False,
+                         "extraction_selectors": {"article_title_selector": "h1", "article_content_selector": "div.body"}}
+        first = asyncio.run(self.parser.parse_content(html, self.sample_url, source_config))
+        first["authors"].append("Mutated")
+        with patch.object(self.parser, '_parse_with_custom_selectors') as m_custom:
+            again = asyncio.run(self.parser.parse_content(html, self.sample_url, source_config))
+        m_custom.assert_not_called()
+        self.assertEqual((again["title"], again["authors"]), ("Title", []))
+        source_config["extraction_selectors"]["article_title_selector"] = "h2"
+        self.assertEqual(asyncio.run(self.parser.parse_content(html, self.sample_url, source_config))["title"], "Other")
+        self.assertEqual(asyncio.run(self.parser.parse_content(html, "http://example.com/elsewhere", source_config))["url"],
+                         "http://example.com/elsewhere")
+
+    def test_page_signals_collected_in_one_walk(self):
+        html = ("<html><head><meta NAME='Author' content='Ann, Bob'><meta name='description' content='x'>"
+                "<script type='application/ld+json'>{\"@type\": \"WebSite\"}</script></head>"
+                "<body><div itemscope itemtype='http://schema.org/Thing'><span>x</span></div></body></html>")
+        doc = self.parser._get_doc(html)
+        with patch('news_scrapper.parser.parser._PAGE_SIGNALS_XPATH', wraps=etree.XPath(
+                '//script[@type="application/ld+json"] | //meta[translate(@name, "AUTHOR", "author")="author"] | //*[@itemscope]')) as m_xpath:
+            self.assertEqual(self.parser._extract_meta_authors(html), ["Ann", "Bob"])
+            self.assertEqual(self.parser._extract_json_ld(doc), [{"@type": "WebSite"}])
+            with patch('news_scrapper.parser.parser._json_loads') as m_loads:
+                self.assertEqual(self.parser._extract_json_ld(doc, _SCHEMA_ORG_TYPE_HINT_RE), [])
+            m_loads.assert_not_called()
+            self.assertTrue(self.parser._get_page_signals(doc)["has_microdata"])
+        m_xpath.assert_called_once()
+
+    def test_parse_content_parses_html_once(self):
+        html = "<html><body><h1>Title</h1><div class='body'>Body</div></body></html>"
+        source_config = {"name": "CssSource", "llm_analysis_pending": False,
+                         "extraction_selectors": {"article_title_selector": "h1", "article_content_selector": "div.body"}}
+        with patch('news_scrapper.parser.parser.lxml.html.document_fromstring', wraps=lxml.html.document_fromstring) as m_parse, \
+             patch('news_scrapper.parser.parser.BeautifulSoup', wraps=BeautifulSoup) as m_soup:
+            result = asyncio.run(self.parser.parse_content(html, self.sample_url, source_config))
+        self.assertEqual(result["title"], "Title")
+        m_parse.assert_called_once()
+        m_soup.assert_not_called()
+        # Another page parsed mid-way (concurrent parse_content calls) must not force this page to be parsed again.
+        html = html.replace("Title", "Second")
+        def parse_other_page(*args, **kwargs):
+            self.parser._get_doc("<html><body>Other page</body></html>")
+            return None
+        with patch('news_scrapper.parser.parser.lxml.html.document_fromstring', wraps=lxml.html.document_fromstring) as m_parse, \
+             patch.object(self.parser, '_parse_with_schema_org', side_effect=parse_other_page):
+            self.assertEqual(asyncio.run(self.parser.parse_content(html, self.sample_url, source_config))["title"], "Second")
+        self.assertEqual(m_parse.call_count, 2)
+
+    def test_normalize_extracted_data_cleans_each_author_once(self):
+        norm = self.parser._normalize_extracted_data(
+            {"headline": 42, "articleBody": "  Body  ", "author": [{"name": " Ann "}, {"@type": "Person"}, " ", 7, "Bob "]},
+            self.sample_url, "test_method")
+        self.assertEqual((norm["title"], norm["text"]), ("42", "Body"))
+        self.assertEqual(norm["authors"], ["Ann", "7", "Bob"])
+        self.assertEqual(self.parser._normalize_extracted_data({"author": " Ann , ,Bob"}, self.sample_url, "m")["authors"], ["Ann", "Bob"])
+        # Short names from different articles share one string object.
+        first, second = (self.parser._normalize_extracted_data({"author": "".join([" Jane ", "Doe "])}, self.sample_url, "m") for _ in range(2))
+        self.assertIs(first["authors"][0], second["authors"][0])
+
+    @patch('news_scrapper.parser.parser._DATEUTIL_PARSER.parse')
+    def test_parse_generic_date_fast_paths_skip_dateutil(self, mock_dateutil_parse):
+        self.assertEqual(self.parser._parse_generic_date_to_utc("2024-01-15T12:00:00.5+02:00"),
+                         datetime(2024, 1, 15, 10, 0, 0, 500000, tzinfo=timezone.utc))
+        self.assertEqual(self.parser._parse_generic_date_to_utc("2024-01-15"), datetime(2024, 1, 15, tzinfo=timezone.utc))
+        self.assertEqual(self.parser._parse_generic_date_to_utc("20240115T120000Z"), datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc))
+        self.assertEqual(self.parser._parse_generic_date_to_utc("Mon, 15 Jan 2024 12:00:00 -0500"),
+                         datetime(2024, 1, 15, 17, 0, 0, tzinfo=timezone.utc))
+        mock_dateutil_parse.assert_not_called()
+
+    def test_parse_generic_date_falls_back_to_dateutil(self):
+        self.assertEqual(self.parser._parse_generic_date_to_utc("January 15, 2024 12:00"), datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc))
+        self.assertIsNone(self.parser._parse_generic_date_to_utc("not a date"))
+
+    def test_parse_generic_date_reads_rfc_822_zone_names(self):
+        self.assertEqual(self.parser._parse_generic_date_to_utc("Mon, 15 Jan 2024 12:00:00 EST"), datetime(2024, 1, 15, 17, 0, tzinfo=timezone.utc))
+        self.assertEqual(self.parser._parse_generic_date_to_utc("Mon, 15 Jul 2024 12:00:00 PDT"), datetime(2024, 7, 15, 19, 0, tzinfo=timezone.utc))
+        # Shapes outside the fast path get the same zones from dateutil, without an UnknownTimezoneWarning.
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            self.assertEqual(self.parser._parse_generic_date_to_utc("January 15, 2024 12:00 CST"), datetime(2024, 1, 15, 18, 0, tzinfo=timezone.utc))
+
+    def test_parse_generic_date_reads_struct_time_as_utc(self):
+        struct = datetime(2024, 1, 15, 12, 30, 45).timetuple()
+        self.assertEqual(self.parser._parse_generic_date_to_utc(struct), datetime(2024, 1, 15, 12, 30, 45, tzinfo=timezone.utc))
+
+    @unittest.skipUnless(hasattr(time, "tzset"), "needs time.tzset")
+    def test_parse_generic_date_struct_time_ignores_local_dst(self):
+        # 02:30 on 2024-03-10 does not exist in New York; a mktime round-trip would shift it by an hour.
+        struct = time.struct_time((2024, 3, 10, 2, 30, 0, 6, 70, 0))
+        self.addCleanup(time.tzset) # Runs after patch.dict has restored TZ
+        with patch.dict(os.environ, {"TZ": "America/New_York"}):
+            time.tzset()
+            self.assertEqual(self.parser._parse_generic_date_to_utc(struct), datetime(2024, 3, 10, 2, 30, tzinfo=timezone.utc))
+
+    def test_parse_generic_date_memoizes_strings(self):
+        _parse_date_str.cache_clear()
+        for date_str in ("2024-02-01T08:00:00Z", " 2024-02-01T08:00:00Z\n", "2024-02-01T08:00:00Z"):
+            self.parser._parse_generic_date_to_utc(date_str)
+        info = _parse_date_str.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 2))
+        _struct_time_to_utc.cache_clear()
+        for _ in range(2):
+            self.parser._parse_generic_date_to_utc(datetime(2024, 1, 15, 12, 30, 45).timetuple())
+        self.assertEqual(_struct_time_to_utc.cache_info().hits, 1)
+
+    def test_custom_selectors_compiled_once_per_source(self):
+        _compile_css_xpath.cache_clear()
+        config = {"name": "CssSource", "extraction_selectors": {"article_title_selector": "h1", "article_content_selector": "p"}}
+        with patch('news_scrapper.parser.parser.CSSSelector', wraps=CSSSelector) as m_compile:
+            first = self.parser._parse_with_custom_selectors("<h1>One</h1><p>A</p><p>B</p>", self.sample_url, config)
+            second = self.parser._parse_with_custom_selectors("<h1>Two</h1><p>C</p>", self.sample_url, config)
+            self.assertEqual(m_compile.call_count, 2)
+            config["extraction_selectors"] = {"article_title_selector": "h2", "article_content_selector": "p"}
+            third = self.parser._parse_with_custom_selectors("<h2>Three</h2><p>D</p>", self.sample_url, config)
+            self.assertEqual(m_compile.call_count, 3) # Only the changed selector is translated again
+            # Another source using the same selectors reuses their translations.
+            other = {"name": "OtherSource", "extraction_selectors": {"article_title_selector": "h2", "article_content_selector": "p"}}
+            fourth = self.parser._parse_with_custom_selectors("<h2>Four</h2><p>E</p>", self.sample_url, other)
+            self.assertEqual(m_compile.call_count, 3)
+        self.assertEqual((first["title"], first["text"]), ("One", "A\nB"))
+        self.assertEqual(second["title"], "Two")
+        self.assertEqual(third["title"], "Three")
+        self.assertEqual(fourth["title"], "Four")
+
+    def test_custom_selectors_skip_pages_missing_their_class_names(self):
+        config = {"name": "NeedleSource", "extraction_selectors": {"article_title_selector": "h1.story-title, #headline",
+                  "article_content_selector": "div.story-body p"}}
+        with patch.object(self.parser, '_get_doc', wraps=self.parser._get_doc) as m_get_doc:
+            self.assertIsNone(self.parser._parse_with_custom_selectors("<h1 class='title'>Other</h1><p>x</p>", self.sample_url, config))
+            m_get_doc.assert_not_called()
+            result = self.parser._parse_with_custom_selectors("<h1 id='headline'>Id</h1>", self.sample_url, config)
+        self.assertEqual(result["title"], "Id")
+        # Selectors beyond tags, classes and ids (or a bare tag alternative) always go through the parser.
+        for selector in ("h1[data-role=title]", "h1.story-title, h1"):
+            config = {"name": f"Needle {selector}", "extraction_selectors": {"article_title_selector": selector}}
+            self.assertEqual(self.parser._parse_with_custom_selectors("<h1 data-role='title'>T</h1>", self.sample_url, config)["title"], "T")
+
+    def test_custom_selectors_lxml_text_and_soup_fallback(self):
+        html = ("<html><body><h1>Plain</h1><h1>Breaking <b>news</b></h1><time datetime='2024-01-15T12:00:00Z'>Jan 15</time>"
+                "<div class='body'><p>P1</p> <p>P2</p><script>var x = 1;</script></div></body></html>")
+        config = {"name": "LxmlSource", "extraction_selectors": {"article_title_selector": "h1:nth-of-type(2)",
+                  "article_content_selector": "div.body", "article_date_selector": "time"}}
+        result = self.parser._parse_with_custom_selectors(html, self.sample_url, config)
+        self.assertEqual((result["title"], result["text"]), ("Breakingnews", "P1\nP2"))
+        self.assertEqual(result["published_date_utc"], datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc))
+        config = {"name": "FirstMatchSource", "extraction_selectors": {"article_title_selector": "h1", "article_date_selector": "time, h1"}}
+        result = self.parser._parse_with_custom_selectors(html, self.sample_url, config)
+        self.assertEqual((result["title"], result["published_date_utc"]), ("Plain", None))
+        # cssselect cannot translate soupsieve-only pseudo-classes; those still resolve through BeautifulSoup.
+        config = {"name": "SoupSource", "extraction_selectors": {"article_title_selector": 'h1:-soup-contains("Breaking")'}}
+        with patch('news_scrapper.parser.parser.soupsieve.compile', wraps=soupsieve.compile) as m_compile:
+            for _ in range(2):
+                self.assertEqual(self.parser._parse_with_custom_selectors(html, self.sample_url, config)["title"], "Breakingnews")
+        m_compile.assert_called_once()
+
+    def test_flush_llm_generates_one_schema_per_source(self):
+        schema = {"title": "h1", "text": "article"}
+        self.parser._generate_llm_schema = MagicMock(return_value=schema)
+        self.parser.queue_llm_analysis("SiteA", "http://a.example/1", "<html>1</html>")
+        self.parser.queue_llm_analysis("SiteA", "http://a.example/2", "<html>2</html>")
+        self.parser.queue_llm_analysis("SiteB", "http://b.example/1", "<html>3</html>")
+        flushed = asyncio.run(self.parser.flush_llm())
+        self.assertEqual(self.parser._generate_llm_schema.call_count, 2)
+        self.assertEqual(flushed, {"SiteA": schema, "SiteB": schema})
+        # Later pages of a known source reuse the cached schema without another LLM call.
+        cached = asyncio.run(self.parser._get_llm_schema("SiteA", "http://a.example/3", "<html>4</html>"))
+        self.assertEqual(cached, schema)
+        self.assertEqual(self.parser._generate_llm_schema.call_count, 2)
+
+    def test_get_llm_schema_generates_once_for_concurrent_pages_of_a_source(self):
+        schema = {"title": "h1", "text": "article"}
+        self.parser._generate_llm_schema = MagicMock(return_value=schema)
+        self.parser._record_llm_schema = MagicMock(return_value=schema)
+
+        async def four_pages():
+            return await asyncio.gather(*(self.parser._get_llm_schema("SiteA", f"http://a.example/{i}", f"<html>{i}</html>")
+                                          for i in range(4)))
+
+        self.assertEqual(asyncio.run(four_pages()), [schema] * 4)
+        self.parser._generate_llm_schema.assert_called_once()
+        self.parser._record_llm_schema.assert_called_once()
+        self.assertEqual(self.parser._llm_inflight, {})
+
+    def test_get_llm_schema_batches_sources_parsed_together(self):
+        self.parser._generate_llm_schema = MagicMock(side_effect=lambda url, html: {"title": url})
+        self.parser._record_llm_schema = MagicMock(side_effect=lambda source_name, url, schema: schema)
+
+        async def two_sources():
+            return await asyncio.gather(self.parser._get_llm_schema("SiteA", "http://a.example/1", "<html>a</html>"),
+                                        self.parser._get_llm_schema("SiteB", "http://b.example/1", "<html>b</html>"))
+
+        with patch.object(self.parser, 'flush_llm', wraps=self.parser.flush_llm) as m_flush:
+            schemas = asyncio.run(two_sources())
+        self.assertEqual(schemas, [{"title": "http://a.example/1"}, {"title": "http://b.example/1"}])
+        m_flush.assert_awaited_once()
+
+    def test_flush_llm_shares_schema_between_identical_templates(self):
+        self.parser._generate_llm_schema = MagicMock(return_value={"title": "h1"})
+        self.parser.queue_llm_analysis("SiteA", "http://a.example/1", "<html><h1>x</h1></html>")
+        self.parser.queue_llm_analysis("SiteB", "http://b.example/1", "<html><h1>x</h1></html>")
+        asyncio.run(self.parser.flush_llm())
+        self.parser._generate_llm_schema.assert_called_once()
+
+    def test_parse_content_completes_partial_custom_result_with_general_ai(self):
+        source_config = {"name": "PartialSource", "llm_analysis_pending": False,
+                         "extraction_selectors": {"article_title_selector": "h1"}}
+        partial = {"title": "Custom Title", "text": None, "authors": [], "published_date_utc": None, "extraction_method": "custom_css"}
+        ai_text = {"title": None, "text": "AI body", "authors": [], "published_date_utc": None, "extraction_method": "general_ai"}
+        with patch.object(self.parser, '_parse_with_schema_org', return_value=None), \
+             patch.object(self.parser, '_parse_with_custom_selectors', return_value=partial), \
+             patch.object(self.parser, '_parse_with_general_ai', return_value=ai_text) as m_ai:
+            result = asyncio.run(self.parser.parse_content(
+                "<html><head><meta content='Jane Doe' name='author'></head></html>", self.sample_url, source_config))
+        self.assertEqual(m_ai.call_args.kwargs["needed"], {"text", "authors", "published_date_utc"})
+        self.assertEqual(result["title"], "Custom Title")
+        self.assertEqual(result["text"], "AI body")
+        self.assertEqual(result["extraction_method"], "custom_css+general_ai")
+        self.assertEqual(result["authors"], ["Jane Doe"])
+
+    def test_parse_content_runs_strategies_in_executor(self):
+        source_config = {"name": "CssSource", "llm_analysis_pending": False,
+                         "extraction_selectors": {"article_title_selector": "h1", "article_content_selector": "p"}}
+        schema_result = {"title": "Schema Title", "text": "Schema body", "authors": [], "published_date_utc": None, "extraction_method": "schema.org"}
+        threads = []
+        def record(result):
+            def side_effect(*args, **kwargs):
+                threads.append(threading.current_thread().name)
+                return result
+            return side_effect
+        with patch.object(self.parser, '_parse_with_schema_org', side_effect=record(schema_result)), \
+             patch.object(self.parser, '_parse_with_custom_selectors', side_effect=record(None)):
+            result = asyncio.run(self.parser.parse_content("<h1>CSS</h1><p>Body</p>", self.sample_url, source_config))
+        self.assertEqual(result["title"], "Schema Title")
+        self.assertTrue(threads and all(name.startswith("parser-strategy") for name in threads))
+
+    def test_parse_content_css_fallback_of_json_css_schema_runs_off_loop_once(self):
+        source_config = {"name": "JsonCssSource", "llm_analysis_pending": False,
+                         "extraction_selectors": {"_is_json_css_schema": True, "article_title_selector": "h1", "article_content_selector": "p"}}
+        threads = []
+        def record(*args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return Parser._parse_with_custom_selectors(self.parser, *args, **kwargs)
+        with patch.object(self.parser, '_parse_with_custom_selectors', side_effect=record):
+            result = asyncio.run(self.parser.parse_content("<h1>CSS</h1><p>Body</p>", self.sample_url, source_config))
+        self.assertEqual((result["title"], result["extraction_method"]), ("CSS", "custom_css"))
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith("parser-strategy"))
+
+    def test_find_rss_links_in_html_matches_with_and_without_lexbor(self):
+        html = ("<html><head><link rel='Alternate' type='Application/RSS+XML' href='/feed'>"
+                "<link rel='alternate' type='application/atom+xml' href='/atom'>"
+                "<link rel='alternate' type='application/rss+xml' href='http://example.com/feed'>"
+                "<link rel='stylesheet' type='application/rss+xml' href='/not-a-feed'></head></html>")
+        expected = ["http://example.com/feed"]
+        self.assertEqual(self.parser.find_rss_links_in_html(html, self.sample_url), expected)
+        self.parser._get_doc(html)
+        with patch('news_scrapper.parser.parser.LexborHTMLParser', None), patch('news_scrapper.parser.parser.BeautifulSoup') as m_soup:
+            self.assertEqual(self.parser.find_rss_links_in_html(html, self.sample_url), expected)
+        m_soup.assert_not_called()
+        self.parser._doc_cache = None
+        with patch('news_scrapper.parser.parser.LexborHTMLParser', None), patch('news_scrapper.parser.parser.BeautifulSoup') as m_soup:
+            self.assertEqual(self.parser.find_rss_links_in_html(html, self.sample_url), expected)
+        m_soup.assert_not_called()
+        self.assertEqual(self.parser.find_rss_links_in_html(html, self.sample_url, soup=BeautifulSoup(html, "lxml")), expected)
+        # With both trees cached for the page, the lxml one is filtered rather than walking the soup.
+        self.parser._get_soup(html)
+        self.parser._get_doc(html)
+        with patch('news_scrapper.parser.parser._RSS_LINK_SOUPSIEVE') as m_soupsieve:
+            self.assertEqual(self.parser.find_rss_links_in_html(html, self.sample_url), expected)
+        m_soupsieve.select.assert_not_called()
+
+    def test_find_rss_links_in_html_skips_pages_without_rss_type(self):
+        html = "<html><head><link rel='alternate' type='application/atom+xml' href='/atom'></head></html>"
+        with patch('news_scrapper.parser.parser.LexborHTMLParser') as m_lexbor, patch.object(self.parser, '_get_soup') as m_soup:
+            self.assertEqual(self.parser.find_rss_links_in_html(html, self.sample_url), [])
+        m_lexbor.assert_not_called()
+        m_soup.assert_not_called()
+
+    def test_extract_and_filter_links_same_from_every_tree(self):
+        html = ("<html><body><a href=' /news/1 '>1</a><a href='https://other.com/x'>x</a><a href='#top'>top</a>"
+                "<a href='mailto:a@b.c'>m</a><a>no href</a><a href=''>empty</a><a href='/news/1'>dup</a></body></html>")
+        expected = ["http://example.com/news/1", "https://other.com/x"]
+        with patch('news_scrapper.parser.parser.BeautifulSoup', wraps=BeautifulSoup) as m_soup:
+            self.assertEqual(self.parser.extract_and_filter_links(self.sample_url, html, None, respect_robots=False), expected)
+            with patch('news_scrapper.parser.parser.LexborHTMLParser', None):
+                self.assertEqual(self.parser.extract_and_filter_links(self.sample_url, html, None, respect_robots=False), expected)
+        m_soup.assert_not_called()
+        with patch('news_scrapper.parser.parser._STREAM_ANCHORS_MIN_CHARS', 0), patch('news_scrapper.parser.parser._STREAM_ANCHORS_CHUNK_CHARS', 7):
+            self.assertEqual(self.parser.extract_and_filter_links(self.sample_url, html, None, respect_robots=False), expected)
+        self.assertEqual(_stream_anchor_hrefs("<p><a href='/caf\u00e9'>x</a><b><a name='n'><a href=''></b>" * 2), ["/caf\u00e9", ""] * 2)
+        page = html.replace("/news/1", "/news/2")
+        self.parser._get_soup(page)
+        self.assertEqual(self.parser.extract_and_filter_links(self.sample_url, page, None, respect_robots=False),
+                         ["http://example.com/news/2", "https://other.com/x"])
+
+    def test_fast_join_href_matches_urljoin(self):
+        base = "https://ex.com/a/b.html"
+        joined = {"/x//y": "https://ex.com/x//y", "//o.com/p": "https://o.com/p", "http://o.com/a;p?q#f": "http://o.com/a;p?q#f"}
+        for href, expected in joined.items():
+            self.assertEqual(_fast_join_href("https://ex.com", href), expected)
+            self.assertEqual(urljoin(base, href), expected)
+        # Forms urljoin rewrites (or rejects) are left to it.
+        for href in ("https://ex.com/a/../b", "/x/./y", "/a/..;p", "/a?", "http://o.com/a#", "/a;", "/p?#f", "/a\tb", "http:///x", "//", "http://[o.com/", "rel/x", "HTTP://o.com"):
+            self.assertIsNone(_fast_join_href("https://ex.com", href), href)
+
+    def test_extract_and_filter_links_bounds_hrefs_and_anchors(self):
+        long_path = "/news/" + "x" * 2100
+        html = f"<a href='{long_path}'>long</a><a href='{long_path[:2000]}'>ok</a>" + "".join(f"<a href='/n/{i}'>{i}</a>" for i in range(5100))
+        links = self.parser.extract_and_filter_links(self.sample_url, html, None, respect_robots=False)
+        self.assertEqual(len(links), 4999)
+        self.assertIn("http://example.com" + long_path[:2000], links)
+        self.assertNotIn("http://example.com/n/4999", links)
+        self.assertEqual(self.parser.extract_and_filter_links("http://example.com/" + "d/" * 1020, "<a href='rel'>r</a>", None, respect_robots=False), [])
+
+    def test_canonical_url_collapses_near_duplicates(self):
+        cases = {
+            "HTTPS://Ex.COM": "https://ex.com/",
+            "https://User:Pw@Ex.com:8080?b=2&a=1#frag": "https://User:Pw@ex.com:8080/?a=1&b=2",
+            "https://ex.com/A/Path/?utm_source=x&id=%2F7&FBCLID=1&ref=home&&": "https://ex.com/A/Path/?id=%2F7",
+            "https://ex.com/a?utm_medium=y#top": "https://ex.com/a",
+            "https://ex.com/a?q=a+b&q=%20": "https://ex.com/a?q=%20&q=a+b",
+        }
+        for url, expected in cases.items():
+            self.assertEqual(_canonical_url(url), expected)
+        html = ("<a href='https://EX.com/news/1?utm_campaign=z'>1</a><a href='/news/1#comments'>2</a>"
+                "<a href='http://example.com/news/2?b=1&a=2'>3</a><a href='/news/2?a=2&b=1&gclid=9'>4</a>")
+        self.assertEqual(self.parser.extract_and_filter_links("https://ex.com/", html, None, respect_robots=False),
+                         ["http://example.com/news/2?b=1&a=2", "https://EX.com/news/1?utm_campaign=z", "https://ex.com/news/2?a=2&b=1&gclid=9"])
+
+    def test_extract_and_filter_links_drops_excluded_patterns(self):
+        hrefs = ["/news/1", "/Login", "/tag/world", "/img/photo.JPG", "/feed/", "/feed/item", "/?replytocom=3", "https://web.archive.org/web/1/x"]
+        html = "<html><body>" + "".join(f"<a href='{href}'>a</a>" for href in hrefs) + "</body></html>"
+        self.assertEqual(self.parser.extract_and_filter_links(self.sample_url, html, None, respect_robots=False),
+                         ["http://example.com/feed/item", "http://example.com/news/1"])
+        robot_parser = MagicMock()
+        robot_parser.can_fetch.return_value = True
+        self.assertEqual(self.parser.extract_and_filter_links(self.sample_url, html, robot_parser),
+                         ["http://example.com/feed/item", "http://example.com/news/1"])
+        self.assertCountEqual([c.args[1] for c in robot_parser.can_fetch.call_args_list],
+                              ["http://example.com/feed/item", "http://example.com/news/1"])
+
+    def test_debug_events_off_skips_per_link_debug(self):
+        robot_parser = MagicMock()
+        robot_parser.can_fetch.side_effect = lambda agent, url: "/private" not in url
+        html = "<html><body><a href='/news/1'>1</a><a href='/private/2'>2</a></body></html>"
+        for debug_events in (True, False):
+            monitor = MagicMock()
+            parser = Parser(monitor_instance=monitor, planner_reference=MagicMock(), debug_events=debug_events)
+            self.assertEqual(parser.extract_and_filter_links(self.sample_url, html, robot_parser), ["http://example.com/news/1"])
+            messages = [c.args[1] for c in monitor.log_event.call_args_list]
+            self.assertEqual(any("disallowed by robots.txt" in m for m in messages), debug_events)
+            self.assertTrue(any(m.startswith("Link extraction complete") for m in messages))
+
+    def test_score_and_select_links_ranks_by_keywords_and_depth(self):
+        links = ["https://ex.com/contact", "https://ex.com/a/b/c", "https://ex.com/news/2024/story-1",
+                 "https://ex.com/x/y/z", "https://ex.com/NEWS"]
+        self.assertAlmostEqual(_score_link(links[2]), 0.6 * 3 / len(_LINK_KEYWORDS) + 0.4)
+        self.assertEqual(self.parser.score_and_select_links(links, top_n=None),
+                         [links[2], links[1], links[3], links[4], links[0]])
+        self.assertEqual(self.parser.score_and_select_links(links, top_n=2), links[2:0:-1])
+        self.assertEqual(self.parser.score_and_select_links(links, top_n=10, relevance_threshold=0.4), links[2:0:-1] + [links[3]])
+        self.assertEqual(self.parser.score_and_select_links([]), [])
+        hits = _score_link.cache_info().hits
+        self.parser.score_and_select_links(links, top_n=1) # A later seed repeating the same links reuses their scores
+        self.assertEqual(_score_link.cache_info().hits, hits + len(links))
+
+    def test_handle_robots_txt_fetches_once_for_concurrent_seeds(self):
+        fetched = []
+        async def fetch_robots_txt(domain_url):
+            fetched.append(domain_url)
+            await asyncio.sleep(0.01)
+            return "User-agent: *\nDisallow: /private"
+        self.parser.fetch_robots_txt = fetch_robots_txt
+        async def handle_many():
+            return await asyncio.gather(*(self.parser.handle_robots_txt(f"http://{host}/page{i}") for i in range(5) for host in ("a.com", "b.com")))
+        parsers = asyncio.run(handle_many())
+        self.assertCountEqual(fetched, ["http://a.com", "http://b.com"])
+        self.assertEqual(len({id(rfp) for rfp in parsers}), 2)
+        self.assertFalse(parsers[0].can_fetch("*", "http://a.com/private/x"))
+        asyncio.run(self.parser.handle_robots_txt("http://a.com/again")) # A later event loop reuses the cache
+        self.assertEqual(len(fetched), 2)
+
+    def test_robots_matcher_agrees_with_robot_file_parser(self):
+        rfp = RobotFileParser("http://example.com/robots.txt")
+        rfp.parse(["User-agent: Googlebot", "Disallow: /", "", "User-agent: *", "Allow: /news/private/ok",
+                   "Disallow: /news/private", "Disallow: /search?", "Disallow: /caf%C3%A9", "Disallow: /p;x", "Disallow:"])
+        urls = ["http://example.com", "http://example.com/news/private/ok/1", "http://example.com/news/private/2",
+                "http://example.com/search?q=1", "http://example.com/search", "http://example.com/caf\u00e9/x",
+                "http://example.com/caf%c3%a9", "http://example.com/p;x", "http://example.com/news/1#private"]
+        can_fetch = self.parser._robots_can_fetch(rfp)
+        self.assertEqual([can_fetch(url) for url in urls], [rfp.can_fetch("*", url) for url in urls])
+        self.assertEqual([can_fetch(url) for url in urls], [True, True, False, False, False, False, False, False, True])
+        self.assertIs(self.parser._robots_can_fetch(rfp).__self__, can_fetch.__self__)
+        rfp.default_entry = None
+        rfp.parse(["User-agent: *", "Disallow: /news"]) # Re-parsed: the cached matcher is rebuilt
+        self.assertFalse(rfp.can_fetch("*", "http://example.com/news/1"))
+        self.assertFalse(self.parser._robots_can_fetch(rfp)("http://example.com/news/1"))
+        html = "<a href='/news/private/ok'>1</a><a href='/news/private/x'>2</a><a href='/other'>3</a>"
+        self.assertEqual(self.parser.extract_and_filter_links(self.sample_url, html, rfp), ["http://example.com/other"])
+
+    def test_parse_crawl_delay_prefers_target_agent_block(self):
+        robots = ("User-agent: *\nCrawl-delay: 5\nDisallow: /private\n\n"
+                  "  USER-AGENT: NewsBot\n  Crawl-Delay : 2.5\n\nUser-agent: Other\nCrawl-delay: 9\n")
+        self.assertEqual(self.parser.parse_crawl_delay(robots, "newsbot"), 2.5)
+        self.assertEqual(self.parser.parse_crawl_delay(robots, "UnknownBot"), 5.0)
+        self.assertIsNone(self.parser.parse_crawl_delay("User-agent: *\nCrawl-delay: 1.2.3\n"))
+        self.assertEqual(self.parser.parse_crawl_delay("User-agent: *\nCrawl-delay: .5 # seconds\n"), 0.5)
+        grouped = "User-agent: NewsBot\nUser-agent: OtherBot\nDisallow: /x\nCrawl-delay: 3\n\nUser-agent: *\nAllow: /\nUser-agent: Late\nCrawl-delay: 7\n"
+        self.assertEqual(self.parser.parse_crawl_delay(grouped, "NewsBot"), 3.0)
+        self.assertIsNone(self.parser.parse_crawl_delay(grouped, "UnknownBot"))
+
+    def test_robots_parsing_is_memoized_per_distinct_file(self):
+        robots = "User-agent: *\nCrawl-delay: 5\nDisallow: /private\n"
+        with patch.object(self.parser, '_scan_crawl_delay', wraps=self.parser._scan_crawl_delay) as m_scan:
+            self.assertEqual([self.parser.parse_crawl_delay(robots, "NewsBot") for _ in range(2)], [5.0, 5.0])
+            self.parser.parse_crawl_delay(robots, "newsbot")
+        m_scan.assert_called_once()
+        rfp = self.parser.parse_robots_content(robots, "http://example.com")
+        self.assertIs(self.parser.parse_robots_content(robots, "http://example.com"), rfp)
+        self.assertIsNot(self.parser.parse_robots_content(robots + "Disallow: /tmp\n", "http://example.com"), rfp)
+
+    def test_handle_robots_txt_caches_parsers_and_missing_files_until_ttl(self):
+        responses = {"http://example.com": "User-agent: *\nDisallow: /private\n", "http://missing.com": None}
+        fetch = MagicMock(side_effect=lambda domain_url: asyncio.sleep(0, result=responses[domain_url]))
+        async def handle(url):
+            return await self.parser.handle_robots_txt(url)
+        with patch.object(self.parser, 'fetch_robots_txt', fetch):
+            rfp = asyncio.run(handle("http://example.com/a"))
+            self.assertFalse(rfp.can_fetch("*", "http://example.com/private/x"))
+            self.assertIs(asyncio.run(handle("http://example.com/b")), rfp)
+            missing = asyncio.run(handle("http://missing.com/a"))
+            self.assertTrue(missing.can_fetch("*", "http://missing.com/anything"))
+            self.assertIs(asyncio.run(handle("http://missing.com/b")), missing)
+            self.assertEqual(fetch.call_count, 2)
+            # Past the TTL both are fetched again; unchanged content keeps its parser.
+            for domain in ("http://example.com", "http://missing.com"):
+                self.parser._robots_fetched_at[domain] -= self.parser._robots_ttl_seconds
+            self.assertIs(asyncio.run(handle("http://example.com/c")), rfp)
+            self.assertIsNot(asyncio.run(handle("http://missing.com/c")), missing)
+            self.assertEqual(fetch.call_count, 4)
+        # Only the first 500 KiB of a robots.txt are read.
+        huge = "User-agent: *\n" + "# padding\n" * 60000 + "Disallow: /\n"
+        self.assertTrue(self.parser.parse_robots_content(huge, "http://huge.com").can_fetch("*", "http://huge.com/page"))
+
+    def test_find_sitemap_links_in_robots_keeps_url_case(self):
+        robots = ("User-agent: *\nSitemap: http://example.com/Sitemap.xml\n  SITEMAP:http://example.com/news.xml\n"
+                  "# Sitemap: http://example.com/commented.xml\nsitemap: http://example.com/Sitemap.xml\nSitemap:\n")
+        self.assertEqual(self.parser.find_sitemap_links_in_robots(robots),
+                         ["http://example.com/Sitemap.xml", "http://example.com/news.xml"])
+
+    def test_crawler_is_built_lazily_once(self):
+        m_crawler_cls = MagicMock(side_effect=RuntimeError("no browser"))
+        with patch('news_scrapper.parser.parser.AsyncWebCrawler', m_crawler_cls):
+            parser = Parser(monitor_instance=MagicMock())
+            m_crawler_cls.assert_not_called()
+            self.assertIsNone(parser.crawler)
+            self.assertIsNone(parser.crawler)
+        m_crawler_cls.assert_called_once()
+        parser.crawler = sentinel = MagicMock()
+        self.assertIs(parser.crawler, sentinel)
+
+    def test_parse_contents_batch_sends_ai_fallbacks_in_one_arun_many(self):
+        def crawl_result(seed):
+            page = MagicMock(text=f"Body of {seed.url}", metadata={"title": f"AI {seed.url}"})
+            return MagicMock(url=seed.url, results=[page])
+        self.parser.crawler = crawler = MagicMock()
+        # Results come back in reverse seed order; each page must still get the result crawled for its own URL.
+        crawler.arun_many = MagicMock(side_effect=lambda seeds, crawler_run_config: asyncio.sleep(0, result=[crawl_result(seed) for seed in reversed(seeds)]))
+        article = ("<html><head><script type='application/ld+json'>{\"@type\": \"NewsArticle\", \"headline\": \"Schema\","
+                   " \"articleBody\": \"Schema body\"}</script></head><body></body></html>")
+        config = {"name": "BatchSource", "llm_analysis_pending": False}
+        items = [("<html><body><p>one</p></body></html>", "http://example.com/1", config), (article, "http://example.com/2", config),
+                 ("<html><body><p>three</p></body></html>", "http://example.com/3", config)]
+        with patch('news_scrapper.parser.parser.AsyncWebCrawler', MagicMock()), \
+             patch('news_scrapper.parser.parser.Url', MagicMock(side_effect=lambda url, html_content: MagicMock(url=url))), \
+             patch('news_scrapper.parser.parser.CrawlerRunConfig', MagicMock()):
+            results = asyncio.run(self.parser.parse_contents_batch(items))
+        crawler.arun_many.assert_called_once()
+        crawler.arun.assert_not_called()
+        # Pages queue in the order they finish the earlier strategies, which the executor does not fix.
+        self.assertCountEqual([seed.url for seed in crawler.arun_many.call_args.args[0]], ["http://example.com/1", "http://example.com/3"])
+        self.assertEqual([result["title"] for result in results], ["AI http://example.com/1", "Schema", "AI http://example.com/3"])
+        self.assertEqual(results[2]["extraction_method"], "general_ai")
+        # A page arun_many returns nothing for gets no AI output rather than another page's.
+        crawler.arun_many = MagicMock(side_effect=lambda seeds, crawler_run_config: asyncio.sleep(0, result=[crawl_result(seeds[0])]))
+        self.parser._parse_memo.clear()
+        with patch('news_scrapper.parser.parser.AsyncWebCrawler', MagicMock()), \
+             patch('news_scrapper.parser.parser.Url', MagicMock(side_effect=lambda url, html_content: MagicMock(url=url))), \
+             patch('news_scrapper.parser.parser.CrawlerRunConfig', MagicMock()):
+            results = asyncio.run(self.parser.parse_contents_batch([items[0], items[2]]))
+        crawled = crawler.arun_many.call_args.args[0][0].url
+        for (_, url, _), result in zip([items[0], items[2]], results):
+            self.assertEqual(result.get("title"), f"AI {url}" if url == crawled else None)
+
+    def test_parse_sitemap_streams_urlset_and_index(self):
+        urlset = ('<?xml version="1.0" encoding="UTF-8"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" '
+                  'xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">'
+                  '<url><loc> http://example.com/a </loc><lastmod>2024-01-15</lastmod>'
+                  '<image:image><image:loc>http://example.com/a.jpg</image:loc></image:image></url>'
+                  '<url><loc>http://example.com/b</loc></url><url><lastmod>2024-01-15</lastmod></url></urlset>')
+        result = self.parser.parse_sitemap(urlset, "http://example.com/sitemap.xml")
+        self.assertEqual(result["type"], "urlset")
+        self.assertEqual([item.loc for item in result["items"]], ["http://example.com/a", "http://example.com/b"])
+        self.assertEqual(result["items"][0].lastmod_utc, datetime(2024, 1, 15, tzinfo=timezone.utc))
+        self.assertIsNone(result["items"][1].lastmod_utc)
+        index = '<sitemapindex><sitemap><loc>http://example.com/s1.xml</loc></sitemap></sitemapindex>'
+        self.assertEqual(self.parser.parse_sitemap(index.encode("utf-8"), "http://example.com/index.xml")["sitemap_urls"],
+                         ["http://example.com/s1.xml"])
+        self.assertIsNone(self.parser.parse_sitemap("<feed/>", "http://example.com/feed.xml"))
+
+    def test_parse_sitemap_and_feed_share_interned_source_urls(self):
+        urlset = "<urlset><url><loc>http://example.com/a</loc></url><url><loc>http://example.com/b</loc></url></urlset>"
+        items = self.parser.parse_sitemap(urlset, "".join(["http://example.com/", "sitemap.xml"]))["items"]
+        self.assertIs(items[0].source_sitemap_url, items[1].source_sitemap_url)
+        self.assertIs(items[0].source_sitemap_url, sys.intern("http://example.com/sitemap.xml"))
+        rss = "<rss><channel><item><link>http://example.com/1</link></item></channel></rss>"
+        feed_items = self.parser.parse_rss_feed(rss, "".join(["http://example.com/", "rss"]))
+        self.assertIs(feed_items[0]["source_feed_url"], sys.intern("http://example.com/rss"))
+
+    def test_parse_sitemap_feeds_entries_across_chunk_boundaries(self):
+        urlset = ('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+                  + ''.join(f'<url><loc>http://example.com/{i}</loc></url>' for i in range(50)) + '</urlset>')
+        with patch('news_scrapper.parser.parser._SITEMAP_FEED_CHUNK', 7):
+            result = self.parser.parse_sitemap(urlset, "http://example.com/sitemap.xml")
+        self.assertEqual([item.loc for item in result["items"]], [f"http://example.com/{i}" for i in range(50)])
+
+    def test_parse_sitemap_decodes_raw_bytes_by_declared_encoding(self):
+        urlset = ('<?xml version="1.0" encoding="ISO-8859-1"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+                  '<url><loc>http://example.com/caf\u00e9</loc></url></urlset>')
+        result = self.parser.parse_sitemap(urlset.encode("iso-8859-1"), "http://example.com/sitemap.xml")
+        self.assertEqual([item.loc for item in result["items"]], ["http://example.com/caf\u00e9"])
+        # Chunk boundaries may split a multi-byte UTF-8 sequence.
+        utf8 = urlset.replace("ISO-8859-1", "UTF-8").encode("utf-8")
+        with patch('news_scrapper.parser.parser._SITEMAP_FEED_CHUNK', 3):
+            result = self.parser.parse_sitemap(utf8, "http://example.com/sitemap.xml")
+        self.assertEqual([item.loc for item in result["items"]], ["http://example.com/caf\u00e9"])
+
+    def test_parse_rss_feed_reads_rss_and_atom_without_feedparser(self):
+        rss = ('<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>Feed</title>'
+               '<item><title>First</title><link> http://example.com/1 </link><guid>id-1</guid>'
+               '<pubDate>Mon, 15 Jan 2024 12:00:00 GMT</pubDate></item><item><title>No link</title></item></channel></rss>')
+        atom = ('<feed xmlns="http://www.w3.org/2005/Atom"><entry><title>Atom entry</title><id>urn:a</id>'
+                '<link rel="self" href="http://example.com/self"/><link href="http://example.com/a"/>'
+                '<updated>2024-01-15T12:00:00Z</updated></entry></feed>')
+        with patch('news_scrapper.parser.parser.feedparser.parse') as m_feedparser:
+            rss_items = self.parser.parse_rss_feed(rss, "http://example.com/rss")
+            atom_items = self.parser.parse_rss_feed(atom.encode("utf-8"), "http://example.com/atom")
+        m_feedparser.assert_not_called()
+        self.assertEqual([(i["id"], i["link"], i["title"]) for i in rss_items], [("id-1", "http://example.com/1", "First")])
+        self.assertEqual(rss_items[0]["published_date_utc"], datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc))
+        self.assertEqual([(i["id"], i["link"]) for i in atom_items], [("urn:a", "http://example.com/a")])
+        self.assertEqual(atom_items[0]["published_date_utc"], datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc))
+
+    def test_parse_rss_feed_reads_named_zone_dates_and_nested_title_markup(self):
+        rss = ('<rss version="2.0"><channel><item><title>Hello <b>World</b></title><link>http://example.com/1</link>'
+               '<pubDate>Mon, 15 Jan 2024 12:00:00 EST</pubDate></item></channel></rss>')
+        with patch('news_scrapper.parser.parser.feedparser.parse') as m_feedparser:
+            items = self.parser.parse_rss_feed(rss, "http://example.com/rss")
+        m_feedparser.assert_not_called()
+        self.assertEqual(items[0]["title"], "Hello World")
+        self.assertEqual(items[0]["published_date_utc"], datetime(2024, 1, 15, 17, 0, tzinfo=timezone.utc))
+
+    def test_parse_rss_feed_fast_path_matches_feedparser(self):
+        rss = ('<rss version="2.0"><channel>'
+               '<item><title>Eastern</title><link>http://example.com/1</link><pubDate>Mon, 15 Jan 2024 12:00:00 EST</pubDate></item>'
+               '<item><title>Pacific</title><link>http://example.com/2</link><pubDate>Mon, 15 Jul 2024 08:30:00 PDT</pubDate></item>'
+               '</channel></rss>')
+        atom = ('<feed xmlns="http://www.w3.org/2005/Atom"><entry><title type="xhtml">'
+                '<div xmlns="http://www.w3.org/1999/xhtml">Hello <b>World</b></div></title>'
+                '<link href="http://example.com/a"/><id>urn:a</id><updated>2024-01-15T12:00:00-05:00</updated></entry></feed>')
+        for feed in (rss, atom):
+            expected = [(entry.get("title"), entry.get("link"), datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
+                         if entry.get("published_parsed") else datetime(*entry.updated_parsed[:6], tzinfo=timezone.utc))
+                        for entry in feedparser.parse(feed).entries]
+            items = Parser(monitor_instance=self.mock_monitor).parse_rss_feed(feed, "http://example.com/feed")
+            self.assertEqual([(item["title"], item["link"], item["published_date_utc"]) for item in items], expected)
+
+    def test_parse_rss_feed_caches_unchanged_feed_and_falls_back_to_feedparser(self):
+        broken = ("<rss><channel><item><title>A &nbsp; B</title><link>http://example.com/1</link>"
+                  "<pubDate>Mon, 15 Jan 2024 12:00:00 GMT</pubDate></item><item><link>http://example.com/2</link></item></channel></rss>")
+        with patch('news_scrapper.parser.parser.feedparser.parse', wraps=feedparser.parse) as m_feedparser:
+            first = self.parser.parse_rss_feed(broken, "http://example.com/rss")
+            second = self.parser.parse_rss_feed(broken, "http://example.com/rss")
+        m_feedparser.assert_called_once()
+        self.assertEqual(first, second)
+        self.assertEqual(first[0]["link"], "http://example.com/1")
+        self.assertEqual([item["published_date_utc"] for item in first], [datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc), None])
+        self.assertNotIn("feed_entry_raw", first[0])
+
+    def test_fetch_robots_txt_reuses_one_pooled_client(self):
+        async def fetch_twice():
+            first = await self.parser.fetch_robots_txt("http://example.com")
+            second = await self.parser.fetch_robots_txt("http://example.org")
+            await self.parser.aclose()
+            return first, second
+        client = MagicMock(is_closed=False)
+        client.get = MagicMock(side_effect=lambda url: asyncio.sleep(0, result=MagicMock(status_code=200, text=f"User-agent: *\n# {url}")))
+        client.aclose = MagicMock(side_effect=lambda: asyncio.sleep(0))
+        with patch('news_scrapper.parser.parser.httpx.AsyncClient', return_value=client) as m_client:
+            first, second = asyncio.run(fetch_twice())
+        m_client.assert_called_once()
+        limits = m_client.call_args.kwargs["limits"]
+        self.assertEqual((limits.max_keepalive_connections, limits.max_connections, limits.keepalive_expiry), (100, 200, 30.0))
+        self.assertEqual([c.args[0] for c in client.get.call_args_list], ["http://example.com/robots.txt", "http://example.org/robots.txt"])
+        self.assertIn("example.org", second)
+        client.aclose.assert_called_once()
+        self.assertIsNone(self.parser._http_client)
+
+    def test_filter_by_content_type_checks_links_concurrently_per_host(self):
+        in_flight, peak = {}, {}
+        async def head(url):
+            host = url.split("/")[2]
+            in_flight[host] = in_flight.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), in_flight[host])
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+            if url.endswith("/missing.cgi"):
+                raise httpx.HTTPStatusError("404", request=MagicMock(), response=MagicMock(status_code=404))
+            return MagicMock(headers={"content-type": "application/pdf" if url.endswith(".pdf") else "text/html; charset=utf-8"})
+        client = MagicMock(is_closed=False, head=MagicMock(side_effect=head))
+        links = [f"http://a.com/{i}.cgi" for i in range(10)] + ["http://b.com/doc.pdf", "http://b.com/missing.cgi", "http://b.com/ok.cgi"]
+        with patch('news_scrapper.parser.parser.httpx.AsyncClient', return_value=client):
+            valid = asyncio.run(self.parser.filter_by_content_type(links))
+        self.assertEqual(valid, links[:10] + ["http://b.com/ok.cgi"])
+        self.assertEqual(peak["a.com"], 4) # Concurrent, but bounded per host
+
+    def test_filter_by_content_type_skips_head_for_html_paths(self):
+        client = MagicMock(is_closed=False)
+        client.head = MagicMock(side_effect=lambda url: asyncio.sleep(0, result=MagicMock(headers={"content-type": "image/png"})))
+        links = ["http://a.com/2024/01/slug/", "http://a.com/story.HTML", "http://a.com/index.php?id=3", "http://a.com/v1.2/news",
+                 "http://a.com/", "http://a.com/img.png", "http://a.com/feed.xml"]
+        with patch('news_scrapper.parser.parser.httpx.AsyncClient', return_value=client):
+            valid = asyncio.run(self.parser.filter_by_content_type(links))
+        self.assertEqual(valid, links[:5])
+        self.assertEqual([c.args[0] for c in client.head.call_args_list], links[5:])
+
+    def _make_seed_parser(self, article_links, article_concurrency=8):
+        """Parser whose process_seed_url finds `article_links` on every seed; crawls and parses are stubbed."""
+        crawl_stats = {"in_flight": 0, "peak": 0, "fetched": []}
+
+        async def arun(seed_url, crawler_run_config):
+            crawl_stats["in_flight"] += 1
+            crawl_stats["peak"] = max(crawl_stats["peak"], crawl_stats["in_flight"])
+            await asyncio.sleep(0.01)
+            crawl_stats["in_flight"] -= 1
+            crawl_stats["fetched"].append(seed_url.url)
+            if seed_url.url.endswith("/missing"):
+                return MagicMock(results=[])
+            return MagicMock(results=[MagicMock(content=f"<html>{seed_url.url}</html>", url=seed_url.url)])
+
+        async def parse_content(html_content, url, source_config):
+            if url.endswith("/broken"):
+                raise ValueError("boom")
+            if url.endswith("/empty"):
+                return {"title": url}
+            return {"title": url, "text": "body"}
+
+        parser = Parser(monitor_instance=self.mock_monitor, planner_reference=MagicMock(), article_concurrency=article_concurrency)
+        parser.crawler = MagicMock(arun=arun)
+        parser.handle_robots_txt = MagicMock(side_effect=lambda url: asyncio.sleep(0, result=None))
+        parser.extract_and_filter_links = MagicMock(return_value=article_links)
+        parser.score_and_select_links = MagicMock(side_effect=lambda links, top_n, relevance_threshold: links)
+        parser.filter_by_content_type = MagicMock(side_effect=lambda links: asyncio.sleep(0, result=links))
+        parser.parse_content = parse_content
+        return parser, crawl_stats
+
+    def _process_seeds(self, parser, *seed_urls):
+        """Runs process_seed_url for every seed concurrently; returns each seed's article titles."""
+        async def run_all():
+            return await asyncio.gather(*(parser.process_seed_url(seed_url, {"name": "Example"}) for seed_url in seed_urls))
+
+        with patch('news_scrapper.parser.parser.Url', lambda url: MagicMock(url=url)), \
+             patch('news_scrapper.parser.parser.CrawlerRunConfig', MagicMock()):
+            results = asyncio.run(run_all())
+        return [[article["title"] for article in articles] for articles in results]
+
+    def test_process_seed_url_processes_articles_concurrently(self):
+        articles = [f"http://example.com/a{i}" for i in range(6)]
+        failing = ["http://example.com/missing", "http://example.com/broken", "http://example.com/empty"]
+        parser, crawl_stats = self._make_seed_parser(articles + failing, article_concurrency=3)
+        self.assertEqual(self._process_seeds(parser, "http://example.com/"), [articles])
+        self.assertEqual(crawl_stats["peak"], 3)
+
+    def test_process_seed_url_skips_articles_seen_by_an_earlier_seed(self):
+        parser, _ = self._make_seed_parser(["http://example.com/a0", "http://example.com/a1"])
+        self._process_seeds(parser, "http://example.com/")
+        parser.extract_and_filter_links.return_value = ["http://example.com/a0", "http://example.com/new"]
+        self.assertEqual(self._process_seeds(parser, "http://example.com/other"), [["http://example.com/new"]])
+        parser.filter_by_content_type.assert_called_with(links=["http://example.com/new"])
+        asyncio.run(parser.aclose())
+        self.assertEqual(parser._seen_article_urls, {})
+
+    def test_process_seed_url_fetches_a_link_shared_by_concurrent_seeds_once(self):
+        parser, crawl_stats = self._make_seed_parser(["http://example.com/shared"])
+        self.assertEqual(sorted(self._process_seeds(parser, "http://example.com/s1", "http://example.com/s2")),
+                         [[], ["http://example.com/shared"]])
+        self.assertEqual(crawl_stats["fetched"].count("http://example.com/shared"), 1)
+
+    def test_process_seed_url_releases_links_whose_fetch_failed(self):
+        parser, _ = self._make_seed_parser(["http://example.com/missing", "http://example.com/empty"])
+        self._process_seeds(parser, "http://example.com/")
+        # The failed fetch may be retried by a later seed; the fetched (if insufficient) page stays seen.
+        self._process_seeds(parser, "http://example.com/other")
+        parser.filter_by_content_type.assert_called_with(links=["http://example.com/missing"])
+
+    def test_filter_by_content_type_retries_refused_head_with_ranged_get(self):
+        requests = []
+
+        def handler(request):
+            requests.append((request.method, request.url.path, request.headers.get("range")))
+            if request.method == "HEAD":
+                if request.url.path == "/head405.cgi":
+                    return httpx.Response(405)
+                if request.url.path == "/gone.cgi":
+                    return httpx.Response(404)
+                return httpx.Response(200, headers={} if request.url.path == "/bare.cgi" else {"content-type": "image/png"})
+            return httpx.Response(206, headers={"content-type": "text/html; charset=utf-8"}, content=b"<")
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        links = ["http://a.com/head405.cgi", "http://a.com/bare.cgi", "http://a.com/gone.cgi", "http://a.com/img.cgi"]
+        with patch('news_scrapper.parser.parser.httpx.AsyncClient', return_value=client):
+            valid = asyncio.run(self.parser.filter_by_content_type(links))
+        self.assertEqual(valid, links[:2])
+        self.assertCountEqual([r for r in requests if r[0] == "GET"], [("GET", "/head405.cgi", "bytes=0-0"), ("GET", "/bare.cgi", "bytes=0-0")])
+        self.assertEqual(len(requests), 6) # A 404 or a real content type is not retried
+
+    def test_skeletonize_strips_scripts_and_collapses_text(self):
+        html = ("<html><head><script>var tracking = 1;</script><style>p {}</style></head><body><!-- ad -->"
+                "<article class='story'><h1 class='headline'>Title</h1><p>" + "word " * 200 + "</p>"
+                "<ul>" + "<li>item</li>" * 150 + "</ul></article></body></html>")
+        skeleton = _skeletonize(html, max_children=100)
+        self.assertNotIn("tracking", skeleton)
+        self.assertNotIn("<style>", skeleton)
+        self.assertNotIn("ad -->", skeleton)
+        self.assertIn('<h1 class="headline">Title</h1>', skeleton)
+        self.assertIn("<p>...</p>", skeleton)
+        self.assertEqual(skeleton.count("<li>"), 100)
+        # An already parsed document gives the same skeleton and is left untouched.
+        doc = lxml.html.document_fromstring(html)
+        self.assertEqual(_skeletonize(doc, max_children=100), skeleton)
+        self.assertIn("tracking", lxml.html.tostring(doc, encoding="unicode"))
+
+
 if __name__ == '__main__':
     unittest.main()
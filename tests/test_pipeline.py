@@ -6,7 +6,7 @@ import shutil # For reliably removing test directory
 
 # Adjust import path based on project structure
 # Assuming 'tests' and 'news_scrapper' are sibling directories at the project root
-from news_scrapper.pipeline.pipeline import Pipeline
+from news_scrapper.pipeline.pipeline import Pipeline, _SeenDigests
 # We need to control these for tests, so we might patch them or ensure test-specific values.
 # from news_scrapper.config import RESULTS_DIR, MAX_RESULTS_TO_STORE_IN_MEMORY
 
@@ -61,6 +61,44 @@ class TestPipeline(unittest.TestCase):
         self.assertEqual(len(self.pipeline.item_queue), 1)
         self.assertIn("http://example.com/shared_link", self.pipeline.seen_item_ids)
 
+    def test_clear_queue_forgets_seen_items(self):
+        item = {"id": "a", "link": "http://example.com/a"}
+        self.pipeline.add_item(item)
+        self.pipeline.clear_queue()
+        self.assertNotIn("http://example.com/a", self.pipeline.seen_item_ids)
+        self.pipeline.add_item(item)
+        self.assertEqual(len(self.pipeline.item_queue), 1)
+
+    def test_seen_digests_store_ints_not_keys(self):
+        seen = _SeenDigests()
+        seen.add("http://example.com/a"); seen.add("http://example.com/a"); seen.add(42)
+        self.assertIn("http://example.com/a", seen)
+        self.assertIn(42, seen)
+        self.assertNotIn("http://example.com/b", seen)
+        self.assertEqual(len(seen), 2)
+        self.assertTrue(all(type(digest) is int and digest < 1 << 64 for digest in seen._digests))
+
+    def test_seen_store_is_sized_for_expected_items(self):
+        bloom_class = MagicMock()
+        with patch('news_scrapper.pipeline.pipeline.ScalableBloomFilter', bloom_class):
+            pipeline = Pipeline(monitor_instance=self.mock_monitor, results_output_dir=TEST_RESULTS_DIR, expected_items=250_000,
+                                bloom_seen_store=True)
+            pipeline.clear_queue()
+        self.assertEqual(bloom_class.call_args_list, [unittest.mock.call(initial_capacity=250_000, error_rate=0.001)] * 2)
+
+    def test_seen_store_is_exact_unless_bloom_is_opted_in(self):
+        with patch('news_scrapper.pipeline.pipeline.ScalableBloomFilter', MagicMock()):
+            self.assertIsInstance(Pipeline(monitor_instance=self.mock_monitor, results_output_dir=TEST_RESULTS_DIR).seen_item_ids, _SeenDigests)
+            bloom = Pipeline(monitor_instance=self.mock_monitor, results_output_dir=TEST_RESULTS_DIR, bloom_seen_store=True)
+        bloom.seen_item_ids.__contains__.return_value = True # A false positive on a never-seen item
+        bloom.add_item({"link": "http://example.com/new"})
+        self.assertEqual(len(bloom.item_queue), 0)
+        self.mock_monitor.log_event.assert_called_with("INFO", "Item already seen or a bloom-filter false positive, skipping.", unittest.mock.ANY)
+        with patch('news_scrapper.pipeline.pipeline.ScalableBloomFilter', None):
+            fallback = Pipeline(monitor_instance=self.mock_monitor, results_output_dir=TEST_RESULTS_DIR, bloom_seen_store=True)
+        self.assertIsInstance(fallback.seen_item_ids, _SeenDigests)
+        self.assertFalse(fallback.bloom_seen_store)
+
     def test_add_item_missing_link_and_id(self):
         item_bad = {"title": "Bad Item"}
         self.pipeline.add_item(item_bad)
@@ -70,6 +108,7 @@ class TestPipeline(unittest.TestCase):
             unittest.mock.ANY # or specific dict if you want to match details
         )
 
+    @patch('news_scrapper.pipeline.pipeline.orjson', None)
     @patch('news_scrapper.pipeline.pipeline.open', new_callable=mock_open)
     @patch('news_scrapper.pipeline.pipeline.json.dump')
     def test_store_result_saves_file_and_adds_to_memory(self, mock_json_dump, mock_file_open):
@@ -88,6 +127,7 @@ class TestPipeline(unittest.TestCase):
         self.assertIn(article_data, self.pipeline.processed_results_in_memory)
         self.assertEqual(self.pipeline.get_processed_item_count_in_memory(), 1)
 
+    @patch('news_scrapper.pipeline.pipeline.orjson', None)
     @patch('news_scrapper.pipeline.pipeline.open', new_callable=mock_open)
     @patch('news_scrapper.pipeline.pipeline.json.dump')
     def test_store_result_memory_limit(self, mock_json_dump, mock_file_open):
@@ -114,6 +154,48 @@ class TestPipeline(unittest.TestCase):
         self.mock_monitor.log_event.assert_any_call("DEBUG", "Max in-memory results reached. Not adding to list.", unittest.mock.ANY)
 
 
+    def test_store_result_orjson_output_matches_json_dump(self):
+        from datetime import datetime, timezone
+        article_data = {"link": "http://example.com/é", "title": "Été", "published_date_utc": datetime(2024, 1, 15, 12, 0, 0, 500, tzinfo=timezone.utc),
+                        "authors": ["Ann"], "meta": {}}
+        filepath = os.path.join(TEST_RESULTS_DIR, self.pipeline._sanitize_filename(article_data['link']) + ".json")
+        self.pipeline.store_result(article_data)
+        with open(filepath, 'rb') as f: written = f.read()
+        with patch('news_scrapper.pipeline.pipeline.orjson', None):
+            self.pipeline.store_result(article_data)
+        with open(filepath, 'rb') as f: self.assertEqual(written, f.read())
+        self.assertEqual(json.loads(written)["published_date_utc"], "2024-01-15T12:00:00.000500+00:00")
+        self.assertNotIn(b"\n", written) # Compact unless pretty_print is set
+        self.pipeline.pretty_print = True
+        self.pipeline.store_result(article_data)
+        with open(filepath, 'rb') as f: written = f.read()
+        with patch('news_scrapper.pipeline.pipeline.orjson', None):
+            self.pipeline.store_result(article_data)
+        with open(filepath, 'rb') as f: self.assertEqual(written, f.read())
+        self.assertIn(b'\n  "title": "\xc3\x89t\xc3\xa9"', written)
+
+    def test_store_result_jsonl_batches_roll_and_count(self):
+        from datetime import datetime, timezone
+        pipeline = Pipeline(monitor_instance=self.mock_monitor, results_output_dir=TEST_RESULTS_DIR,
+                            max_results_in_memory=TEST_MAX_MEMORY_RESULTS, results_format="jsonl", batch_max_items=2)
+        for i in range(3):
+            pipeline.store_result({"link": f"http://example.com/{i}", "title": "Été", "published_date_utc": datetime(2024, 1, 15, tzinfo=timezone.utc)})
+        with patch('news_scrapper.pipeline.pipeline.orjson', None):
+            pipeline.store_result({"link": "http://example.com/3", "title": "Été", "published_date_utc": datetime(2024, 1, 15, tzinfo=timezone.utc)})
+        batch_files = sorted(name for name in os.listdir(TEST_RESULTS_DIR) if name.endswith(".jsonl"))
+        self.assertEqual(len(batch_files), 2) # Rolled after two items
+        self.assertEqual(pipeline.get_processed_item_count_on_disk(), 4) # Counts the still-open batch too
+        pipeline.close()
+        lines = []
+        for name in batch_files:
+            with open(os.path.join(TEST_RESULTS_DIR, name), 'rb') as f: lines.extend(f.read().splitlines())
+        self.assertEqual([json.loads(line)["link"] for line in lines], [f"http://example.com/{i}" for i in range(4)])
+        self.assertEqual(json.loads(lines[0])["published_date_utc"], "2024-01-15T00:00:00+00:00")
+        self.assertEqual(lines[0].split(b'"title"')[1], lines[3].split(b'"title"')[1]) # orjson and json agree
+        self.assertEqual(pipeline.get_processed_item_count_in_memory(), TEST_MAX_MEMORY_RESULTS)
+        with self.assertRaises(ValueError):
+            Pipeline(monitor_instance=self.mock_monitor, results_output_dir=TEST_RESULTS_DIR, results_format="csv")
+
     def test_get_next_item_empty_queue(self):
         self.assertIsNone(self.pipeline.get_next_item())
 